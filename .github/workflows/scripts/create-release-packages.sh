@@ -38,6 +38,14 @@ build_skills_package() {
     exit 1
   fi
   
+  # Copy source command templates (rendered per agent at install time)
+  local extra=()
+  if [[ -d commands ]]; then
+    cp -r commands "$base_dir/commands"
+    extra+=(commands)
+    echo "Copied command templates -> $base_dir/commands"
+  fi
+
   # Copy nightlife.yaml to the package root
   if [[ -f nightlife.yaml ]]; then
     cp nightlife.yaml "$base_dir/nightlife.yaml"
@@ -46,8 +54,8 @@ build_skills_package() {
     echo "Warning: nightlife.yaml not found"
   fi
 
-  # Create the zip file with skills/ and nightlife.yaml at the root
-  ( cd "$base_dir" && zip -r "../phoenix-skills-${NEW_VERSION}.zip" skills nightlife.yaml )
+  # Create the zip file with skills/, commands/ (if any) and nightlife.yaml at the root
+  ( cd "$base_dir" && zip -r "../phoenix-skills-${NEW_VERSION}.zip" skills "${extra[@]}" nightlife.yaml )
   echo "Created $GENRELEASES_DIR/phoenix-skills-${NEW_VERSION}.zip"
 }
 
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Import-time regression check for Phoenix CLI startup.
+
+Runs ``python -X importtime`` in fresh processes, importing phoenix_cli and
+loading the Typer app (what ``phoenix --help`` does), and fails when:
+
+- the fastest run's import time exceeds the budget (150 ms by default), or
+- any network or interactive module (httpx, truststore, readchar,
+  rich.live, rich.progress) was imported along the way.
+
+Only imports made after the interpreter has started are counted, so the
+number does not depend on site-packages or .pth files. On failure the
+slowest top-level imports are listed to point at the culprit.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --budget-ms 120 --runs 10
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_BUDGET_MS = 150.0
+HEAVY_MODULES = ("httpx", "truststore", "readchar", "rich.live", "rich.progress")
+MARKER = "--phoenix-import-start--"
+
+_PROBE = f"""
+import json, sys
+sys.stderr.write({MARKER!r} + "\\n")
+sys.stderr.flush()
+import phoenix_cli
+phoenix_cli.app
+print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))
+"""
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int]]:
+    """Return (module, cumulative microseconds) for each top-level import after the marker."""
+    lines = stderr.splitlines()
+    if MARKER in lines:
+        lines = lines[lines.index(MARKER) + 1:]
+    imports = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # the header line
+        name = parts[2]
+        # Nested imports are indented by two more spaces per level
+        if name.startswith(" ") and not name.startswith("  "):
+            imports.append((name.strip(), int(parts[1])))
+    return imports
+
+
+def measure(python: str) -> dict:
+    """Run one fresh import of phoenix_cli and return its timings and heavy modules."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT / "src"), os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run([python, "-X", "importtime", "-c", _PROBE], capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"import failed:\n{result.stderr.strip()[-2000:]}")
+    imports = parse_importtime(result.stderr)
+    return {
+        "ms": sum(us for _, us in imports) / 1000,
+        "imports": sorted(imports, key=lambda item: item[1], reverse=True),
+        "heavy": json.loads(result.stdout.strip().splitlines()[-1]),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check Phoenix CLI import time against a budget")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Maximum import time in milliseconds (default: {DEFAULT_BUDGET_MS:.0f})")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes to run; the fastest is checked (default: 5)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list on failure (default: 10)")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to measure (default: this one)")
+    args = parser.parse_args(argv)
+
+    # The first run also writes the bytecode cache; it is not counted
+    measure(args.python)
+    runs = [measure(args.python) for _ in range(max(1, args.runs))]
+    best = min(runs, key=lambda run: run["ms"])
+    print(f"import phoenix_cli + app: {best['ms']:.1f} ms (fastest of {len(runs)}, budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if best["ms"] > args.budget_ms:
+        print(f"FAIL: {best['ms'] - args.budget_ms:.1f} ms over budget. Slowest top-level imports:")
+        for name, us in best["imports"][:args.top]:
+            print(f"  {us / 1000:8.1f} ms  {name}")
+        failed = True
+    heavy = sorted({module for run in runs for module in run["heavy"]})
+    if heavy:
+        print(f"FAIL: startup imported {', '.join(heavy)}; import them inside the commands that need them")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
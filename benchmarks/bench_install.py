@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Benchmarks for the Phoenix install hot path.
+
+Generates a synthetic skill pack (configurable number of skills, files per
+skill and file size), packages it like a release asset and measures:
+
+- extract:  download_and_extract_template() from a cached release zip
+- copy:     copy_local_template() from a local template directory
+- upgrade:  backup_agent_folders() followed by a re-install
+- merge:    merge_json_files() on a large settings.json
+
+for 1, 5 and all agents in AGENT_CONFIG. Each scenario runs in a fresh
+process so peak RSS is attributable to it. Results can be saved as a
+baseline and later runs are compared against it.
+
+Usage:
+    python benchmarks/bench_install.py
+    python benchmarks/bench_install.py --skills 50 --files-per-skill 20 --file-size 8192
+    python benchmarks/bench_install.py --save-baseline
+    python benchmarks/bench_install.py --threshold 0.25   # fail on >25% slowdown
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+SCENARIOS = ("extract", "copy", "upgrade", "merge")
+ASSET_NAME = "phoenix-skills-v0.0.0-bench.zip"
+
+
+def make_skill_pack(root: Path, skills: int, files_per_skill: int, file_size: int, seed: int = 0) -> int:
+    """Write a synthetic template tree (skills/ + nightlife.yaml) and return its size in bytes."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + "     \n"
+    total = 0
+    for i in range(skills):
+        skill_dir = root / "skills" / f"bench-skill-{i:03d}"
+        (skill_dir / "references").mkdir(parents=True, exist_ok=True)
+        skill_md = f"---\nname: bench-skill-{i:03d}\ndescription: Synthetic benchmark skill {i}\n---\n\n# Skill {i}\n"
+        (skill_dir / "SKILL.md").write_text(skill_md, encoding="utf-8")
+        total += len(skill_md)
+        for j in range(files_per_skill):
+            content = "".join(rng.choices(alphabet, k=file_size))
+            (skill_dir / "references" / f"file-{j:03d}.md").write_text(content, encoding="utf-8")
+            total += file_size
+    (root / "nightlife.yaml").write_text("agents: []\nskills: []\n", encoding="utf-8")
+    return total
+
+
+def make_release_zip(source: Path, zip_path: Path) -> None:
+    """Package a template tree the way create-release-packages.sh does."""
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(source.rglob("*")):
+            if path.is_file():
+                zf.write(path, path.relative_to(source).as_posix())
+
+
+def make_settings(keys: int) -> dict:
+    """Build a nested settings dict for merge_json_files()."""
+    return {f"section.{i}": {f"key.{j}": {"value": j, "enabled": bool(j % 2)} for j in range(20)} for i in range(keys)}
+
+
+def _peak_rss_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_scenario(scenario: str, agents: list[str], workdir: str, payload_bytes: int) -> dict:
+    """Run one scenario in the current (fresh) process and return its measurements."""
+    from phoenix_cli.templates import (
+        backup_agent_folders,
+        copy_local_template,
+        detect_existing_agents,
+        download_and_extract_template,
+        merge_json_files,
+    )
+
+    work = Path(workdir)
+    project = Path(tempfile.mkdtemp(prefix="project-", dir=work))
+    processed = 0
+
+    def install():
+        # download_and_extract_template() reuses a phoenix-skills-*.zip in the
+        # current directory for non-first agents, so no network is involved
+        os.chdir(work / "release")
+        for agent in agents:
+            download_and_extract_template(project, agent, is_current_dir=True, verbose=False, is_first_agent=False)
+        return payload_bytes * len(agents)
+
+    if scenario == "extract":
+        start = time.perf_counter()
+        processed = install()
+        elapsed = time.perf_counter() - start
+    elif scenario == "copy":
+        start = time.perf_counter()
+        for index, agent in enumerate(agents):
+            copy_local_template(project, work / "source", agent, is_current_dir=True, verbose=False,
+                                is_first_agent=(index == 0))
+        processed = payload_bytes * len(agents)
+        elapsed = time.perf_counter() - start
+    elif scenario == "upgrade":
+        install()
+        for agent in agents:
+            # Make the agent detectable as an existing installation
+            from phoenix_cli.config import AGENT_CONFIG
+            (project / AGENT_CONFIG[agent]["agent_folder"]).mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        existing = detect_existing_agents(project)
+        backup_agent_folders(project, existing, "bench")
+        processed = install()
+        elapsed = time.perf_counter() - start
+    elif scenario == "merge":
+        settings_file = project / "settings.json"
+        existing = make_settings(200)
+        settings_file.write_text(json.dumps(existing), encoding="utf-8")
+        update = make_settings(250)
+        start = time.perf_counter()
+        for _ in agents:
+            merge_json_files(settings_file, update)
+        elapsed = time.perf_counter() - start
+        processed = settings_file.stat().st_size * len(agents)
+    else:
+        raise ValueError(f"Unknown scenario: {scenario}")
+
+    return {
+        "seconds": elapsed,
+        "bytes": processed,
+        "mb_per_s": (processed / (1024 * 1024)) / elapsed if elapsed > 0 else None,
+        "peak_rss": _peak_rss_bytes(),
+    }
+
+
+def _agent_sets(counts: list[int]) -> dict[str, list[str]]:
+    from phoenix_cli.config import AGENT_CONFIG
+
+    all_agents = list(AGENT_CONFIG)
+    return {str(min(n, len(all_agents))): all_agents[:n] for n in counts}
+
+
+def run_benchmarks(args) -> dict:
+    """Run every scenario x agent-count combination and return the results."""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="phoenix-bench-") as tmp:
+        work = Path(tmp)
+        payload = make_skill_pack(work / "source", args.skills, args.files_per_skill, args.file_size)
+        (work / "release").mkdir()
+        make_release_zip(work / "source", work / "release" / ASSET_NAME)
+
+        # A fresh interpreter per run keeps peak RSS per scenario meaningful
+        context = multiprocessing.get_context("spawn")
+        for scenario in args.scenarios:
+            for label, agents in _agent_sets(args.agents).items():
+                key = f"{scenario}/{label}-agents"
+                runs = []
+                for _ in range(args.repeat):
+                    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                        runs.append(pool.submit(run_scenario, scenario, agents, str(work), payload).result())
+                best = min(runs, key=lambda r: r["seconds"])
+                best["peak_rss"] = max((r["peak_rss"] or 0) for r in runs) or None
+                results[key] = best
+                _print_row(key, best)
+
+    return {
+        "params": {
+            "skills": args.skills,
+            "files_per_skill": args.files_per_skill,
+            "file_size": args.file_size,
+            "repeat": args.repeat,
+        },
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "results": results,
+    }
+
+
+def _print_row(key: str, result: dict, note: str = "") -> None:
+    rss = f"{result['peak_rss'] / (1024 * 1024):7.1f} MB" if result.get("peak_rss") else "      n/a"
+    mbps = f"{result['mb_per_s']:8.1f} MB/s" if result.get("mb_per_s") else "         n/a"
+    print(f"{key:<24} {result['seconds'] * 1000:9.1f} ms  {mbps}  peak RSS {rss}  {note}".rstrip())
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return the scenarios that are slower than the baseline by more than threshold."""
+    if baseline.get("params") != report["params"]:
+        print("\nNote: baseline was recorded with different parameters; comparison may be meaningless.")
+    regressions = []
+    print(f"\nComparison against baseline (threshold {threshold:.0%}):")
+    for key, result in report["results"].items():
+        base = baseline.get("results", {}).get(key)
+        if not base:
+            print(f"  {key:<24} (no baseline)")
+            continue
+        change = (result["seconds"] - base["seconds"]) / base["seconds"] if base["seconds"] else 0.0
+        flag = "REGRESSION" if change > threshold else ""
+        print(f"  {key:<24} {base['seconds'] * 1000:9.1f} ms -> {result['seconds'] * 1000:9.1f} ms  {change:+7.1%}  {flag}".rstrip())
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Phoenix install hot path")
+    parser.add_argument("--skills", type=int, default=20, help="Number of synthetic skills (default: 20)")
+    parser.add_argument("--files-per-skill", type=int, default=10, help="Reference files per skill (default: 10)")
+    parser.add_argument("--file-size", type=int, default=4096, help="Size of each reference file in bytes (default: 4096)")
+    parser.add_argument("--agents", type=int, nargs="+", default=[1, 5, 19], help="Agent counts to run (default: 1 5 19)")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS), help="Scenarios to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario; the fastest is reported (default: 3)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results to the baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs. baseline (default: 0.25)")
+    parser.add_argument("--output", type=Path, help="Also write the full report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if compare(report, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
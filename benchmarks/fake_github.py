@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Local GitHub API stand-in for latency, throughput and failure benchmarking.
+
+Implements just enough of GitHub for `phoenix init`:
+
+- GET /repos/{owner}/{repo}/releases/latest   release JSON with one asset
+- GET /repos/{owner}/{repo}/releases/assets/{name}   302 redirect to the CDN path
+- GET /cdn/{name}   the asset, with ETag, If-None-Match and Range support
+
+and injects configurable latency, bandwidth caps, rate-limit headers,
+5xx errors and truncated downloads. Point the CLI at it with
+PHOENIX_GITHUB_API_URL.
+
+Usage:
+    # Serve a synthetic release and leave it running
+    python benchmarks/fake_github.py --port 8765 --latency-ms 80 --bandwidth 2000000
+    PHOENIX_GITHUB_API_URL=http://127.0.0.1:8765 phoenix init demo --ai claude
+
+    # Benchmark: run `phoenix init` N times against the server and report timings
+    python benchmarks/fake_github.py --bench --runs 5 --fail-rate 0.2 --truncate-rate 0.2
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_install import ASSET_NAME, make_release_zip, make_skill_pack  # noqa: E402
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class FakeGitHubState:
+    """Asset bytes, failure-injection settings and request counters shared by all handlers."""
+
+    def __init__(self, asset_path: Path, args):
+        self.asset_name = asset_path.name
+        self.asset = asset_path.read_bytes()
+        self.etag = '"' + hashlib.sha256(self.asset).hexdigest()[:32] + '"'
+        self.tag = args.tag
+        self.latency = args.latency_ms / 1000.0
+        self.bandwidth = args.bandwidth
+        self.fail_rate = args.fail_rate
+        self.fail_first = args.fail_first
+        self.truncate_rate = args.truncate_rate
+        self.rate_limit = args.rate_limit
+        self.rng = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.counters = {"requests": 0, "api": 0, "downloads": 0, "range_requests": 0, "not_modified": 0,
+                         "injected_5xx": 0, "truncated": 0, "rate_limited": 0, "bytes_sent": 0}
+
+    def count(self, key: str, amount: int = 1) -> int:
+        with self.lock:
+            self.counters[key] += amount
+            return self.counters[key]
+
+    def roll(self, rate: float) -> bool:
+        with self.lock:
+            return self.rng.random() < rate
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    server_version = "FakeGitHub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> FakeGitHubState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _rate_limit_headers(self, used: int) -> dict:
+        limit = self.state.rate_limit or 5000
+        return {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Remaining": str(max(limit - used, 0)),
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+
+    def _send(self, status: int, body: bytes = b"", headers: dict | None = None, content_type: str = "application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self._write_throttled(body)
+
+    def _write_throttled(self, data: bytes):
+        """Write data, honoring the bandwidth cap (bytes/second)."""
+        chunk_size = 16384
+        started = time.perf_counter()
+        sent = 0
+        for offset in range(0, len(data), chunk_size):
+            chunk = data[offset:offset + chunk_size]
+            self.wfile.write(chunk)
+            sent += len(chunk)
+            if self.state.bandwidth:
+                ahead = sent / self.state.bandwidth - (time.perf_counter() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+        self.state.count("bytes_sent", sent)
+
+    def do_GET(self):
+        state = self.state
+        requests = state.count("requests")
+        if state.latency:
+            time.sleep(state.latency)
+
+        # Injected failures apply to every endpoint
+        if requests <= state.fail_first or state.roll(state.fail_rate):
+            state.count("injected_5xx")
+            return self._send(503, b'{"message": "Service Unavailable (injected)"}', {"Retry-After": "0"})
+
+        path = self.path.split("?", 1)[0]
+        if re.fullmatch(r"/repos/[^/]+/[^/]+/releases/latest", path):
+            return self._release(requests)
+        match = re.fullmatch(r"/repos/[^/]+/[^/]+/releases/assets/([^/]+)", path)
+        if match:
+            return self._send(302, headers={"Location": f"/cdn/{match.group(1)}"})
+        match = re.fullmatch(r"/cdn/([^/]+)", path)
+        if match and match.group(1) == state.asset_name:
+            return self._asset()
+        return self._send(404, b'{"message": "Not Found"}')
+
+    do_HEAD = do_GET
+
+    def _release(self, requests: int):
+        state = self.state
+        used = state.count("api")
+        headers = self._rate_limit_headers(used)
+        if state.rate_limit and used > state.rate_limit:
+            state.count("rate_limited")
+            return self._send(403, b'{"message": "API rate limit exceeded (injected)"}', headers)
+
+        owner_repo = self.path.split("/releases/", 1)[0]
+        host = self.headers.get("Host", f"127.0.0.1:{self.server.server_port}")
+        release = {
+            "tag_name": state.tag,
+            "published_at": "2026-01-01T00:00:00Z",
+            "assets": [{
+                "name": state.asset_name,
+                "size": len(state.asset),
+                "browser_download_url": f"http://{host}{owner_repo}/releases/assets/{state.asset_name}",
+            }],
+        }
+        self._send(200, json.dumps(release).encode(), headers)
+
+    def _asset(self):
+        state = self.state
+        state.count("downloads")
+        base_headers = {"ETag": state.etag, "Accept-Ranges": "bytes"}
+
+        if self.headers.get("If-None-Match") == state.etag:
+            state.count("not_modified")
+            return self._send(304, headers=base_headers, content_type="application/octet-stream")
+
+        data = state.asset
+        status = 200
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", range_header or "")
+        if match and (if_range is None or if_range == state.etag):
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else len(data) - 1
+            if start >= len(data):
+                return self._send(416, headers={"Content-Range": f"bytes */{len(data)}"})
+            state.count("range_requests")
+            status = 206
+            base_headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+            data = data[start:end + 1]
+
+        if state.roll(state.truncate_rate):
+            # Promise the full body, send part of it and drop the connection
+            state.count("truncated")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in base_headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self._write_throttled(data[:len(data) // 2])
+            self.close_connection = True
+            return
+
+        self._send(status, data, base_headers, content_type="application/octet-stream")
+
+
+def start_server(state: FakeGitHubState, host: str, port: int, verbose: bool = False) -> ThreadingHTTPServer:
+    """Start the fake server in a daemon thread and return it."""
+    server = ThreadingHTTPServer((host, port), FakeGitHubHandler)
+    server.state = state
+    server.verbose = verbose
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_bench(server: ThreadingHTTPServer, args) -> int:
+    """Run `phoenix init` repeatedly against the server and print timings."""
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    env = dict(os.environ, PHOENIX_GITHUB_API_URL=base_url, PYTHONPATH=str(REPO_ROOT / "src"))
+    env.pop("GH_TOKEN", None)
+    env.pop("GITHUB_TOKEN", None)
+    timings = []
+    failures = 0
+    for run in range(args.runs):
+        workdir = Path(tempfile.mkdtemp(prefix="phoenix-fake-init-"))
+        cmd = [sys.executable, "-m", "phoenix_cli", "init", "demo", "--ai", args.ai,
+               "--ignore-agent-tools", "--no-git"]
+        started = time.perf_counter()
+        result = subprocess.run(cmd, cwd=workdir, env=env, capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+        ok = result.returncode == 0
+        failures += 0 if ok else 1
+        timings.append(elapsed)
+        print(f"run {run + 1}/{args.runs}: {elapsed * 1000:8.1f} ms  {'ok' if ok else f'FAILED (exit {result.returncode})'}")
+        if not ok and args.verbose:
+            print(result.stdout[-2000:])
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print()
+    print(f"median {statistics.median(timings) * 1000:.1f} ms, min {min(timings) * 1000:.1f} ms, "
+          f"max {max(timings) * 1000:.1f} ms, failures {failures}/{args.runs}")
+    print("server:", json.dumps(server.state.counters))
+    return 1 if failures else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Local GitHub API stand-in for Phoenix CLI benchmarking")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: random free port)")
+    parser.add_argument("--asset", type=Path, help="Release zip to serve (default: a synthetic skill pack)")
+    parser.add_argument("--tag", default="v0.0.0-fake", help="Release tag to report")
+    parser.add_argument("--skills", type=int, default=20, help="Synthetic pack: number of skills")
+    parser.add_argument("--files-per-skill", type=int, default=10, help="Synthetic pack: files per skill")
+    parser.add_argument("--file-size", type=int, default=4096, help="Synthetic pack: bytes per file")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay before every response")
+    parser.add_argument("--bandwidth", type=int, default=0, help="Cap response throughput in bytes/second (0 = unlimited)")
+    parser.add_argument("--fail-rate", type=float, default=0, help="Probability of a 503 on any request")
+    parser.add_argument("--fail-first", type=int, default=0, help="Answer the first N requests with 503")
+    parser.add_argument("--truncate-rate", type=float, default=0, help="Probability of dropping an asset download halfway")
+    parser.add_argument("--rate-limit", type=int, default=0, help="Answer 403 after N release API calls (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for failure injection")
+    parser.add_argument("--bench", action="store_true", help="Run `phoenix init` against the server and report timings")
+    parser.add_argument("--runs", type=int, default=5, help="Number of init runs in --bench mode")
+    parser.add_argument("--ai", default="claude", help="Agents passed to init --ai in --bench mode")
+    parser.add_argument("--verbose", action="store_true", help="Log requests and failed init output")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="phoenix-fake-github-") as tmp:
+        asset = args.asset
+        if asset is None:
+            make_skill_pack(Path(tmp) / "pack", args.skills, args.files_per_skill, args.file_size)
+            asset = Path(tmp) / ASSET_NAME
+            make_release_zip(Path(tmp) / "pack", asset)
+
+        server = start_server(FakeGitHubState(asset, args), args.host, args.port, verbose=args.verbose)
+        print(f"Fake GitHub API listening on http://{args.host}:{server.server_port} "
+              f"(asset {asset.name}, {asset.stat().st_size:,} bytes)")
+        try:
+            if args.bench:
+                return run_bench(server, args)
+            print(f"Use: PHOENIX_GITHUB_API_URL=http://{args.host}:{server.server_port} phoenix init ...")
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
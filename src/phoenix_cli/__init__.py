@@ -8,6 +8,7 @@
 #     "readchar",
 #     "httpx",
 #     "truststore",
+#     "pyyaml",
 # ]
 # ///
 """
@@ -25,17 +26,12 @@ Or install globally:
     phoenix init --here
 """
 
-# Import UI app which has all the CLI configuration
-from .ui import app
+# Only lightweight configuration is imported eagerly. The Typer app, the
+# commands registered on it and the network stack are loaded on first access
+# so that `import phoenix_cli` and `phoenix --help` do not pay for TLS setup.
+import sys
 
-# Import commands to register them with the app
-# The @app.command() decorators in commands.py register them automatically
-from . import commands as _commands  # noqa: F401 - imported for side effects
-
-# Re-export key items for external use
 from .config import AGENT_CONFIG, BANNER, TAGLINE
-from .github import ssl_context
-from .ui import console, show_banner
 
 __all__ = [
     "app",
@@ -48,9 +44,38 @@ __all__ = [
 ]
 
 
+def _load_app():
+    """Import the Typer app and register its commands."""
+    from .ui import app
+    # The @app.command() decorators in commands.py register them on import
+    from . import commands as _commands  # noqa: F401 - imported for side effects
+
+    return app
+
+
+def __getattr__(name: str):
+    if name == "app":
+        return _load_app()
+    if name in ("console", "show_banner"):
+        from . import ui
+
+        return getattr(ui, name)
+    if name == "ssl_context":
+        from .github import get_ssl_context
+
+        return get_ssl_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main():
     """Main entry point for the CLI."""
-    app()
+    # Hand the command to a running `phoenix serve` daemon when there is one
+    from .daemon import forward
+
+    code = forward(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+    _load_app()()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,404 @@
+"""Programmatic API for Phoenix installs.
+
+These functions do what `phoenix init` and `phoenix init --upgrade` do, but
+without Typer, live rendering, prompts or console output, so one long-lived
+process can drive many installs. They return plain dicts with per-step
+timings and take an injected HTTP client and release cache:
+
+    from phoenix_cli import api
+
+    cache = api.ReleaseCache("/var/cache/phoenix")
+    for repo in repos:
+        result = api.install(repo, ["claude", "copilot"], cache=cache)
+        if not result["ok"]:
+            print(repo, result["error"])
+
+Invalid arguments (unknown agents) raise ValueError; failures while
+installing are reported in the result ("ok": False, "error": ...).
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Tuple
+
+import httpx
+
+from .config import AGENT_CONFIG
+from .sources import ReleaseSource, download_release, resolve_sources
+from .templates import backup_agent_folders, detect_existing_agents, download_and_extract_template, extract_release
+from .ui import StepTracker
+
+__all__ = ["ReleaseCache", "install", "upgrade", "verify"]
+
+
+class ReleaseCache:
+    """Keeps downloaded release zips for reuse across installs.
+
+    The latest release is resolved at most once per ttl seconds for a given
+    list of sources; within that window every install reuses the same zip
+    with no network access. Safe to share between threads.
+    """
+
+    def __init__(self, directory: Path | str | None = None, *, ttl: float = 300.0):
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="phoenix-release-cache-")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}  # source names -> (zip_path, metadata, resolved_at)
+        self._trees = {}  # zip_path -> extracted template root
+
+    def get(self, sources: list[ReleaseSource], *, client: httpx.Client | None = None,
+            debug: bool = False) -> Tuple[Path, dict]:
+        """Return (zip_path, metadata) for the latest release, downloading it if needed."""
+        key = tuple(source.name for source in sources)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[2] < self.ttl and entry[0].is_file():
+                return entry[0], entry[1]
+            if client is None and any(source.remote for source in sources):
+                from .github import get_http_client
+
+                client = get_http_client()
+            zip_path, metadata = download_release(sources, self.directory, client=client, debug=debug)
+            self._entries[key] = (zip_path, metadata, time.monotonic())
+            return zip_path, metadata
+
+    def extracted(self, zip_path: Path) -> Path:
+        """Return the template root of a cached zip, extracting it on first use."""
+        with self._lock:
+            root = self._trees.get(zip_path)
+            if root is None or not root.is_dir():
+                tree = self.directory / f"{zip_path.stem}-tree"
+                if tree.exists():
+                    shutil.rmtree(tree)
+                tree.mkdir()
+                root = extract_release(zip_path, tree)
+                self._trees[zip_path] = root
+            return root
+
+    def clear(self) -> None:
+        """Forget cached releases and delete their zips and extracted trees."""
+        with self._lock:
+            for zip_path, _, _ in self._entries.values():
+                zip_path.unlink(missing_ok=True)
+            for zip_path in self._trees:
+                shutil.rmtree(self.directory / f"{zip_path.stem}-tree", ignore_errors=True)
+            self._entries.clear()
+            self._trees.clear()
+
+
+def _validate_agents(agents: Iterable[str]) -> list[str]:
+    if isinstance(agents, str):
+        agents = [a.strip() for a in agents.split(",")]
+    agents = list(dict.fromkeys(a for a in agents if a))
+    if not agents:
+        raise ValueError("At least one agent is required")
+    unknown = [a for a in agents if a not in AGENT_CONFIG]
+    if unknown:
+        raise ValueError(f"Unknown agent(s): {', '.join(unknown)}. Valid options: {', '.join(AGENT_CONFIG)}")
+    return agents
+
+
+def _step_records(tracker: StepTracker) -> list[dict]:
+    return [
+        {
+            "key": step["key"],
+            "label": step["label"],
+            "status": step["status"],
+            "detail": step["detail"],
+            "parent": step["parent"],
+            "seconds": tracker.duration(step["key"]),
+            "bytes": step["bytes"],
+        }
+        for step in tracker.steps
+    ]
+
+
+def _install_agents(
+    project_path: Path,
+    agents: list[str],
+    tracker: StepTracker,
+    result: dict,
+    *,
+    client: httpx.Client | None,
+    cache: ReleaseCache | None,
+    sources: list[ReleaseSource] | None,
+    github_token: str | None,
+    template_path: Path | str | None,
+    debug: bool
+) -> None:
+    """Fetch the release once (or use local templates) and install every agent."""
+    is_current_dir = project_path.exists()
+
+    if template_path is not None:
+        for index, agent in enumerate(agents):
+            download_and_extract_template(
+                project_path, agent, is_current_dir,
+                verbose=False, tracker=tracker, local_templates=True,
+                template_path=str(template_path), is_first_agent=(index == 0)
+            )
+        result["source"] = f"local:{template_path}"
+        return
+
+    if sources is None:
+        sources = resolve_sources(github_token=github_token)
+
+    with tempfile.TemporaryDirectory(prefix="phoenix-install-") as temp_dir:
+        tracker.add("fetch", "Fetch release")
+        tracker.start("fetch")
+        try:
+            if cache is not None:
+                zip_path, meta = cache.get(sources, client=client, debug=debug)
+            else:
+                if client is None and any(source.remote for source in sources):
+                    from .github import get_http_client
+
+                    client = get_http_client()
+                zip_path, meta = download_release(sources, Path(temp_dir), client=client, debug=debug)
+        except Exception as e:
+            tracker.error("fetch", str(e))
+            raise
+        tracker.complete("fetch", f"release {meta['release']} via {meta['source']}", nbytes=zip_path.stat().st_size)
+        result["release"] = meta["release"]
+        result["source"] = meta["source"]
+
+        for index, agent in enumerate(agents):
+            download_and_extract_template(
+                project_path, agent, is_current_dir or index > 0,
+                verbose=False, tracker=tracker, debug=debug,
+                is_first_agent=(index == 0), release_zip=zip_path
+            )
+
+
+def _new_result(operation: str, project_path: Path, agents: list[str]) -> dict:
+    return {
+        "operation": operation,
+        "project_path": str(project_path),
+        "agents": agents,
+        "ok": False,
+        "error": None,
+        "release": None,
+        "source": None,
+        "backups": {},
+        "git": None,
+        "seconds": None,
+        "steps": [],
+    }
+
+
+def _init_git(project_path: Path, tracker: StepTracker, result: dict, message: str | None = None) -> None:
+    from .system_utils import init_git_repo, is_git_repo
+
+    tracker.add("git", "Initialize git repository")
+    tracker.start("git")
+    if is_git_repo(project_path):
+        tracker.complete("git", "existing repo detected")
+        result["git"] = "existing"
+        return
+    if message:
+        success, error_msg = init_git_repo(project_path, quiet=True, message=message)
+    else:
+        success, error_msg = init_git_repo(project_path, quiet=True)
+    if success:
+        tracker.complete("git", "initialized")
+        result["git"] = "initialized"
+    else:
+        tracker.error("git", error_msg)
+        result["git"] = f"failed: {error_msg}"
+
+
+def install(
+    project_path: Path | str,
+    agents: Iterable[str],
+    *,
+    client: httpx.Client | None = None,
+    cache: ReleaseCache | None = None,
+    sources: list[ReleaseSource] | None = None,
+    github_token: str | None = None,
+    template_path: Path | str | None = None,
+    init_git: bool = False,
+    git_message: str | None = None,
+    debug: bool = False
+) -> dict:
+    """Install Phoenix skills for one or more agents into a project.
+
+    Args:
+        project_path: Project directory; created if missing (and removed again
+            if the install fails)
+        agents: Agent keys from AGENT_CONFIG, as a list or comma-separated string
+        client: httpx.Client for remote sources (default: the shared client)
+        cache: ReleaseCache to reuse the release zip across calls
+        sources: Release sources in priority order (default: PHOENIX_RELEASE_SOURCES or GitHub)
+        github_token: GitHub token for the default GitHub source
+        template_path: Copy from a local template directory instead of a release
+        init_git: Initialize a git repository (with an initial commit) if none exists
+        git_message: Message for that initial commit
+        debug: Include response bodies in network errors
+
+    Returns:
+        Dict with ok, error, release, source, git, seconds and steps (one
+        record per step with status, detail, seconds and bytes)
+    """
+    agents = _validate_agents(agents)
+    project_path = Path(project_path).resolve()
+    result = _new_result("install", project_path, agents)
+    tracker = StepTracker("install")
+    created = not project_path.exists()
+    started = time.perf_counter()
+    try:
+        _install_agents(
+            project_path, agents, tracker, result,
+            client=client, cache=cache, sources=sources, github_token=github_token,
+            template_path=template_path, debug=debug
+        )
+        if init_git:
+            _init_git(project_path, tracker, result, git_message)
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = str(e)
+        if created and project_path.exists():
+            shutil.rmtree(project_path)
+    finally:
+        result["seconds"] = time.perf_counter() - started
+        result["steps"] = _step_records(tracker)
+    return result
+
+
+def upgrade(
+    project_path: Path | str,
+    agents: Iterable[str] | None = None,
+    *,
+    backup: bool = True,
+    client: httpx.Client | None = None,
+    cache: ReleaseCache | None = None,
+    sources: list[ReleaseSource] | None = None,
+    github_token: str | None = None,
+    template_path: Path | str | None = None,
+    debug: bool = False
+) -> dict:
+    """Upgrade an existing Phoenix project to the latest templates.
+
+    Agent root folders are backed up (<folder>.backup.<timestamp>) unless
+    backup is False, then the agents are reinstalled over them. With no
+    agents given, the agents detected in the project are upgraded.
+
+    Returns:
+        The install() result with "backups" mapping each original folder to
+        its backup path
+    """
+    project_path = Path(project_path).resolve()
+    existing = detect_existing_agents(project_path) if project_path.is_dir() else []
+    if agents is None:
+        if not existing:
+            result = _new_result("upgrade", project_path, [])
+            result["error"] = f"No Phoenix agent folders found in {project_path}"
+            result["seconds"] = 0.0
+            return result
+        agents = [key for key, _, _ in existing]
+    agents = _validate_agents(agents)
+
+    result = _new_result("upgrade", project_path, agents)
+    if not project_path.is_dir():
+        result["error"] = f"Project directory not found: {project_path}"
+        result["seconds"] = 0.0
+        return result
+
+    # Only back up the agent roots being replaced
+    roots = {Path(AGENT_CONFIG[agent]["agent_folder"]).parts[0] for agent in agents}
+    existing = [entry for entry in existing if entry[2] in roots]
+
+    tracker = StepTracker("upgrade")
+    started = time.perf_counter()
+    try:
+        if backup and existing:
+            tracker.add("backup", "Backup existing agent folders")
+            tracker.start("backup")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backups = backup_agent_folders(project_path, existing, timestamp, tracker=tracker)
+            result["backups"] = {original: str(path) for original, path in backups.items()}
+            tracker.complete("backup", f"{len(backups)} folder{'s' if len(backups) != 1 else ''} backed up")
+        _install_agents(
+            project_path, agents, tracker, result,
+            client=client, cache=cache, sources=sources, github_token=github_token,
+            template_path=template_path, debug=debug
+        )
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        result["seconds"] = time.perf_counter() - started
+        result["steps"] = _step_records(tracker)
+    return result
+
+
+def _skills_in_zip(release_zip: Path) -> set[str]:
+    import zipfile
+
+    with zipfile.ZipFile(release_zip) as zf:
+        names = zf.namelist()
+    skills = set()
+    for name in names:
+        parts = name.split("/")
+        # skills/<name>/... at the root or under a single wrapper directory
+        for i in range(min(2, len(parts) - 2)):
+            if parts[i] == "skills" and parts[i + 1]:
+                skills.add(parts[i + 1])
+                break
+    return skills
+
+
+def verify(
+    project_path: Path | str,
+    agents: Iterable[str] | None = None,
+    *,
+    release_zip: Path | str | None = None
+) -> dict:
+    """Check that a project has Phoenix skills installed for its agents.
+
+    For each agent, the skills folder must exist and every skill in it must
+    have a SKILL.md. With release_zip, skills present in the release but
+    missing from the project are reported too. With no agents given, the
+    agents detected in the project are checked.
+
+    Returns:
+        Dict with ok, seconds and one entry per agent under "agents"
+        (skills_folder, present, skills, missing_skill_md, missing)
+    """
+    started = time.perf_counter()
+    project_path = Path(project_path).resolve()
+    if agents is None:
+        agents = [key for key, _, _ in detect_existing_agents(project_path)] if project_path.is_dir() else []
+    else:
+        agents = _validate_agents(agents)
+
+    expected = _skills_in_zip(Path(release_zip)) if release_zip else None
+    checks = []
+    for agent in agents:
+        skills_folder = AGENT_CONFIG[agent]["skills_folder"]
+        skills_dir = project_path / skills_folder
+        installed = sorted(p.name for p in skills_dir.iterdir() if p.is_dir()) if skills_dir.is_dir() else []
+        checks.append({
+            "agent": agent,
+            "skills_folder": skills_folder,
+            "present": skills_dir.is_dir(),
+            "skills": len(installed),
+            "missing_skill_md": [name for name in installed if not (skills_dir / name / "SKILL.md").is_file()],
+            "missing": sorted(expected - set(installed)) if expected is not None else [],
+        })
+
+    ok = bool(checks) and all(c["present"] and c["skills"] and not c["missing_skill_md"] and not c["missing"]
+                              for c in checks)
+    return {
+        "operation": "verify",
+        "project_path": str(project_path),
+        "ok": ok,
+        "error": None if checks else f"No Phoenix agent folders found in {project_path}",
+        "agents": checks,
+        "seconds": time.perf_counter() - started,
+    }
@@ -0,0 +1,301 @@
+"""Batch installs across many projects (phoenix init-many, phoenix upgrade --recursive).
+
+The release is resolved, downloaded and extracted once; every project is
+then installed from the extracted tree by a bounded pool of worker threads
+through phoenix_cli.api, so no project pays for the network or for
+decompression.
+
+Manifest format (YAML or JSON)::
+
+    defaults:                 # optional, applied to every project
+      agents: [claude, copilot]
+      git: true
+    sources: [mirror:http://artifacts.lan/phoenix, github]   # optional
+    projects:
+      - path: services/billing          # relative to the manifest
+        agents: claude,gemini
+      - path: services/api
+        upgrade: true                    # back up and reinstall
+      - path: legacy
+        force: true                      # merge into a non-empty directory
+        git:
+          init: true
+          message: Add Phoenix skills
+"""
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple
+
+import httpx
+
+from . import api
+from .config import AGENT_CONFIG
+from .sources import ReleaseSource, download_release
+from .templates import extract_release
+
+DEFAULT_JOBS = min(8, os.cpu_count() or 4)
+
+_PROJECT_KEYS = {"path", "agents", "upgrade", "force", "git"}
+
+# Never descended into while discovering projects (hidden directories are skipped too)
+PRUNE_DIRS = frozenset({
+    "node_modules", "__pycache__", "venv", "env", "site-packages", "dist", "build",
+    "target", "vendor", "bower_components", "Pods", "DerivedData",
+})
+
+
+class ManifestError(ValueError):
+    """Raised when a manifest cannot be read or has invalid entries."""
+
+
+def _parse_agents(value, where: str) -> list[str]:
+    if isinstance(value, str):
+        agents = [a.strip() for a in value.split(",") if a.strip()]
+    elif isinstance(value, list):
+        agents = [str(a).strip() for a in value if str(a).strip()]
+    else:
+        raise ManifestError(f"{where}: 'agents' must be a list or a comma-separated string")
+    if not agents:
+        raise ManifestError(f"{where}: no agents given")
+    unknown = [a for a in agents if a not in AGENT_CONFIG]
+    if unknown:
+        raise ManifestError(f"{where}: unknown agent(s) {', '.join(unknown)}")
+    return agents
+
+
+def _parse_git(value, where: str) -> Tuple[bool, Optional[str]]:
+    if isinstance(value, bool):
+        return value, None
+    if isinstance(value, dict):
+        return bool(value.get("init", True)), value.get("message")
+    raise ManifestError(f"{where}: 'git' must be true/false or a mapping with 'init' and 'message'")
+
+
+def load_manifest(path: Path) -> dict:
+    """Read and validate a manifest.
+
+    Returns:
+        Dict with "sources" (list of source specs, possibly empty) and
+        "projects": one dict per entry with path (resolved against the
+        manifest's directory), agents, upgrade, force, git and git_message
+    """
+    import yaml
+
+    try:
+        data = yaml.safe_load(Path(path).read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError) as e:
+        raise ManifestError(f"Cannot read manifest {path}: {e}") from e
+    if not isinstance(data, dict) or not isinstance(data.get("projects"), list) or not data["projects"]:
+        raise ManifestError(f"{path}: expected a mapping with a non-empty 'projects' list")
+
+    defaults = data.get("defaults") or {}
+    if not isinstance(defaults, dict):
+        raise ManifestError(f"{path}: 'defaults' must be a mapping")
+    # Every project has its own path, so it is not a default
+    unknown_defaults = set(defaults) - (_PROJECT_KEYS - {"path"})
+    if unknown_defaults:
+        raise ManifestError(f"{path}: unknown key(s) in 'defaults': {', '.join(sorted(unknown_defaults))}")
+    sources = data.get("sources") or []
+    if isinstance(sources, str):
+        sources = [s for s in sources.split(",") if s.strip()]
+
+    base = Path(path).resolve().parent
+    projects = []
+    seen = set()
+    for index, raw in enumerate(data["projects"], 1):
+        where = f"{path}: project {index}"
+        if isinstance(raw, str):
+            raw = {"path": raw}
+        if not isinstance(raw, dict) or not raw.get("path"):
+            raise ManifestError(f"{where}: each project needs a 'path'")
+        unknown_keys = set(raw) - _PROJECT_KEYS
+        if unknown_keys:
+            raise ManifestError(f"{where}: unknown key(s) {', '.join(sorted(unknown_keys))}")
+
+        entry = {**defaults, **raw}
+        if "agents" not in entry:
+            raise ManifestError(f"{where}: no agents given (set 'agents' on the project or in 'defaults')")
+        project_path = (base / Path(str(entry["path"])).expanduser()).resolve()
+        if project_path in seen:
+            raise ManifestError(f"{where}: {project_path} is listed more than once")
+        seen.add(project_path)
+
+        git, git_message = _parse_git(entry.get("git", True), where)
+        projects.append({
+            "path": project_path,
+            "agents": _parse_agents(entry["agents"], where),
+            "upgrade": bool(entry.get("upgrade", False)),
+            "force": bool(entry.get("force", False)),
+            "git": git,
+            "git_message": git_message,
+        })
+    return {"sources": sources, "projects": projects}
+
+
+def _installed_agents(path: Path, names: set[str]) -> list[str]:
+    """Agents installed in path: their agent root folder and skills folder both exist.
+
+    names are the directory names in path, used as a cheap pre-filter. The
+    agent root is required too because some skills folders are generic
+    (Jules installs into a top-level skills/).
+    """
+    agents = []
+    for key, config in AGENT_CONFIG.items():
+        root = Path(config["agent_folder"]).parts[0]
+        skills_folder = config["skills_folder"]
+        if root in names and Path(skills_folder).parts[0] in names and (path / skills_folder).is_dir():
+            agents.append(key)
+    return agents
+
+
+def discover_projects(root: Path, *, max_depth: int | None = None,
+                      prune: frozenset[str] = PRUNE_DIRS) -> list[Tuple[Path, list[str]]]:
+    """Find Phoenix projects under root.
+
+    A directory is a Phoenix project when at least one agent from
+    AGENT_CONFIG is installed in it (agent root and skills folder present). The walk uses os.scandir, does not
+    follow symlinks, skips hidden and pruned directories and does not descend
+    into a project once found (so nested checkouts and the agent folders
+    themselves are never scanned).
+
+    Returns:
+        Sorted list of (project_path, installed_agent_keys)
+    """
+    projects = []
+    stack = [(Path(root).resolve(), 0)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            continue
+
+        agents = _installed_agents(path, {e.name for e in entries})
+        if agents:
+            projects.append((path, agents))
+            continue
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for entry in entries:
+            if not entry.name.startswith(".") and entry.name not in prune:
+                stack.append((Path(entry.path), depth + 1))
+
+    return sorted(projects)
+
+
+@contextmanager
+def prepared_release(
+    sources: list[ReleaseSource],
+    *,
+    client: httpx.Client | None,
+    template_path: Path | None = None,
+    debug: bool = False
+) -> Iterator[Tuple[Path, dict]]:
+    """Resolve, download and extract the release once; yield (template_root, metadata).
+
+    With template_path, that local template directory is used as is.
+    """
+    if template_path is not None:
+        yield Path(template_path).resolve(), {"release": "local", "source": f"local:{template_path}"}
+        return
+
+    with tempfile.TemporaryDirectory(prefix="phoenix-batch-") as temp_dir:
+        temp = Path(temp_dir)
+        zip_path, metadata = download_release(sources, temp, client=client, debug=debug)
+        (temp / "release").mkdir()
+        template_root = extract_release(zip_path, temp / "release")
+        zip_path.unlink()
+        yield template_root, metadata
+
+
+def _failed(project: dict, error: str) -> dict:
+    return {
+        "operation": "upgrade" if project["upgrade"] else "install",
+        "project_path": str(project["path"]),
+        "agents": project["agents"],
+        "ok": False,
+        "error": error,
+        "git": None,
+        "seconds": 0.0,
+        "steps": [],
+    }
+
+
+def _run_project(project: dict, template_root: Path, git_available: bool) -> dict:
+    path = project["path"]
+    if project["upgrade"]:
+        return api.upgrade(path, project["agents"], template_path=template_root)
+
+    if path.exists() and any(path.iterdir()) and not project["force"]:
+        return _failed(project, "directory exists and is not empty (set 'upgrade: true' or 'force: true')")
+    return api.install(
+        path, project["agents"], template_path=template_root,
+        init_git=project["git"] and git_available, git_message=project["git_message"]
+    )
+
+
+def run_projects(
+    projects: list[dict],
+    template_root: Path,
+    *,
+    release: dict | None = None,
+    jobs: int = DEFAULT_JOBS,
+    git_available: bool = True,
+    unavailable_agents: dict[str, str] | None = None,
+    on_done: Optional[Callable[[dict], None]] = None
+) -> list[dict]:
+    """Install or upgrade every project from an extracted template tree.
+
+    Args:
+        projects: Entries from load_manifest()
+        template_root: Extracted release (see prepared_release())
+        release: Release metadata from prepared_release(), recorded in each result
+        jobs: Maximum number of projects processed at once
+        git_available: Whether git can be used for git initialization
+        unavailable_agents: Agents whose CLI is missing, mapped to a reason;
+            projects using them fail without being touched
+        on_done: Called with each result as soon as its project finishes
+
+    Returns:
+        One api.install()/api.upgrade() result per project, in manifest
+        order, each with an added "exit_code" (0 on success, 1 on failure)
+        and, for projects discovered inside a git work tree, "repo"
+    """
+    unavailable_agents = unavailable_agents or {}
+    results: list[dict | None] = [None] * len(projects)
+
+    def finish(index: int, result: dict):
+        if release:
+            result["release"] = release["release"]
+            result["source"] = release["source"]
+        if projects[index].get("repo") is not None:
+            result["repo"] = str(projects[index]["repo"])
+        result["exit_code"] = 0 if result["ok"] else 1
+        results[index] = result
+        if on_done:
+            on_done(result)
+
+    pending = []
+    for index, project in enumerate(projects):
+        missing = [agent for agent in project["agents"] if agent in unavailable_agents]
+        if missing:
+            finish(index, _failed(project, "; ".join(unavailable_agents[agent] for agent in missing)))
+        else:
+            pending.append(index)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = {pool.submit(_run_project, projects[i], template_root, git_available): i for i in pending}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # invalid arguments raised by the api
+                result = _failed(projects[index], str(e))
+            finish(index, result)
+
+    return results
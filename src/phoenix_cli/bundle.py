@@ -0,0 +1,219 @@
+"""Offline bundles for air-gapped installs (phoenix bundle export / init --bundle).
+
+A bundle is a single uncompressed (ZIP_STORED) zip containing:
+
+- ``bundle.json``: format version, release metadata, the asset's SHA-256, a
+  per-file manifest of the asset and the agent configuration it was built for
+- ``asset/<release asset name>``: the release zip, byte for byte
+
+Because the asset is stored uncompressed, an installer can memory-map the
+bundle and hand zipfile a window over the asset's bytes; nothing is copied
+or re-downloaded.
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+import zipfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .config import AGENT_CONFIG, ARGS_FORMAT_MAP, EXTENSION_MAP
+
+BUNDLE_FORMAT = "phoenix-bundle"
+BUNDLE_FORMAT_VERSION = 1
+METADATA_NAME = "bundle.json"
+ASSET_PREFIX = "asset/"
+
+# Local file header: signature .. file name length (offset 26), extra field length (offset 28)
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+
+class BundleError(Exception):
+    """Raised when a bundle is missing, malformed or fails verification."""
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(asset_path: Path) -> list[dict]:
+    """Return a per-file manifest (path, size, crc32, sha256) of a release zip."""
+    manifest = []
+    with zipfile.ZipFile(asset_path) as zf:
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            digest = hashlib.sha256()
+            with zf.open(info) as member:
+                for chunk in iter(lambda: member.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            manifest.append({
+                "path": info.filename,
+                "size": info.file_size,
+                "crc32": f"{info.CRC:08x}",
+                "sha256": digest.hexdigest(),
+            })
+    return manifest
+
+
+def export_bundle(asset_path: Path, release_meta: dict, output: Path, *, cli_version: str = "unknown") -> dict:
+    """Write a bundle for a downloaded release asset and return its metadata.
+
+    Args:
+        asset_path: The release zip (phoenix-skills-*.zip)
+        release_meta: Metadata from sources.download_release()
+        output: Bundle file to write
+        cli_version: Version of the CLI that created the bundle
+    """
+    metadata = {
+        "format": BUNDLE_FORMAT,
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "cli_version": cli_version,
+        "release": {
+            "tag": release_meta.get("release"),
+            "filename": asset_path.name,
+            "size": asset_path.stat().st_size,
+            "sha256": _file_sha256(asset_path),
+            "asset_url": release_meta.get("asset_url"),
+        },
+        "manifest": build_manifest(asset_path),
+        "agents": AGENT_CONFIG,
+        "extension_map": EXTENSION_MAP,
+        "args_format_map": ARGS_FORMAT_MAP,
+    }
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_output = output.with_name(output.name + ".tmp")
+    with zipfile.ZipFile(tmp_output, "w", compression=zipfile.ZIP_STORED) as zf:
+        # Metadata first so readers find it without scanning past the asset
+        zf.writestr(METADATA_NAME, json.dumps(metadata, indent=2))
+        zf.write(asset_path, ASSET_PREFIX + asset_path.name)
+    tmp_output.replace(output)
+    return metadata
+
+
+class _MappedSlice:
+    """Read-only, seekable file object over a window of a memory map."""
+
+    def __init__(self, mm: mmap.mmap, start: int, size: int):
+        self._mm = mm
+        self._start = start
+        self._size = size
+        self._pos = 0
+
+    def seekable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 0:
+            pos = offset
+        elif whence == 1:
+            pos = self._pos + offset
+        else:
+            pos = self._size + offset
+        self._pos = max(0, min(pos, self._size))
+        return self._pos
+
+    def read(self, n: int = -1) -> bytes:
+        remaining = self._size - self._pos
+        if n is None or n < 0 or n > remaining:
+            n = remaining
+        begin = self._start + self._pos
+        self._pos += n
+        return self._mm[begin:begin + n]
+
+    def close(self) -> None:
+        pass
+
+
+class Bundle:
+    """An opened, memory-mapped bundle. Use as a context manager."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise BundleError(f"Bundle not found: {self.path}")
+        if self.path.stat().st_size == 0:
+            # mmap cannot map an empty file
+            raise BundleError(f"Not a valid Phoenix bundle: {self.path} (empty bundle)")
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_layout()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_layout(self) -> None:
+        try:
+            with zipfile.ZipFile(_MappedSlice(self._mm, 0, len(self._mm))) as zf:
+                self.metadata = json.loads(zf.read(METADATA_NAME))
+                assets = [i for i in zf.infolist() if i.filename.startswith(ASSET_PREFIX)]
+        except (zipfile.BadZipFile, KeyError, ValueError) as e:
+            raise BundleError(f"Not a valid Phoenix bundle: {self.path} ({e})") from e
+
+        if self.metadata.get("format") != BUNDLE_FORMAT:
+            raise BundleError(f"Not a Phoenix bundle: {self.path}")
+        if self.metadata.get("format_version", 0) > BUNDLE_FORMAT_VERSION:
+            raise BundleError(
+                f"Bundle format version {self.metadata['format_version']} is newer than supported "
+                f"({BUNDLE_FORMAT_VERSION}); upgrade phoenix-cli"
+            )
+        if len(assets) != 1 or assets[0].compress_type != zipfile.ZIP_STORED:
+            raise BundleError(f"Bundle must contain exactly one stored release asset: {self.path}")
+
+        info = assets[0]
+        header = _LOCAL_HEADER.unpack(self._mm[info.header_offset:info.header_offset + _LOCAL_HEADER.size])
+        name_len, extra_len = header[-2], header[-1]
+        self._asset_start = info.header_offset + _LOCAL_HEADER.size + name_len + extra_len
+        self._asset_size = info.file_size
+        self.asset_name = info.filename[len(ASSET_PREFIX):]
+
+    @property
+    def release(self) -> dict:
+        return self.metadata["release"]
+
+    def verify(self) -> None:
+        """Check the asset's SHA-256 against the bundle metadata."""
+        view = memoryview(self._mm)[self._asset_start:self._asset_start + self._asset_size]
+        try:
+            actual = hashlib.sha256(view).hexdigest()
+        finally:
+            view.release()
+        if actual != self.release["sha256"]:
+            raise BundleError(f"Bundle asset checksum mismatch: expected {self.release['sha256']}, got {actual}")
+
+    def asset_file(self) -> _MappedSlice:
+        """Return a file object over the release zip, suitable for zipfile.ZipFile."""
+        return _MappedSlice(self._mm, self._asset_start, self._asset_size)
+
+    def close(self) -> None:
+        mm = getattr(self, "_mm", None)
+        if mm is not None:
+            mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> "Bundle":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_bundle(path: Path | str) -> Bundle:
+    """Open and memory-map a bundle. Raises BundleError if it is invalid."""
+    return Bundle(Path(path))
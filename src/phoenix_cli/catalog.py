@@ -0,0 +1,236 @@
+"""Skill and agent repositories configured in nightlife.yaml (phoenix skills ...).
+
+nightlife.yaml lists repositories under ``skills:`` and ``agents:``; each
+entry has a url (GitHub or Azure DevOps), a branch and the path inside the
+repository whose sub-directories are the installable skills or agents::
+
+    skills:
+      - name: DaNangNightlifeSkill
+        url: https://github.com/DauQuangThanh/danang-nightlife
+        branch: main
+        path: skills
+
+Listings come from the GitHub contents API and the Azure DevOps items API.
+All repositories are listed concurrently on the shared HTTP client, and
+every response is cached with its ETag so repeat listings are conditional
+requests (a 304 from GitHub does not count against the rate limit).
+"""
+
+import base64
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote
+
+import httpx
+
+from .config import GITHUB_API_URL
+from .github import _get_with_retries, _github_auth_headers, _parse_rate_limit_headers
+
+CONFIG_FILE = "nightlife.yaml"
+DEFAULT_JOBS = 8
+KINDS = ("skills", "agents")
+
+_GITHUB_URL_RE = re.compile(r"github\.com/([^/]+)/([^/?#]+)")
+_ADO_URL_RE = re.compile(r"dev\.azure\.com/([^/]+)/([^/]+)/_git/([^/?#]+)")
+
+
+class CatalogError(ValueError):
+    """Raised when nightlife.yaml cannot be read or names an unsupported repository."""
+
+
+def load_config(path: Path | str = CONFIG_FILE) -> dict:
+    """Read nightlife.yaml.
+
+    Returns:
+        Dict with "skills" and "agents": lists of repository dicts with name,
+        url, branch (default "main") and path (default: the section name)
+    """
+    import yaml
+
+    try:
+        data = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError) as e:
+        raise CatalogError(f"Cannot read {path}: {e}") from e
+    if not isinstance(data, dict):
+        raise CatalogError(f"{path}: expected a mapping with 'skills' and/or 'agents'")
+
+    config = {}
+    for kind in KINDS:
+        entries = data.get(kind) or []
+        if not isinstance(entries, list):
+            raise CatalogError(f"{path}: '{kind}' must be a list of repositories")
+        repos = []
+        for entry in entries:
+            if not isinstance(entry, dict) or not entry.get("url"):
+                continue  # the shell scripts skip entries without a url as well
+            repos.append({
+                "name": str(entry.get("name") or ""),
+                "url": str(entry["url"]).strip(),
+                "branch": str(entry.get("branch") or "main"),
+                "path": str(entry.get("path") or kind).strip("/"),
+            })
+        config[kind] = repos
+    return config
+
+
+def parse_repo_url(url: str) -> dict:
+    """Split a GitHub or Azure DevOps repository URL into its parts.
+
+    Returns:
+        {"host": "github", "owner", "repo"} or
+        {"host": "azure", "org", "project", "repo"}
+
+    Raises:
+        CatalogError: For any other URL
+    """
+    match = _GITHUB_URL_RE.search(url)
+    if match:
+        repo = match.group(2)
+        return {"host": "github", "owner": match.group(1), "repo": repo[:-4] if repo.endswith(".git") else repo}
+    match = _ADO_URL_RE.search(url)
+    if match:
+        return {"host": "azure", "org": match.group(1), "project": match.group(2), "repo": match.group(3)}
+    raise CatalogError(f"Unsupported repo URL format: {url} (supported: github.com or dev.azure.com URLs)")
+
+
+def _ado_auth_headers() -> dict:
+    """Return a Basic Authorization header for AZURE_DEVOPS_PAT / ADO_TOKEN, if set."""
+    token = (os.getenv("AZURE_DEVOPS_PAT") or os.getenv("ADO_TOKEN") or "").strip()
+    if not token:
+        return {}
+    return {"Authorization": "Basic " + base64.b64encode(f":{token}".encode()).decode("ascii")}
+
+
+def _listing_request(repo: dict, github_token: str | None = None) -> tuple[str, dict, str]:
+    """Return (api_url, headers, host) for listing a repository's path."""
+    parts = parse_repo_url(repo["url"])
+    if parts["host"] == "github":
+        url = (f"{GITHUB_API_URL}/repos/{parts['owner']}/{parts['repo']}/contents/"
+               f"{quote(repo['path'])}?ref={quote(repo['branch'])}")
+        headers = {"Accept": "application/vnd.github.v3+json", **_github_auth_headers(github_token)}
+    else:
+        url = (f"https://dev.azure.com/{parts['org']}/{parts['project']}/_apis/git/repositories/"
+               f"{parts['repo']}/items?scopePath=/{quote(repo['path'])}&recursionLevel=oneLevel"
+               f"&versionDescriptor.version={quote(repo['branch'])}&api-version=7.0")
+        headers = {"Accept": "application/json", **_ado_auth_headers()}
+    return url, headers, parts["host"]
+
+
+def _listed_names(payload, host: str, path: str) -> list[str]:
+    """Directory names from a listing response, skipping hidden (. or _) entries."""
+    if host == "github":
+        entries = payload if isinstance(payload, list) else []
+        names = [e.get("name", "") for e in entries if e.get("type") == "dir"]
+    else:
+        entries = payload.get("value", []) if isinstance(payload, dict) else []
+        scope = "/" + path.strip("/")
+        names = [
+            e.get("path", "").rstrip("/").rsplit("/", 1)[-1]
+            for e in entries
+            if e.get("isFolder") and e.get("path", "").rstrip("/") != scope
+        ]
+    return [name for name in names if name and not name.startswith((".", "_"))]
+
+
+class ListingCache:
+    """ETag-validated listing cache, stored as one JSON file in the user cache dir."""
+
+    def __init__(self, path: Path | None = None):
+        if path is None:
+            from platformdirs import user_cache_dir
+
+            path = Path(user_cache_dir("phoenix-cli")) / "repo-listings.json"
+        self.path = Path(path)
+        self._dirty = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get(self, url: str) -> dict | None:
+        return self._entries.get(url)
+
+    def put(self, url: str, etag: str, names: list[str]) -> None:
+        self._entries[url] = {"etag": etag, "names": names, "fetched": time.time()}
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.path.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(tmp_file, self.path)
+            self._dirty = False
+        except OSError:
+            pass
+
+
+def list_repository(client: httpx.Client, repo: dict, *, cache: ListingCache | None = None,
+                    github_token: str | None = None) -> dict:
+    """List the skill (or agent) directories of one repository.
+
+    Never raises for per-repository problems; they are reported in "error".
+
+    Returns:
+        The repository dict plus "names" (directory names, in API order),
+        "error" (None on success) and "cached" (True when a 304 reused the
+        cached listing)
+    """
+    result = {**repo, "names": [], "error": None, "cached": False}
+    try:
+        url, headers, host = _listing_request(repo, github_token)
+    except CatalogError as e:
+        result["error"] = str(e)
+        return result
+
+    cached = cache.get(url) if cache else None
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    try:
+        response = _get_with_retries(client, url, headers=headers, timeout=30)
+    except httpx.HTTPError as e:
+        result["error"] = f"{repo['path']} not found or inaccessible ({e})"
+        return result
+
+    if response.status_code == 304 and cached:
+        result["names"] = list(cached["names"])
+        result["cached"] = True
+        return result
+    if response.status_code != 200:
+        reason = f"HTTP {response.status_code}"
+        if host == "github" and _parse_rate_limit_headers(response.headers).get("remaining") == "0":
+            reason += ", rate limit exceeded; set GH_TOKEN or GITHUB_TOKEN"
+        result["error"] = f"{repo['path']} not found or inaccessible ({reason})"
+        return result
+    try:
+        result["names"] = _listed_names(response.json(), host, repo["path"])
+    except ValueError as e:
+        result["error"] = f"Invalid listing response for {repo['path']}: {e}"
+        return result
+
+    if cache and response.headers.get("ETag"):
+        cache.put(url, response.headers["ETag"], result["names"])
+    return result
+
+
+def list_repositories(repos: list[dict], *, client: httpx.Client, jobs: int = DEFAULT_JOBS,
+                      use_cache: bool = True, github_token: str | None = None) -> list[dict]:
+    """List every repository concurrently; results are returned in config order."""
+    if not repos:
+        return []
+    cache = ListingCache() if use_cache else None
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos)))) as pool:
+        results = list(pool.map(
+            lambda repo: list_repository(client, repo, cache=cache, github_token=github_token), repos
+        ))
+    if cache:
+        cache.save()
+    return results
@@ -1,40 +1,82 @@
 """CLI commands for Phoenix CLI."""
 
+import contextlib
 import importlib.metadata
+import json
 import os
 import platform
 import shlex
 import shutil
-import ssl
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
-import httpx
 import typer
-from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
-from .config import AGENT_CONFIG, GITHUB_REPO_NAME, GITHUB_REPO_OWNER
-from .github import _github_auth_headers, ssl_context
-from .system_utils import check_tool, ensure_executable_scripts, init_git_repo, is_git_repo
-from .templates import download_and_extract_template
+from .config import AGENT_CONFIG, GITHUB_API_URL, GITHUB_REPO_NAME, GITHUB_REPO_OWNER
+from .system_utils import (
+    check_tool,
+    ensure_executable_scripts,
+    init_git_repo,
+    is_git_repo,
+    phoenix_paths,
+    probe_tool_versions,
+    resolve_tool,
+)
 from .ui import (
+    LIVE_REFRESH_RATE,
     StepTracker,
     app,
     console,
     multi_select_with_arrows,
     show_banner,
+    use_plain_output,
 )
 
-# Create HTTP client with SSL context
-client = httpx.Client(verify=ssl_context)
+# Network and template modules (httpx, truststore, rich.live) are imported
+# inside the commands that need them so `phoenix --help` stays fast.
 
 # Build valid agent keys from config for help text
 _VALID_AGENTS = sorted(AGENT_CONFIG.keys())
 _VALID_AGENTS_STR = ", ".join(_VALID_AGENTS)
 
+bundle_app = typer.Typer(
+    name="bundle",
+    help="Create offline bundles for air-gapped installs (use with 'phoenix init --bundle')",
+    add_completion=False,
+)
+app.add_typer(bundle_app, name="bundle")
+
+skills_app = typer.Typer(
+    name="skills",
+    help="Browse skills from the repositories configured in nightlife.yaml",
+    add_completion=False,
+)
+app.add_typer(skills_app, name="skills")
+
+
+def _get_cli_version() -> str:
+    """Return the installed CLI version (or the source tree's pyproject version)."""
+    # Get CLI version from package metadata
+    cli_version = "unknown"
+    try:
+        cli_version = importlib.metadata.version("phoenix-cli")
+    except Exception:
+        # Fallback: try reading from pyproject.toml if running from source
+        try:
+            import tomllib
+            pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+            if pyproject_path.exists():
+                with open(pyproject_path, "rb") as f:
+                    data = tomllib.load(f)
+                    cli_version = data.get("project", {}).get("version", "unknown")
+        except Exception:
+            pass
+    return cli_version
+
 
 @app.command()
 def init(
@@ -42,6 +84,8 @@ def init(
     ai_assistant: str = typer.Option(None, "--ai", help=f"AI agent(s) to use. Can be a single agent or comma-separated list (e.g., 'claude,gemini,copilot'). Valid options: {_VALID_AGENTS_STR}. If not specified, an interactive multi-select menu will appear (default: copilot pre-selected)"),
     ignore_agent_tools: bool = typer.Option(False, "--ignore-agent-tools", help="Skip checks for AI agent tools like Claude Code"),
     no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization"),
+    git_scope: str = typer.Option("all", "--git-scope", help="What the initial commit stages: 'all' (git add .) or 'phoenix' (only the paths Phoenix wrote, without scanning the rest of the tree)"),
+    git_commit_existing: bool = typer.Option(False, "--git-commit-existing", help="Commit the paths Phoenix wrote into an existing repository (implies --git-scope phoenix)"),
     here: bool = typer.Option(False, "--here", help="Initialize project in the current directory instead of creating a new one"),
     force: bool = typer.Option(False, "--force", help="Force merge/overwrite when using --here (skip confirmation)"),
     upgrade: bool = typer.Option(False, "--upgrade", help="Upgrade existing Phoenix project by replacing agent folders with latest templates"),
@@ -50,6 +94,11 @@ def init(
     github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
     local_templates: bool = typer.Option(False, "--local-templates", help="Use local templates from repository instead of downloading from GitHub (for development)"),
     template_path: str = typer.Option(None, "--template-path", help="Path to local template directory (defaults to repo root if --local-templates is used)"),
+    bundle: Path = typer.Option(None, "--bundle", help="Install from an offline bundle created by 'phoenix bundle export' (no network access)"),
+    source: list[str] = typer.Option(None, "--source", help="Release source, tried in the order given: 'github', 'github:OWNER/REPO', 'mirror:URL' or 'dir:PATH' (repeatable; default: PHOENIX_RELEASE_SOURCES or github)"),
+    sync: bool = typer.Option(False, "--sync", help="Also install every skill and agent repository in the project's nightlife.yaml (see 'phoenix sync')"),
+    lock_file: Path = typer.Option(None, "--lock", help="Install the release pinned in this phoenix.lock and copy the lock into the project (default: the project's own phoenix.lock, if any)"),
+    trace: Path = typer.Option(None, "--trace", help="Write per-step timings as Chrome trace-event JSON (open in Perfetto or chrome://tracing)"),
 ):
     """
     Initialize a new Phoenix project from the latest template.
@@ -80,6 +129,9 @@ def init(
         phoenix init . --force
         phoenix init --here --force
 
+        # Commit only Phoenix's files into the repository you are in
+        phoenix init --here --force --ai claude --git-commit-existing
+
         # Upgrade existing project (prompts for AI selection)
         phoenix init --upgrade
         phoenix init --upgrade --ai claude
@@ -88,8 +140,34 @@ def init(
         # Use local templates for development
         phoenix init demo --local-templates --ai claude
         phoenix init demo --local-templates --template-path /path/to/vinh-phoenix
+
+        # Install from an offline bundle (air-gapped machines)
+        phoenix init demo --ai claude --bundle phoenix-bundle-v1.0.0.zip
+
+        # Prefer a LAN mirror, fall back to GitHub when it misses
+        phoenix init demo --ai claude --source mirror:http://artifacts.lan/phoenix --source github
+
+        # Also install everything the project's nightlife.yaml lists
+        phoenix init demo --ai claude --sync
+
+        # Install the exact release a team pinned (no release lookup)
+        phoenix init demo --ai claude --lock ../team/phoenix.lock
+
+        # Record per-step timings for comparison across machines
+        phoenix init demo --ai claude --trace init-trace.json
     """
 
+    from rich.live import Live
+
+    from .github import get_http_client
+    from .sources import SourceError, resolve_sources
+    from .templates import (
+        backup_agent_folders,
+        copy_tree,
+        detect_existing_agents,
+        download_and_extract_template,
+    )
+
     show_banner()
 
     # Check for environment variable to use local templates
@@ -106,6 +184,40 @@ def init(
             template_path = env_template_path
             console.print(f"[cyan]Using RAINBOW_TEMPLATE_PATH: {template_path}[/cyan]")
 
+    if bundle and local_templates:
+        console.print("[red]Error:[/red] --bundle cannot be combined with --local-templates")
+        raise typer.Exit(1)
+
+    if bundle and not bundle.is_file():
+        console.print(f"[red]Error:[/red] Bundle not found: {bundle}")
+        raise typer.Exit(1)
+
+    if source and (bundle or local_templates):
+        console.print("[red]Error:[/red] --source cannot be combined with --bundle or --local-templates")
+        raise typer.Exit(1)
+
+    if git_scope not in ("all", "phoenix"):
+        console.print(f"[red]Error:[/red] Invalid --git-scope '{git_scope}' (use 'all' or 'phoenix')")
+        raise typer.Exit(1)
+    if git_commit_existing:
+        git_scope = "phoenix"
+
+    if lock_file and (source or bundle or local_templates):
+        console.print("[red]Error:[/red] --lock cannot be combined with --source, --bundle or --local-templates")
+        raise typer.Exit(1)
+
+    if lock_file and not lock_file.is_file():
+        console.print(f"[red]Error:[/red] Lock file not found: {lock_file}")
+        raise typer.Exit(1)
+
+    release_sources = None
+    if not (bundle or local_templates):
+        try:
+            release_sources = resolve_sources(source, github_token)
+        except SourceError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+
     if project_name == ".":
         here = True
         project_name = None  # Clear project_name to use existing validation logic
@@ -195,6 +307,21 @@ def init(
                     else:
                         raise typer.Exit(1)
 
+    # A phoenix.lock pins the release: no lookup of the latest one, and the
+    # zip comes from the local release store when this machine has it
+    if release_sources is not None and not source:
+        from .lock import LOCK_FILE, LockError, locked_sources, read_lock
+
+        try:
+            lock = read_lock(lock_file or project_path)
+        except LockError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+        pinned = locked_sources(lock, github_token)
+        if pinned:
+            release_sources = pinned
+            console.print(f"[cyan]Using {lock_file or LOCK_FILE}:[/cyan] release {lock['release']['tag']}")
+
     current_dir = Path.cwd()
 
     # Backup setup
@@ -225,23 +352,7 @@ def init(
             raise typer.Exit(1)
 
         # Detect existing agent folders (backup root/parent folder, not subfolders)
-        # Examples: backup .github/ (parent), not .github/agents/ (subfolder)
-        #           backup .claude/ (parent), not .claude/commands/ (subfolder)
-        # Track root folders to avoid duplicates (e.g., .github has both agents/ and prompts/)
-        detected_roots = set()
-        for agent_key, agent_config in AGENT_CONFIG.items():
-            # Extract root/parent folder from the full path
-            # E.g., ".claude" from ".claude/commands/"
-            # E.g., ".github" from ".github/agents/"
-            agent_folder_path = agent_config["agent_folder"]
-            root_folder = Path(agent_folder_path).parts[0]
-            root_folder_path = project_path / root_folder
-            
-            # Only add if root folder exists and hasn't been added yet
-            # This ensures we backup parent directories (.claude/, .github/), not subfolders
-            if root_folder_path.exists() and root_folder not in detected_roots:
-                detected_roots.add(root_folder)
-                existing_agents.append((agent_key, agent_config["name"], root_folder))
+        existing_agents = detect_existing_agents(project_path)
 
         is_upgrade_mode = True
 
@@ -398,47 +509,38 @@ def init(
     for key, label in [
         ("chmod", "Ensure scripts executable"),
         ("cleanup", "Cleanup"),
-        ("git", "Initialize git repository"),
-        ("final", "Finalize")
     ]:
         tracker.add(key, label)
+    if sync:
+        tracker.add("sync", "Sync nightlife.yaml repositories")
+    tracker.add("git", "Initialize git repository")
+    tracker.add("final", "Finalize")
 
     # Track git error message outside Live context so it persists
     git_error_message = None
 
-    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
-        tracker.attach_refresh(lambda: live.update(tracker.render()))
+    # In a terminal the tracker is rendered by Live at a fixed frame rate (it
+    # only rebuilds the tree when a step changed); in CI logs, pipes and
+    # forwarded daemon runs, each status change is printed as one plain line.
+    plain_output = use_plain_output()
+    if plain_output:
+        tracker.attach_log(lambda line: console.print(line, markup=False, highlight=False))
+        progress = contextlib.nullcontext()
+    else:
+        progress = Live(tracker, console=console, refresh_per_second=LIVE_REFRESH_RATE, transient=True)
+
+    with progress:
         try:
-            verify = not skip_tls
-            local_ssl_context = ssl_context if verify else False
-            local_client = httpx.Client(verify=local_ssl_context)
+            # Local templates, bundles and directory sources never touch the
+            # network, so skip TLS/client setup
+            needs_client = release_sources is not None and any(s.remote for s in release_sources)
+            local_client = get_http_client(skip_tls) if needs_client else None
 
             # Perform backup in upgrade mode or merge mode
             if is_upgrade_mode:
                 tracker.start("backup")
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-                # Backup Jules root-level skills folder (special case)
-                jules_skills = project_path / "skills"
-                if jules_skills.exists():
-                    backup_jules_skills = project_path / f"skills.backup.{timestamp}"
-                    shutil.copytree(jules_skills, backup_jules_skills)
-                    backup_paths["skills"] = backup_jules_skills
-
-                # Backup existing agent folders (parent/root folders, not subfolders)
-                # This backs up entire parent directories like .github/, .claude/, .cursor/
-                # NOT just subfolders like .github/agents/ or .claude/commands/
-                for agent_key, agent_name, agent_folder in existing_agents:
-                    source_folder = project_path / agent_folder
-                    if source_folder.exists():
-                        # agent_folder is already the root (e.g., ".github", ".claude")
-                        # Remove trailing slash/backslash for backup name (cross-platform)
-                        folder_name = agent_folder.rstrip('/\\')
-                        backup_folder = project_path / f"{folder_name}.backup.{timestamp}"
-                        # Copy entire parent directory tree
-                        shutil.copytree(source_folder, backup_folder)
-                        backup_paths[agent_folder] = backup_folder
-
+                backup_paths.update(backup_agent_folders(project_path, existing_agents, timestamp, tracker=tracker))
                 backup_count = len(backup_paths)
                 tracker.complete("backup", f"{backup_count} folder{'s' if backup_count != 1 else ''} backed up")
             elif merge_into_existing:
@@ -447,13 +549,15 @@ def init(
 
                 # Backup the entire existing directory
                 backup_folder = project_path.parent / f"{project_path.name}.backup.{timestamp}"
-                shutil.copytree(project_path, backup_folder)
+                _, nbytes = copy_tree(project_path, backup_folder, dirs_exist_ok=False)
+                tracker.add_bytes("backup", nbytes)
                 backup_paths["."] = backup_folder
 
                 tracker.complete("backup", f"backed up to {backup_folder.name}")
 
             # Download and extract templates for each selected AI agent
             # Only copy shared .phoenix folder for the first agent to avoid redundancy
+            downloaded_zips = []
             for idx, selected_ai in enumerate(selected_ais):
                 is_first = (idx == 0)
                 download_and_extract_template(
@@ -461,32 +565,60 @@ def init(
                     verbose=False, tracker=tracker, client=local_client,
                     debug=debug, github_token=github_token,
                     local_templates=local_templates, template_path=template_path,
-                    is_first_agent=is_first
+                    is_first_agent=is_first, bundle_path=str(bundle) if bundle else None,
+                    sources=release_sources, downloaded=downloaded_zips
                 )
 
-            # Cleanup downloaded zip file after all agents have been processed
-            if not local_templates:
-                current_dir = Path.cwd()
-                zip_files = list(current_dir.glob("phoenix-skills-*.zip"))
-                for zip_file in zip_files:
+            # Cleanup the zip this run downloaded, after all agents have been processed
+            # (a dir: source may keep its own release zips in the current directory)
+            if bundle:
+                tracker.skip("cleanup", "offline bundle")
+            elif not local_templates:
+                for zip_file in downloaded_zips:
                     if zip_file.exists():
                         zip_file.unlink()
                         if tracker:
                             tracker.complete("cleanup", "removed archive")
+                if not downloaded_zips and tracker:
+                    tracker.skip("cleanup", "nothing downloaded")
             else:
                 if tracker:
                     tracker.skip("cleanup", "local templates")
 
             ensure_executable_scripts(project_path, tracker=tracker)
 
+            if sync:
+                try:
+                    _sync_project(project_path, selected_ais, tracker=tracker)
+                except ValueError as e:  # CatalogError, LockError: the project itself is fine
+                    tracker.error("sync", str(e))
+
+            if lock_file and lock_file.resolve() != (project_path / LOCK_FILE).resolve():
+                # Keep the project pinned for later upgrades
+                shutil.copyfile(lock_file, project_path / LOCK_FILE)
+
             if not no_git:
                 tracker.start("git")
+                # A scoped commit stages only what Phoenix wrote (no scan of the rest of the tree)
+                scoped_paths = phoenix_paths(project_path, selected_ais) if git_scope == "phoenix" else None
                 if is_git_repo(project_path):
-                    tracker.complete("git", "existing repo detected")
+                    if git_commit_existing and should_init_git:
+                        success, error_msg = init_git_repo(
+                            project_path, quiet=True, message="Add Phoenix agent skills",
+                            paths=scoped_paths, existing=True
+                        )
+                        if success:
+                            tracker.complete("git", "committed Phoenix paths to existing repo")
+                        else:
+                            tracker.error("git", "commit failed")
+                            git_error_message = error_msg
+                    else:
+                        tracker.complete("git", "existing repo detected")
                 elif should_init_git:
-                    success, error_msg = init_git_repo(project_path, quiet=True)
+                    success, error_msg = init_git_repo(project_path, quiet=True, paths=scoped_paths)
                     if success:
-                        tracker.complete("git", "initialized")
+                        tracker.complete("git", "initialized" if scoped_paths is None else
+                                         "initialized, committed Phoenix paths only")
                     else:
                         tracker.error("git", "init failed")
                         git_error_message = error_msg
@@ -512,9 +644,17 @@ def init(
                 shutil.rmtree(project_path)
             raise typer.Exit(1)
         finally:
-            pass
+            if trace:
+                try:
+                    tracker.write_trace(trace)
+                except OSError as e:
+                    console.print(f"[yellow]Warning:[/yellow] Could not write trace file {trace}: {e}")
 
-    console.print(tracker.render())
+    if trace:
+        console.print(f"[cyan]Trace written to:[/cyan] {trace}")
+
+    if not plain_output:
+        console.print(tracker.render())
     console.print("\n[bold green]Project ready.[/bold green]")
 
     # Show backup information
@@ -619,100 +759,1151 @@ def init(
     console.print(enhancements_panel)
 
 
+def _unavailable_agents(agents: set[str]) -> dict[str, str]:
+    """Check each agent's CLI once; return the missing ones mapped to a reason."""
+    unavailable = {}
+    for agent in sorted(agents):
+        agent_config = AGENT_CONFIG[agent]
+        if agent_config["requires_cli"] and not check_tool(agent):
+            unavailable[agent] = f"{agent} not found (install from {agent_config['install_url']})"
+    return unavailable
+
+
+def _print_batch_summary(results: list[dict], title: str, base: Path, seconds: float) -> int:
+    """Print a per-project summary table and return the overall exit code."""
+    from .ui import format_duration
+
+    table = Table(title=title, show_lines=False)
+    table.add_column("Project", style="cyan", overflow="fold")
+    table.add_column("Mode")
+    table.add_column("Agents")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+    table.add_column("Exit", justify="right")
+    for result in results:
+        path = Path(result["project_path"])
+        try:
+            label = str(path.relative_to(base)) or "."
+        except ValueError:
+            label = str(path)
+        status = "[green]ok[/green]" if result["ok"] else f"[red]failed:[/red] {result['error']}"
+        if result["ok"] and (result.get("git") or "").startswith("failed"):
+            status += " [yellow](git init failed)[/yellow]"
+        table.add_row(label, result["operation"], ", ".join(result["agents"]), status,
+                      format_duration(result["seconds"] or 0), str(result["exit_code"]))
+    console.print(table)
+
+    failed = sum(1 for r in results if not r["ok"])
+    summary = f"{len(results) - failed}/{len(results)} succeeded in {format_duration(seconds)}"
+    console.print(f"[{'red' if failed else 'green'}]{summary}[/]")
+    return 1 if failed else 0
+
+
+@app.command("init-many")
+def init_many(
+    manifest: Path = typer.Argument(..., help="YAML (or JSON) manifest listing the projects to initialize"),
+    jobs: int = typer.Option(None, "--jobs", "-j", help="Number of projects processed in parallel (default: min(8, CPUs))"),
+    ignore_agent_tools: bool = typer.Option(False, "--ignore-agent-tools", help="Skip checks for AI agent tools like Claude Code"),
+    no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization for every project"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    source: list[str] = typer.Option(None, "--source", help="Release source, tried in the order given (overrides the manifest's 'sources'; see 'init --source')"),
+    template_path: Path = typer.Option(None, "--template-path", help="Install from a local template directory instead of a release"),
+    json_output: bool = typer.Option(False, "--json", help="Print the per-project results as JSON"),
+):
+    """
+    Initialize many projects from a manifest in one run.
+
+    The release is resolved, downloaded and extracted once, tool checks run
+    once, and the projects are then installed in parallel. Exits with 1 if
+    any project failed.
+
+    Manifest example:
+
+        defaults:
+          agents: [claude, copilot]
+        projects:
+          - path: services/billing
+          - path: services/api
+            agents: claude,gemini
+            upgrade: true
+          - path: legacy
+            force: true
+            git: {init: true, message: "Add Phoenix skills"}
+
+    Examples:
+        phoenix init-many projects.yaml
+        phoenix init-many projects.yaml --jobs 16 --no-git
+        phoenix init-many projects.yaml --source mirror:http://artifacts.lan/phoenix --source github
+    """
+    import time
+
+    from .batch import DEFAULT_JOBS, ManifestError, load_manifest, prepared_release, run_projects
+    from .github import get_http_client
+    from .sources import SourceError, resolve_sources
+
+    try:
+        plan = load_manifest(manifest)
+        release_sources = resolve_sources(source or plan["sources"], github_token)
+    except (ManifestError, SourceError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    projects = plan["projects"]
+
+    if not json_output:
+        show_banner()
+        console.print(f"[cyan]Manifest:[/cyan] {manifest} ({len(projects)} project{'s' if len(projects) != 1 else ''})")
+
+    git_available = not no_git and check_tool("git")
+    unavailable = {} if ignore_agent_tools else _unavailable_agents({a for p in projects for a in p["agents"]})
+    if no_git:
+        for project in projects:
+            project["git"] = False
+
+    started = time.perf_counter()
+    try:
+        client = get_http_client(skip_tls) if any(s.remote for s in release_sources) and template_path is None else None
+        with prepared_release(release_sources, client=client, template_path=template_path, debug=debug) as (root, release):
+            if not json_output:
+                console.print(f"[cyan]Release:[/cyan] {release['release']} via {release['source']}")
+
+            def on_done(result: dict):
+                if not json_output:
+                    mark = "[green]✓[/green]" if result["ok"] else "[red]✗[/red]"
+                    console.print(f"{mark} {result['project_path']}")
+
+            results = run_projects(projects, root, release=release, jobs=jobs or DEFAULT_JOBS,
+                                   git_available=git_available, unavailable_agents=unavailable, on_done=on_done)
+    except (SourceError, OSError) as e:
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        raise typer.Exit(1)
+    elapsed = time.perf_counter() - started
+
+    if json_output:
+        print(json.dumps({"release": release, "seconds": elapsed, "projects": results}, indent=2, default=str))
+        raise typer.Exit(1 if any(not r["ok"] for r in results) else 0)
+
+    console.print()
+    exit_code = _print_batch_summary(results, "Batch Initialization", manifest.resolve().parent, elapsed)
+    raise typer.Exit(exit_code)
+
+
+@app.command("upgrade")
+def upgrade_projects(
+    root: Path = typer.Argument(Path("."), help="Project to upgrade, or the workspace root to search with --recursive"),
+    recursive: bool = typer.Option(False, "--recursive", "-r", help="Find and upgrade every Phoenix project under ROOT"),
+    ai_assistant: str = typer.Option(None, "--ai", help="Only upgrade these agents (comma-separated; default: the agents installed in each project)"),
+    max_depth: int = typer.Option(None, "--max-depth", help="With --recursive, how many directory levels below ROOT to search"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="List the projects that would be upgraded and exit"),
+    jobs: int = typer.Option(None, "--jobs", "-j", help="Number of projects upgraded in parallel (default: min(8, CPUs))"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    source: list[str] = typer.Option(None, "--source", help="Release source, tried in the order given (see 'init --source')"),
+    template_path: Path = typer.Option(None, "--template-path", help="Upgrade from a local template directory instead of a release"),
+    json_output: bool = typer.Option(False, "--json", help="Print the per-project results as JSON"),
+):
+    """
+    Upgrade Phoenix projects to the latest templates without prompting.
+
+    Agent folders are backed up (<folder>.backup.<timestamp>) and the
+    installed agents are reinstalled. With --recursive, ROOT is searched for
+    Phoenix projects (skipping hidden directories, node_modules and similar,
+    and not descending into projects), the release is downloaded and
+    extracted once, and the projects are upgraded in parallel.
+
+    A project with a phoenix.lock is upgraded to its pinned release (see
+    'phoenix lock') unless --source is given; projects sharing a pin share
+    one extracted release.
+
+    Examples:
+        phoenix upgrade
+        phoenix upgrade --recursive ~/work
+        phoenix upgrade --recursive ~/work --dry-run
+        phoenix upgrade -r ~/work --ai claude --jobs 16
+    """
+    import time
+
+    from .batch import DEFAULT_JOBS, discover_projects, prepared_release, run_projects
+    from .github import get_http_client
+    from .lock import LockError, locked_sources, read_lock
+    from .sources import SourceError, resolve_sources
+    from .system_utils import git_work_tree
+
+    root = root.resolve()
+    if not root.is_dir():
+        console.print(f"[red]Error:[/red] Directory not found: {root}")
+        raise typer.Exit(1)
+
+    only = None
+    if ai_assistant:
+        only = [ai.strip() for ai in ai_assistant.split(",") if ai.strip()]
+        invalid = [ai for ai in only if ai not in AGENT_CONFIG]
+        if invalid:
+            console.print(f"[red]Error:[/red] Invalid AI assistant(s): {', '.join(invalid)}")
+            console.print(f"[yellow]Valid options:[/yellow] {', '.join(AGENT_CONFIG.keys())}")
+            raise typer.Exit(1)
+
+    try:
+        release_sources = resolve_sources(source, github_token)
+    except SourceError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    # Without --recursive only ROOT itself is considered
+    found = discover_projects(root, max_depth=max_depth if recursive else 0)
+    discovery_seconds = time.perf_counter() - started
+
+    projects = []
+    for path, agents in found:
+        selected = [a for a in agents if only is None or a in only]
+        if selected:
+            projects.append({"path": path, "agents": selected, "upgrade": True, "force": False,
+                             "git": False, "git_message": None, "repo": git_work_tree(path)})
+
+    if not projects:
+        message = f"No Phoenix projects found {'under' if recursive else 'in'} {root}"
+        if json_output:
+            print(json.dumps({"root": str(root), "projects": [], "error": message}, indent=2))
+        else:
+            console.print(f"[yellow]{message}[/yellow]")
+        raise typer.Exit(1)
+
+    if dry_run:
+        if json_output:
+            print(json.dumps({"root": str(root), "projects": [
+                {"project_path": str(p["path"]), "agents": p["agents"],
+                 "repo": str(p["repo"]) if p["repo"] else None} for p in projects
+            ]}, indent=2))
+        else:
+            for project in projects:
+                repo = f"  git: {project['repo']}" if project["repo"] else "  not in a git repo"
+                console.print(f"{project['path']}  [dim]{', '.join(project['agents'])}{repo}[/dim]")
+            console.print(f"[cyan]{len(projects)} project{'s' if len(projects) != 1 else ''} found in "
+                          f"{discovery_seconds * 1000:.0f} ms[/cyan]")
+        raise typer.Exit(0)
+
+    if not json_output:
+        show_banner()
+        console.print(f"[cyan]Found {len(projects)} project{'s' if len(projects) != 1 else ''} under {root}[/cyan] "
+                      f"[dim]({discovery_seconds * 1000:.0f} ms)[/dim]")
+
+    # Group projects by the release they are pinned to (None: the latest)
+    groups = {}
+    for project in projects:
+        pinned = None
+        if not source and template_path is None:
+            try:
+                lock = read_lock(project["path"])
+            except LockError as e:
+                console.print(f"[red]Error:[/red] {e}")
+                raise typer.Exit(1)
+            pinned = locked_sources(lock, github_token)
+        key = pinned[0].name if pinned else None
+        groups.setdefault(key, (pinned or release_sources, []))[1].append(project)
+
+    results = []
+    releases = []
+    try:
+        for group_sources, group in groups.values():
+            client = get_http_client(skip_tls) if any(s.remote for s in group_sources) and template_path is None else None
+            with prepared_release(group_sources, client=client, template_path=template_path, debug=debug) as (tree, release):
+                releases.append(release)
+                if not json_output:
+                    pinned_note = " (phoenix.lock)" if group_sources is not release_sources else ""
+                    console.print(f"[cyan]Release:[/cyan] {release['release']} via {release['source']}{pinned_note}")
+
+                def on_done(result: dict):
+                    if not json_output:
+                        mark = "[green]✓[/green]" if result["ok"] else "[red]✗[/red]"
+                        console.print(f"{mark} {result['project_path']}")
+
+                results.extend(run_projects(group, tree, release=release, jobs=jobs or DEFAULT_JOBS, on_done=on_done))
+    except (SourceError, OSError) as e:
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        raise typer.Exit(1)
+    elapsed = time.perf_counter() - started
+
+    if json_output:
+        print(json.dumps({"root": str(root), "release": releases[0], "releases": releases, "seconds": elapsed,
+                          "projects": results}, indent=2, default=str))
+        raise typer.Exit(1 if any(not r["ok"] for r in results) else 0)
+
+    console.print()
+    exit_code = _print_batch_summary(results, "Upgrade", root, elapsed)
+    raise typer.Exit(exit_code)
+
+
 @app.command()
-def check():
+def check(
+    versions: bool = typer.Option(False, "--versions", help="Also probe installed tool versions (runs `<tool> --version` in parallel)"),
+    timeout: float = typer.Option(5.0, "--timeout", help="Per-tool timeout in seconds for --versions probes"),
+    json_output: bool = typer.Option(False, "--json", help="Print results as JSON instead of the tool tree"),
+):
     """Check that all required tools are installed."""
+    # Tools to check, in display order: key -> (label, requires_cli)
+    tools = {"git": ("Git version control", True)}
+    for agent_key, agent_config in AGENT_CONFIG.items():
+        tools[agent_key] = (agent_config["name"], agent_config["requires_cli"])
+    # VS Code variants (not in agent config)
+    tools["code"] = ("Visual Studio Code", True)
+    tools["code-insiders"] = ("Visual Studio Code Insiders", True)
+
+    cli_tools = [key for key, (_, requires_cli) in tools.items() if requires_cli]
+    if versions:
+        results = probe_tool_versions(cli_tools, timeout=timeout)
+    else:
+        results = {}
+        for tool in cli_tools:
+            path = resolve_tool(tool)
+            results[tool] = {"found": path is not None, "path": path, "version": None,
+                             "error": None if path else "not found", "cached": False}
+
+    if json_output:
+        report = {}
+        for key, (label, requires_cli) in tools.items():
+            if requires_cli:
+                report[key] = {"name": label, **results[key]}
+            else:
+                report[key] = {"name": label, "found": None, "path": None, "version": None,
+                               "error": None, "cached": False, "ide_based": True}
+        print(json.dumps(report, indent=2))
+        return
+
     show_banner()
     console.print("[bold]Checking for installed tools...[/bold]\n")
 
     tracker = StepTracker("Check Available Tools")
 
-    tracker.add("git", "Git version control")
-    git_ok = check_tool("git", tracker=tracker)
+    for key, (label, requires_cli) in tools.items():
+        tracker.add(key, label)
+        if not requires_cli:
+            # IDE-based agent - skip CLI check and mark as optional
+            tracker.skip(key, "IDE-based, no CLI check")
+            continue
+
+        result = results[key]
+        if not result["found"]:
+            tracker.error(key, "not found")
+        elif not versions:
+            tracker.complete(key, "available")
+        elif result["version"]:
+            tracker.complete(key, f"{result['version']}{' (cached)' if result['cached'] else ''}")
+        else:
+            tracker.complete(key, f"available, version unknown: {result['error']}")
+
+    console.print(tracker.render())
 
-    agent_results = {}
-    for agent_key, agent_config in AGENT_CONFIG.items():
-        agent_name = agent_config["name"]
-        requires_cli = agent_config["requires_cli"]
+    console.print("\n[bold green]Phoenix CLI is ready to use![/bold green]")
 
-        tracker.add(agent_key, agent_name)
+    if not results["git"]["found"]:
+        console.print("[dim]Tip: Install git for repository management[/dim]")
 
-        if requires_cli:
-            agent_results[agent_key] = check_tool(agent_key, tracker=tracker)
+    # Don't count IDE agents as "found"
+    if not any(results[key]["found"] for key in AGENT_CONFIG if key in results):
+        console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
+
+
+@bundle_app.command("export")
+def bundle_export(
+    output: Path = typer.Option(None, "--output", "-o", help="Bundle file to write (default: phoenix-bundle-<release>.zip)"),
+    asset: Path = typer.Option(None, "--asset", help="Use an already downloaded phoenix-skills-*.zip instead of downloading the latest release"),
+    release: str = typer.Option(None, "--release", help="Release tag to record when using --asset (default: taken from the asset file name)"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    source: list[str] = typer.Option(None, "--source", help="Release source, tried in the order given: 'github', 'github:OWNER/REPO', 'mirror:URL' or 'dir:PATH' (repeatable; default: PHOENIX_RELEASE_SOURCES or github)"),
+):
+    """Export the latest release as a single offline bundle.
+
+    The bundle contains the release asset, its metadata, a per-file manifest
+    and the agent configuration. Copy it to air-gapped machines and install with
+    'phoenix init --bundle'.
+
+    Examples:
+        phoenix bundle export
+        phoenix bundle export --output /media/usb/phoenix-bundle.zip
+        phoenix bundle export --asset phoenix-skills-v1.0.0.zip
+        phoenix bundle export --source mirror:http://artifacts.lan/phoenix
+    """
+    import tempfile
+
+    from .bundle import export_bundle
+
+    show_banner()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if asset:
+            if not asset.is_file():
+                console.print(f"[red]Error:[/red] Asset not found: {asset}")
+                raise typer.Exit(1)
+            asset_path = asset
+            tag = release or asset.stem.replace("phoenix-skills-", "")
+            release_meta = {"release": tag, "asset_url": None}
         else:
-            # IDE-based agent - skip CLI check and mark as optional
-            tracker.skip(agent_key, "IDE-based, no CLI check")
-            agent_results[agent_key] = False  # Don't count IDE agents as "found"
+            from .github import get_http_client
+            from .sources import SourceError, download_release, resolve_sources
+
+            try:
+                release_sources = resolve_sources(source, github_token)
+                console.print("[cyan]Fetching latest release information...[/cyan]")
+                client = get_http_client(skip_tls) if any(s.remote for s in release_sources) else None
+                asset_path, release_meta = download_release(
+                    release_sources,
+                    Path(temp_dir),
+                    client=client,
+                    show_progress=True,
+                    debug=debug,
+                )
+            except SourceError as e:
+                console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+                raise typer.Exit(1)
+            console.print(f"[cyan]Downloaded:[/cyan] {release_meta['filename']} "
+                          f"(release {release_meta['release']} via {release_meta['source']})")
 
-    # Check VS Code variants (not in agent config)
-    tracker.add("code", "Visual Studio Code")
-    code_ok = check_tool("code", tracker=tracker)
+        if output is None:
+            output = Path(f"phoenix-bundle-{release_meta['release']}.zip")
 
-    tracker.add("code-insiders", "Visual Studio Code Insiders")
-    code_insiders_ok = check_tool("code-insiders", tracker=tracker)
+        console.print("[cyan]Building manifest and writing bundle...[/cyan]")
+        metadata = export_bundle(asset_path, release_meta, output, cli_version=_get_cli_version())
 
-    console.print(tracker.render())
+    summary = [
+        f"{'Bundle':<10} [green]{output}[/green]",
+        f"{'Release':<10} {metadata['release']['tag']}",
+        f"{'Files':<10} {len(metadata['manifest'])}",
+        f"{'Size':<10} {output.stat().st_size:,} bytes",
+        f"{'SHA-256':<10} [dim]{metadata['release']['sha256']}[/dim]",
+        "",
+        f"Install with: [cyan]phoenix init <project> --ai <agents> --bundle {output.name}[/cyan]",
+    ]
+    console.print(Panel("\n".join(summary), title="[cyan]Bundle Exported[/cyan]", border_style="cyan", padding=(1, 2)))
 
-    console.print("\n[bold green]Phoenix CLI is ready to use![/bold green]")
 
-    if not git_ok:
-        console.print("[dim]Tip: Install git for repository management[/dim]")
+@skills_app.command("list")
+def skills_list(
+    config_file: Path = typer.Option(Path("nightlife.yaml"), "--config", help="Repository configuration file"),
+    jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Maximum number of repositories listed at once"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Do not use or update the ETag listing cache"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    json_output: bool = typer.Option(False, "--json", help="Print the listing as JSON"),
+):
+    """List available skills from the repositories in nightlife.yaml.
 
-    if not any(agent_results.values()):
-        console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
+    All repositories are listed concurrently and listings are revalidated
+    with ETags, so unchanged repositories cost a 304 response.
+
+    Examples:
+        phoenix skills list
+        phoenix skills list --json | jq '.repositories[].skills'
+    """
+    from .catalog import CatalogError, list_repositories, load_config
+    from .github import get_http_client
+
+    if not config_file.is_file():
+        print(f"Error: {config_file} not found in current directory.")
+        print("Create one with 'phoenix init' or manually.")
+        raise typer.Exit(1)
+    try:
+        repos = load_config(config_file)["skills"]
+    except CatalogError as e:
+        print(f"Error: {e}")
+        raise typer.Exit(1)
+
+    results = list_repositories(
+        repos, client=get_http_client(skip_tls), jobs=jobs,
+        use_cache=not no_cache, github_token=github_token
+    )
+    total = sum(len(r["names"]) for r in results)
+
+    if json_output:
+        report = {
+            "config": str(config_file),
+            "repositories": [
+                {key: r[key] for key in ("name", "url", "branch", "path", "error", "cached")} | {"skills": r["names"]}
+                for r in results
+            ],
+            "total": total,
+        }
+        print(json.dumps(report, indent=2))
+        if any(r["error"] for r in results):
+            raise typer.Exit(1)
+        return
+
+    # Same layout as skills/list-skills/scripts/list-skills.sh
+    if not results:
+        print(f"No skill repositories configured in {config_file.name}.")
+        return
+    for r in results:
+        print()
+        if r["name"]:
+            print(f"Repository: {r['name']} ({r['url']}, branch: {r['branch']}, path: {r['path']})")
+        else:
+            print(f"Repository: {r['url']} (branch: {r['branch']}, path: {r['path']})")
+        if r["error"]:
+            print(f"  Error: {r['error']}")
+            continue
+        for name in r["names"]:
+            print(f"  - {name}")
+        print(f"  Total: {len(r['names'])} skills available")
+    print()
+    print(f"Grand total: {total} skills across {len(results)} repositories")
+
+
+@skills_app.command("add")
+def skills_add(
+    repo: str = typer.Argument(..., help="Repository name from nightlife.yaml, or a GitHub/Azure DevOps repository URL"),
+    skills: list[str] = typer.Argument(..., help="Skill names or glob patterns (quote globs, e.g. 'git-*')"),
+    ai_assistant: str = typer.Option(None, "--ai", help="Comma-separated agents to install into (default: every agent whose skills folder exists)"),
+    branch: str = typer.Option(None, "--branch", help="Branch to install from (default: nightlife.yaml entry, or main)"),
+    repo_path: str = typer.Option(None, "--path", help="Folder holding the skills in the repository (default: nightlife.yaml entry, or skills)"),
+    config_file: Path = typer.Option(Path("nightlife.yaml"), "--config", help="Repository configuration file"),
+    force: bool = typer.Option(False, "--force", help="Reinstall skills even when the installed files are unchanged"),
+    jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Maximum number of skill folders copied at once"),
+):
+    """Install skills from a repository with one sparse clone.
+
+    Repositories are kept as blobless mirrors in the user cache dir and
+    refreshed with an incremental fetch, so repeat installs download only
+    what changed. Skills whose installed files already match the
+    repository are skipped. A repository pinned in the project's
+    phoenix.lock is installed at the pinned commit without a fetch.
+
+    Examples:
+        phoenix skills add DaNangNightlifeSkill git-commit pdf
+        phoenix skills add DaNangNightlifeSkill 'code-*' --ai claude,copilot
+        phoenix skills add https://github.com/owner/repo my-skill --branch dev
+    """
+    from .catalog import CatalogError, load_config
+    from .lock import LockError, locked_commit, read_lock
+    from .repos import RepoError, install_skills
+    from .ui import format_bytes
+
+    project_path = Path.cwd()
+
+    configured = []
+    if config_file.is_file():
+        try:
+            configured = load_config(config_file)["skills"]
+        except CatalogError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+    entry = next((r for r in configured if repo in (r["name"], r["url"])), None)
+    if entry is None:
+        # Any git URL works for cloning (add-skills.sh accepts them too)
+        if "://" not in repo and not repo.startswith("git@"):
+            names = ", ".join(r["name"] or r["url"] for r in configured) or f"none in {config_file}"
+            console.print(f"[red]Error:[/red] Unknown repository '{repo}' (configured: {names})")
+            raise typer.Exit(1)
+        entry = {"name": "", "url": repo, "branch": "main", "path": "skills"}
+    entry = {**entry, "branch": branch or entry["branch"], "path": repo_path or entry["path"]}
+
+    if ai_assistant:
+        agents = [a.strip() for a in ai_assistant.split(",") if a.strip()]
+        invalid = [a for a in agents if a not in AGENT_CONFIG]
+        if invalid:
+            console.print(f"[red]Error:[/red] Invalid AI assistant(s): {', '.join(invalid)}. Choose from: {_VALID_AGENTS_STR}")
+            raise typer.Exit(1)
+    else:
+        agents = [key for key, config in AGENT_CONFIG.items() if (project_path / config["skills_folder"]).is_dir()]
+        if not agents:
+            console.print("[red]Error:[/red] No AI IDE skills folders detected. Run [cyan]phoenix init[/cyan] first or pass --ai.")
+            raise typer.Exit(1)
+    folders = list(dict.fromkeys(project_path / AGENT_CONFIG[a]["skills_folder"] for a in agents))
+
+    try:
+        commit = locked_commit(read_lock(project_path), "skills", entry["url"], entry["branch"])
+    except LockError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    pin = f", commit: {commit[:12]} (phoenix.lock)" if commit else ""
+    if entry["name"]:
+        console.print(f"[cyan]Installing from[/cyan] {entry['name']} ({entry['url']}, branch: {entry['branch']}, path: {entry['path']}{pin})")
+    else:
+        console.print(f"[cyan]Installing from[/cyan] {entry['url']} (branch: {entry['branch']}, path: {entry['path']}{pin})")
+    try:
+        outcome = install_skills(entry, skills, folders, force=force, jobs=jobs, commit=commit)
+    except RepoError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if outcome["stale"]:
+        console.print(f"[yellow]Warning:[/yellow] Could not refresh the cached mirror; using its last fetched state.\n[bright_black]{outcome['error']}[/bright_black]")
+    for result in outcome["results"]:
+        target = Path(result["target"]).relative_to(project_path)
+        if result["status"] == "installed":
+            console.print(f"[green]Installed[/green] {result['skill']} -> {target} [bright_black]({result['files']} file{'s' if result['files'] != 1 else ''}, {format_bytes(result['bytes'])})[/bright_black]")
+        elif result["status"] == "unchanged":
+            console.print(f"[bright_black]Unchanged {result['skill']} ({target})[/bright_black]")
+        else:
+            console.print(f"[red]Failed[/red] {result['skill']} -> {target}: {result['error']}")
+    for pattern in outcome["unmatched"]:
+        console.print(f"[yellow]No skill matches '{pattern}' in {entry['path']}[/yellow]")
+
+    installed = sum(1 for r in outcome["results"] if r["status"] == "installed")
+    unchanged = sum(1 for r in outcome["results"] if r["status"] == "unchanged")
+    console.print(f"\n{installed} installed, {unchanged} unchanged across {len(folders)} folder{'s' if len(folders) != 1 else ''}")
+    if outcome["unmatched"] or any(r["status"] == "error" for r in outcome["results"]):
+        raise typer.Exit(1)
+
+
+@skills_app.command("index")
+def skills_index(
+    config_file: Path = typer.Option(Path("nightlife.yaml"), "--config", help="Repository configuration file"),
+    jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Maximum number of repositories indexed at once"),
+    full: bool = typer.Option(False, "--full", help="Re-read every SKILL.md, even in unchanged repositories"),
+):
+    """Build the local skill catalog used by 'phoenix skills search'.
+
+    Records every skill of every repository in nightlife.yaml with its
+    description, path and commit. Repositories whose skills folder did not
+    change since the last run are skipped.
+    """
+    from .catalog import CatalogError, load_config
+    from .search import build_index, index_file
+
+    if not config_file.is_file():
+        console.print(f"[red]Error:[/red] {config_file} not found in current directory.")
+        raise typer.Exit(1)
+    try:
+        repos = load_config(config_file)["skills"]
+    except CatalogError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    index = build_index(repos, jobs=jobs, full=full)
+    seconds = time.perf_counter() - started
+
+    table = Table(title="Skill Catalog", show_header=True, header_style="bold cyan")
+    table.add_column("Repository", style="cyan")
+    table.add_column("Commit")
+    table.add_column("Skills", justify="right")
+    table.add_column("Status")
+    status_styles = {"indexed": "green", "unchanged": "bright_black", "error": "red"}
+    for entry in index["repos"].values():
+        status = entry["status"]
+        detail = f"[{status_styles[status]}]{status}[/{status_styles[status]}]"
+        if entry["error"]:
+            detail += f" [bright_black]({entry['error'].splitlines()[0]})[/bright_black]"
+        table.add_row(entry["name"] or entry["url"], (entry["commit"] or "-")[:12], str(len(entry["skills"])), detail)
+    console.print(table)
+    total = sum(len(entry["skills"]) for entry in index["repos"].values())
+    console.print(f"[bright_black]{total} skills indexed in {seconds:.1f}s -> {index_file()}[/bright_black]")
+    if any(entry["status"] == "error" for entry in index["repos"].values()):
+        raise typer.Exit(1)
+
+
+@skills_app.command("search")
+def skills_search(
+    query: list[str] = typer.Argument(..., help="Words to search for in skill names and descriptions"),
+    limit: int = typer.Option(20, "--limit", "-n", min=1, help="Maximum number of results"),
+    json_output: bool = typer.Option(False, "--json", help="Print the results as JSON"),
+):
+    """Search the local skill catalog (offline; build it with 'phoenix skills index').
+
+    Every word must match the start of a word in the skill's name or
+    description; name matches rank first.
+
+    Examples:
+        phoenix skills search pdf
+        phoenix skills search commit message --json
+    """
+    from .search import load_index, search
+
+    index = load_index()
+    if index is None:
+        console.print("[red]Error:[/red] No skill catalog yet. Run [cyan]phoenix skills index[/cyan] first.")
+        raise typer.Exit(1)
+
+    results = search(index, " ".join(query), limit=limit)
+    if json_output:
+        print(json.dumps(results, indent=2))
+        return
+    if not results:
+        console.print(f"[yellow]No skills match '{' '.join(query)}'[/yellow]")
+        raise typer.Exit(1)
+
+    table = Table(show_header=True, header_style="bold cyan", box=None)
+    table.add_column("Skill", style="cyan", no_wrap=True)
+    table.add_column("Repository", style="bright_black", no_wrap=True)
+    table.add_column("Description")
+    for result in results:
+        table.add_row(result["name"], result["repository"], result["description"])
+    console.print(table)
+    console.print("\n[bright_black]Install with: phoenix skills add <repository> <skill>[/bright_black]")
+
+
+@skills_app.command("cache")
+def skills_cache(
+    prune: bool = typer.Option(False, "--prune", help="Remove least recently used mirrors until the cache fits its size limit"),
+    clear: bool = typer.Option(False, "--clear", help="Remove every mirror that is not in use"),
+):
+    """Show or trim the repository mirror cache used by 'phoenix skills add'."""
+    from .repos import CACHE_MAX_ENV_VAR, _cache_limit, cache_dir, clear_mirrors, list_mirrors, prune_mirrors
+    from .ui import format_bytes
+
+    if clear:
+        console.print(f"Removed {clear_mirrors()} mirror(s) from {cache_dir()}")
+        return
+    if prune:
+        removed = prune_mirrors()
+        console.print(f"Removed {len(removed)} mirror(s) from {cache_dir()}")
+
+    mirrors = list_mirrors()
+    table = Table(title=f"Repository Mirrors ({cache_dir()})", show_header=True, header_style="bold cyan")
+    table.add_column("Mirror", style="cyan")
+    table.add_column("Size", justify="right")
+    table.add_column("Last used", style="bright_black")
+    for mirror in mirrors:
+        last_used = datetime.fromtimestamp(mirror["last_used"]).strftime("%Y-%m-%d %H:%M")
+        table.add_row(mirror["path"].name, format_bytes(mirror["bytes"]), last_used)
+    console.print(table)
+    total = sum(m["bytes"] for m in mirrors)
+    console.print(f"[bright_black]{format_bytes(total)} of {format_bytes(_cache_limit())} ({CACHE_MAX_ENV_VAR})[/bright_black]")
+
+
+def _sync_project(project_path: Path, agents: list[str], *, config_file: Path | None = None,
+                  jobs: int = 8, per_host: int = 4, force: bool = False, tracker=None) -> list[dict]:
+    """Install every repository of a project's nightlife.yaml; see sync.sync_repositories()."""
+    from .catalog import load_config
+    from .lock import read_lock
+    from .sync import sync_repositories
+
+    config = load_config(config_file or project_path / "nightlife.yaml")
+    return sync_repositories(project_path, config, agents, jobs=jobs, per_host=per_host, force=force,
+                             lock=read_lock(project_path), tracker=tracker)
+
+
+@app.command("sync")
+def sync_command(
+    ai_assistant: str = typer.Option(None, "--ai", help="Comma-separated agents to install into (default: every agent whose folder exists in the project)"),
+    config_file: Path = typer.Option(Path("nightlife.yaml"), "--config", help="Repository configuration file"),
+    jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Maximum number of repositories processed at once"),
+    per_host: int = typer.Option(4, "--per-host", min=1, help="Maximum number of concurrent fetches from one host"),
+    force: bool = typer.Option(False, "--force", help="Reinstall skills and agents even when their files are unchanged"),
+    json_output: bool = typer.Option(False, "--json", help="Print the per-repository results as JSON"),
+):
+    """Install every skill and agent repository listed in nightlife.yaml.
+
+    All repositories are fetched concurrently into the cached mirrors used
+    by 'skills add' (at most --per-host fetches per host) and every skill
+    and agent is installed into each selected agent's folders. Unchanged
+    folders are skipped, and repositories pinned in phoenix.lock are
+    installed at their pinned commit.
+
+    Examples:
+        phoenix sync
+        phoenix sync --ai claude,copilot --jobs 16
+        phoenix sync --force
+    """
+    from rich.live import Live
+
+    from .catalog import CatalogError
+    from .lock import LockError
+
+    project_path = Path.cwd()
+    if ai_assistant:
+        agents = [a.strip() for a in ai_assistant.split(",") if a.strip()]
+        invalid = [a for a in agents if a not in AGENT_CONFIG]
+        if invalid:
+            console.print(f"[red]Error:[/red] Invalid AI assistant(s): {', '.join(invalid)}. Choose from: {_VALID_AGENTS_STR}")
+            raise typer.Exit(1)
+    else:
+        agents = [key for key, config in AGENT_CONFIG.items()
+                  if (project_path / config["skills_folder"]).is_dir() or (project_path / config["agent_folder"]).is_dir()]
+        if not agents:
+            console.print("[red]Error:[/red] No AI IDE folders detected. Run [cyan]phoenix init[/cyan] first or pass --ai.")
+            raise typer.Exit(1)
+
+    tracker = StepTracker("Sync Repositories")
+    plain_output = use_plain_output() or json_output
+    if json_output:
+        progress = contextlib.nullcontext()
+    elif plain_output:
+        tracker.attach_log(lambda line: console.print(line, markup=False, highlight=False))
+        progress = contextlib.nullcontext()
+    else:
+        progress = Live(tracker, console=console, refresh_per_second=LIVE_REFRESH_RATE, transient=True)
+
+    started = time.perf_counter()
+    try:
+        with progress:
+            results = _sync_project(project_path, agents, config_file=config_file, jobs=jobs,
+                                    per_host=per_host, force=force, tracker=tracker)
+    except (CatalogError, LockError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    elapsed = time.perf_counter() - started
+    failed = [r for r in results if r["error"] or r["failed"]]
+
+    if json_output:
+        print(json.dumps({"agents": agents, "seconds": elapsed, "repos": results}, indent=2))
+        raise typer.Exit(1 if failed else 0)
+
+    if not plain_output:
+        console.print(tracker.render())
+    for result in failed:
+        console.print(f"[red]Error:[/red] {result['name'] or result['url']}: {result['error'] or ''}")
+        for item in result["failed"]:
+            console.print(f"  [red]Failed[/red] {item['name']} -> {item['target']}: {item['error']}")
+    installed = sum(r["installed"] for r in results)
+    unchanged = sum(r["unchanged"] for r in results)
+    console.print(f"\n{installed} installed, {unchanged} unchanged from {len(results)} "
+                  f"repositor{'ies' if len(results) != 1 else 'y'} in {elapsed:.1f}s")
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command("lock")
+def lock_command(
+    update: bool = typer.Option(False, "--update", help="Re-resolve the latest release and every repository head and rewrite the lock"),
+    config_file: Path = typer.Option(Path("nightlife.yaml"), "--config", help="Repository configuration file whose repositories are pinned"),
+    source: list[str] = typer.Option(None, "--source", help="Release source, tried in the order given (see 'init --source')"),
+    jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Maximum number of concurrent resolutions"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    json_output: bool = typer.Option(False, "--json", help="Print the lock as JSON"),
+):
+    """Show or update phoenix.lock, which pins the release and repository commits.
+
+    With a lock, 'init', 'upgrade' and 'skills add' in this project install
+    the pinned release and commits without looking anything up; the release
+    zip is kept in a local store, so repeat installs are cache hits. The
+    lock is created if the project has none.
+
+    Examples:
+        phoenix lock
+        phoenix lock --update
+        phoenix lock --update --source mirror:http://artifacts.lan/phoenix
+    """
+    from .catalog import CatalogError
+    from .github import get_http_client
+    from .lock import LOCK_FILE, LockError, locked_commit, read_lock, update_lock
+    from .sources import SourceError, resolve_sources
+
+    project_path = Path.cwd()
+    try:
+        lock = read_lock(project_path)
+    except LockError as e:
+        if not update:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+        lock = None
+
+    errors = []
+    if update or lock is None:
+        try:
+            release_sources = resolve_sources(source, github_token)
+            client = get_http_client(skip_tls) if any(s.remote for s in release_sources) else None
+            outcome = update_lock(
+                project_path,
+                config_path=config_file if config_file.is_file() else None,
+                sources=release_sources,
+                client=client,
+                jobs=jobs,
+                debug=debug,
+            )
+        except (SourceError, CatalogError, OSError) as e:
+            console.print(Panel(str(e), title="Lock Error", border_style="red"))
+            raise typer.Exit(1)
+        lock = outcome["lock"]
+        errors = outcome["errors"]
+
+    if json_output:
+        print(json.dumps(lock, indent=2))
+    else:
+        release = lock.get("release") or {}
+        console.print(f"[cyan]{LOCK_FILE}:[/cyan] release {release.get('tag')} "
+                      f"[bright_black]({release.get('filename')}, sha256 {str(release.get('sha256'))[:12]})[/bright_black]")
+        for kind, entries in lock.get("repos", {}).items():
+            for entry in entries:
+                console.print(f"  {kind}: {entry['name'] or entry['url']} [bright_black]{entry['branch']} @ {entry['commit'][:12]}[/bright_black]")
+        for error in errors:
+            pinned = "kept previous pin" if locked_commit(lock, error["kind"], error["url"], error["branch"]) else "not pinned"
+            console.print(f"[yellow]Warning:[/yellow] {error['name'] or error['url']}: {pinned}\n[bright_black]{error['error']}[/bright_black]")
+    if errors:
+        raise typer.Exit(1)
+
+
+@app.command()
+def doctor(
+    network: bool = typer.Option(False, "--network", help="Diagnose connectivity to the GitHub API and release asset host"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    max_seconds: float = typer.Option(10.0, "--max-seconds", help="Stop each throughput measurement after this many seconds"),
+    timeout: float = typer.Option(10.0, "--timeout", help="Connection and request timeout in seconds"),
+    json_output: bool = typer.Option(False, "--json", help="Print the diagnostics as JSON"),
+):
+    """Diagnose why init is slow or hangs (DNS, proxy, TLS, API, asset download).
+
+    Without --network, only the local client configuration is reported
+    (proxy, token, SSL context cost) and no request is made.
+
+    Examples:
+        phoenix doctor
+        phoenix doctor --network
+        phoenix doctor --network --json > network-report.json
+    """
+    from .network import run_local_diagnostics, run_network_diagnostics
+
+    if not json_output:
+        show_banner()
+        console.print("[bold]Running network diagnostics...[/bold]\n" if network
+                      else "[bold]Checking client configuration...[/bold]\n")
+
+    if network:
+        report = run_network_diagnostics(
+            skip_tls=skip_tls,
+            github_token=github_token,
+            max_seconds=max_seconds,
+            timeout=timeout,
+        )
+    else:
+        report = run_local_diagnostics(github_token=github_token)
+
+    if json_output:
+        print(json.dumps(report, indent=2))
+        return
+
+    def fmt_ms(value):
+        return f"{value:,.1f} ms" if value is not None else "[red]failed[/red]"
+
+    table = Table(title="Network Diagnostics", show_header=True, header_style="bold cyan")
+    table.add_column("Target", style="cyan")
+    table.add_column("Measurement")
+    table.add_column("Result", justify="right")
+    table.add_column("Detail", style="bright_black")
+
+    for target_name, target in report["targets"].items():
+        label = "GitHub API" if target_name == "api" else "Release asset"
+        http = target.get("http")
+        if http is None:
+            table.add_row(label, "lookup", "[red]skipped[/red]", target.get("error", ""))
+            continue
+
+        connection = target.get("connection")
+        if connection:
+            host = connection["host"]
+            table.add_row(label, "DNS resolution", fmt_ms(connection["dns_ms"]), f"{host} -> {connection['address'] or connection['error']}")
+            table.add_row(label, "TCP connect", fmt_ms(connection["connect_ms"]), f"port {connection['port']}")
+            for context_name, tls in connection["tls"].items():
+                table.add_row(label, f"TLS handshake ({context_name})", fmt_ms(tls["handshake_ms"]), tls["version"] or tls["error"] or "")
+
+        status = http["status"]
+        detail = http["error"] or f"HTTP {status} from {http['final_url']}"
+        table.add_row(label, "Time to first byte", fmt_ms(http["ttfb_ms"]), detail)
+        if target_name == "asset" or http["throughput_bps"]:
+            throughput = f"{http['throughput_bps'] / (1024 * 1024):,.2f} MB/s" if http["throughput_bps"] else "[red]n/a[/red]"
+            table.add_row(label, "Throughput", throughput, f"{http['bytes']:,} bytes in {http['seconds'] or 0:.2f}s")
+        table.add_section()
+
+    ssl_cost = report["ssl_context"]
+    table.add_row("Local", "SSL context build (truststore)", fmt_ms(ssl_cost["truststore_ms"]), "OS trust store, used by init")
+    table.add_row("Local", "SSL context build (certifi)", fmt_ms(ssl_cost["certifi_ms"]), "bundled CA file")
+
+    console.print(table)
+
+    info_lines = [
+        f"{'API URL':<14} {report['api_url']}",
+        f"{'Authenticated':<14} {'yes' if report['authenticated'] else 'no (60 requests/hour limit)'}",
+    ]
+    if report["proxy"]:
+        for name, value in report["proxy"].items():
+            info_lines.append(f"{name:<14} {value}")
+        info_lines.append("[dim]Requests go through the proxy; DNS/TCP/TLS rows measure the direct route.[/dim]")
+    else:
+        info_lines.append(f"{'Proxy':<14} none")
+    console.print(Panel("\n".join(info_lines), title="Client Configuration", border_style="cyan", padding=(1, 2)))
+    if not network:
+        console.print("[dim]Run [cyan]phoenix doctor --network[/cyan] to probe the GitHub API and release asset host.[/dim]")
+
+
+@app.command("dev")
+def dev_command(
+    ai_assistant: str = typer.Option(None, "--ai", help="Comma-separated agents to update (default: every agent whose skills folder exists in the project)"),
+    template_path: Path = typer.Option(None, "--template-path", help="Local template directory holding skills/ (default: RAINBOW_TEMPLATE_PATH or the repository root)"),
+    watch: bool = typer.Option(False, "--watch", "-w", help="Keep running and push every change as it is saved"),
+    poll: bool = typer.Option(False, "--poll", help="Poll for changes instead of using inotify"),
+    debounce_ms: int = typer.Option(50, "--debounce", min=0, help="Milliseconds the template must be quiet before changes are pushed"),
+):
+    """Push a local template's skills and commands into this project.
+
+    Copies the files of the template's skills/ that differ from each
+    agent's skills folder and re-renders commands/. With --watch, the
+    template is then watched (inotify, or polling where unavailable) and
+    each saved change, delete or rename is pushed to every selected agent
+    within milliseconds; bursts of editor writes are applied once.
+
+    Examples:
+        phoenix dev --watch --template-path ~/src/my-skills
+        phoenix dev -w --ai claude,copilot
+        phoenix dev --watch --poll --debounce 200
+    """
+    from .watch import apply_changes, skills_targets
+    from .watch import watch as watch_template
+
+    project_path = Path.cwd()
+    if template_path is None:
+        env_template_path = os.getenv("RAINBOW_TEMPLATE_PATH")
+        template_path = Path(env_template_path) if env_template_path else Path(__file__).parent.parent.parent
+    template_path = template_path.resolve()
+    if not (template_path / "skills").is_dir():
+        console.print(f"[red]Error:[/red] Skills directory not found: {template_path / 'skills'}")
+        raise typer.Exit(1)
+
+    if ai_assistant:
+        agents = [a.strip() for a in ai_assistant.split(",") if a.strip()]
+        invalid = [a for a in agents if a not in AGENT_CONFIG]
+        if invalid:
+            console.print(f"[red]Error:[/red] Invalid AI assistant(s): {', '.join(invalid)}. Choose from: {_VALID_AGENTS_STR}")
+            raise typer.Exit(1)
+    else:
+        agents = [key for key, config in AGENT_CONFIG.items() if (project_path / config["skills_folder"]).is_dir()]
+        if not agents:
+            console.print("[red]Error:[/red] No AI IDE folders detected. Run [cyan]phoenix init[/cyan] first or pass --ai.")
+            raise typer.Exit(1)
+
+    def report(result: dict) -> None:
+        if result["error"]:
+            console.print(f"[red]✗[/red] {', '.join(result['paths'][:3])}: {result['error']} [dim](still watching)[/dim]")
+            return
+        parts = [f"{result['copied']} copied", f"{result['removed']} removed"]
+        if result["commands"] is not None:
+            parts.append(f"{result['commands']['written']} commands rendered")
+        changed = ", ".join(result["paths"][:3]) + (f" (+{len(result['paths']) - 3})" if len(result["paths"]) > 3 else "")
+        console.print(f"[green]✓[/green] {changed}: {', '.join(parts)} [dim]{result['seconds'] * 1000:.0f} ms[/dim]")
+
+    targets = ", ".join(str(t.relative_to(project_path)) for t in skills_targets(project_path, agents))
+    started = time.perf_counter()
+    result = apply_changes(template_path, project_path, agents, {"skills", "commands"})
+    result["seconds"] = time.perf_counter() - started
+    console.print(f"[cyan]Template:[/cyan] {template_path}")
+    console.print(f"[cyan]Skills folders:[/cyan] {targets}")
+    report(result)
+    if not watch:
+        return
+
+    console.print(f"[cyan]Watching for changes{' (polling)' if poll else ''}... press Ctrl+C to stop[/cyan]")
+    try:
+        watch_template(template_path, project_path, agents, debounce=debounce_ms / 1000, poll=poll, on_sync=report)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped watching[/yellow]")
+
+
+@app.command()
+def serve(
+    socket_file: Path = typer.Option(None, "--socket", help="Unix socket to listen on (default: PHOENIX_DAEMON_SOCKET or the user runtime directory)"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    release_ttl: float = typer.Option(600.0, "--release-ttl", help="Seconds a resolved release is reused before checking for a newer one"),
+    idle_timeout: float = typer.Option(0, "--idle-timeout", help="Stop after this many idle seconds (0: never)"),
+    prefetch: bool = typer.Option(False, "--prefetch", help="Download and extract the latest release before accepting requests"),
+    status: bool = typer.Option(False, "--status", help="Report whether a daemon is running and exit"),
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon and exit"),
+):
+    """Run a warm background daemon that serves phoenix commands.
+
+    While it runs, non-interactive phoenix invocations (stdin not a terminal,
+    or PHOENIX_DAEMON=1) are forwarded to it and skip interpreter start-up,
+    imports, TLS setup and, within --release-ttl, the release download.
+    Set PHOENIX_DAEMON=0 to run a command in-process.
+
+    Examples:
+        phoenix serve --prefetch &
+        phoenix serve --status
+        phoenix serve --stop
+    """
+    import socket
+
+    from . import daemon
+
+    if not hasattr(socket, "AF_UNIX"):
+        console.print("[red]Error:[/red] phoenix serve needs Unix domain sockets, which this platform does not provide")
+        raise typer.Exit(1)
+
+    path = str(socket_file) if socket_file else daemon.socket_path()
+
+    if status or stop:
+        reply = daemon.control(path, "stop" if stop else "status")
+        if reply is None:
+            console.print(f"[yellow]No daemon is listening on {path}[/yellow]")
+            raise typer.Exit(1)
+        if stop:
+            console.print(f"[green]Stopped daemon on {path}[/green]")
+        else:
+            console.print(f"[green]Daemon running[/green] (pid {reply.get('pid')}) on {path}")
+        return
+
+    if daemon.control(path, "status") is not None:
+        console.print(f"[red]Error:[/red] a daemon is already listening on {path}")
+        raise typer.Exit(1)
+
+    console.print(f"[cyan]Serving phoenix commands on[/cyan] {path}")
+    if path != daemon.socket_path():
+        console.print(f"[dim]Clients need {daemon.SOCKET_ENV_VAR}={path}[/dim]")
+    try:
+        daemon.serve(
+            path,
+            skip_tls=skip_tls,
+            release_ttl=release_ttl,
+            idle_timeout=idle_timeout,
+            prefetch=prefetch,
+            log=lambda message: console.print(f"[dim]{message}[/dim]"),
+        )
+    except KeyboardInterrupt:
+        pass
+    console.print("[dim]Daemon stopped[/dim]")
 
 
 @app.command()
-def version():
+def version(
+    offline: bool = typer.Option(False, "--offline", help="Skip the network lookup of the latest template release"),
+):
     """Display version and system information."""
 
     show_banner()
 
-    # Get CLI version from package metadata
-    cli_version = "unknown"
-    try:
-        cli_version = importlib.metadata.version("phoenix-cli")
-    except Exception:
-        # Fallback: try reading from pyproject.toml if running from source
-        try:
-            import tomllib
-            pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-            if pyproject_path.exists():
-                with open(pyproject_path, "rb") as f:
-                    data = tomllib.load(f)
-                    cli_version = data.get("project", {}).get("version", "unknown")
-        except Exception:
-            pass
+    cli_version = _get_cli_version()
 
     # Fetch latest template release version
-    api_url = f"https://api.github.com/repos/{GITHUB_REPO_OWNER}/{GITHUB_REPO_NAME}/releases/latest"
+    api_url = f"{GITHUB_API_URL}/repos/{GITHUB_REPO_OWNER}/{GITHUB_REPO_NAME}/releases/latest"
 
     template_version = "unknown"
     release_date = "unknown"
 
-    try:
-        response = client.get(
-            api_url,
-            timeout=10,
-            follow_redirects=True,
-            headers=_github_auth_headers(),
-        )
-        if response.status_code == 200:
-            release_data = response.json()
-            template_version = release_data.get("tag_name", "unknown")
-            # Remove 'v' prefix if present
-            if template_version.startswith("v"):
-                template_version = template_version[1:]
-            release_date = release_data.get("published_at", "unknown")
-            if release_date != "unknown":
-                # Format the date nicely
-                try:
-                    dt = datetime.fromisoformat(release_date.replace('Z', '+00:00'))
-                    release_date = dt.strftime("%Y-%m-%d")
-                except Exception:
-                    pass
-    except Exception:
-        pass
+    if offline:
+        template_version = "skipped (--offline)"
+        release_date = "skipped (--offline)"
+    else:
+        try:
+            from .github import _github_auth_headers, get_http_client
+
+            response = get_http_client().get(
+                api_url,
+                timeout=10,
+                follow_redirects=True,
+                headers=_github_auth_headers(),
+            )
+            if response.status_code == 200:
+                release_data = response.json()
+                template_version = release_data.get("tag_name", "unknown")
+                # Remove 'v' prefix if present
+                if template_version.startswith("v"):
+                    template_version = template_version[1:]
+                release_date = release_data.get("published_at", "unknown")
+                if release_date != "unknown":
+                    # Format the date nicely
+                    try:
+                        dt = datetime.fromisoformat(release_date.replace('Z', '+00:00'))
+                        release_date = dt.strftime("%Y-%m-%d")
+                    except Exception:
+                        pass
+        except Exception:
+            pass
 
     info_table = Table(show_header=False, box=None, padding=(0, 2))
     info_table.add_column("Key", style="cyan", justify="right")
@@ -1,5 +1,6 @@
 """Configuration constants and agent definitions for Phoenix CLI."""
 
+import os
 from pathlib import Path
 
 # Agent configuration with name, agent_folder, skills_folder, install URL, and CLI tool requirement
@@ -191,6 +192,30 @@ ARGS_FORMAT_MAP = {
     "antigravity": "$ARGUMENTS",
 }
 
+# Folder that repository agents (nightlife.yaml "agents:") are installed into,
+# matching the add-agents skill
+AGENTS_FOLDER_MAP = {
+    "claude": ".claude/agents/",
+    "gemini": ".gemini/agents/",
+    "copilot": ".github/agents/",
+    "cursor-agent": ".cursor/agents/",
+    "qwen": ".qwen/agents/",
+    "opencode": ".opencode/agents/",
+    "codex": ".codex/agents/",
+    "windsurf": ".windsurf/agents/",
+    "kilocode": ".kilocode/agents/",
+    "auggie": ".augment/agents/",
+    "roo": ".roo/agents/",
+    "codebuddy": ".codebuddy/agents/",
+    "amp": ".amp/agents/",
+    "shai": ".shai/agents/",
+    "q": ".amazonq/cli-agents/",
+    "bob": ".bob/agents/",
+    "jules": ".agent/workflows/",
+    "qoder": ".qoder/agents/",
+    "antigravity": ".agent/workflows/",
+}
+
 BANNER = """
 ╦  ╦ ╦ ╔╗╔ ╦ ╦   ╔═╗ ╦ ╦ ╔═╗ ╔═╗ ╔╗╔ ╦ ╲ ╱
 ╚╗╔╝ ║ ║║║ ╠═╣   ╠═╝ ╠═╣ ║ ║ ║╣  ║║║ ║  ╳
@@ -202,3 +227,7 @@ TAGLINE = "Vinh Phoenix - Drive Quality Together with Reusable Agent Skills"
 # GitHub repository information
 GITHUB_REPO_OWNER = "dauquangthanh"
 GITHUB_REPO_NAME = "vinh-phoenix"
+
+# GitHub API base URL. Override with PHOENIX_GITHUB_API_URL to point at a
+# GitHub Enterprise instance or a local stand-in server (benchmarks/fake_github.py)
+GITHUB_API_URL = os.environ.get("PHOENIX_GITHUB_API_URL", "https://api.github.com").rstrip("/")
@@ -0,0 +1,292 @@
+"""Warm daemon for Phoenix CLI (phoenix serve).
+
+`phoenix serve` keeps one process alive on a Unix socket with everything a
+cold `phoenix` run pays for already loaded: imported modules, the TLS
+context and HTTP connection pool, the PATH tool index, and a release cache
+holding the resolved release, its zip and the extracted template tree.
+
+The `phoenix` entry point calls forward() first. If a daemon is listening
+(and stdin is not a terminal, or PHOENIX_DAEMON=1), the command line, working
+directory and environment are sent to it and its output is streamed back;
+otherwise, or if the daemon declines, the command runs in-process as usual.
+Set PHOENIX_DAEMON=0 to never forward.
+
+Wire protocol: the client sends one JSON line (argv, cwd, env, package); the
+daemon answers with JSON lines {"out": text} ... and a final {"exit": code}
+or {"fallback": reason}.
+
+This module is imported on every start, so the client side only needs the
+standard library and platformdirs.
+"""
+
+import json
+import os
+import socket
+import sys
+
+SOCKET_ENV_VAR = "PHOENIX_DAEMON_SOCKET"
+DAEMON_ENV_VAR = "PHOENIX_DAEMON"
+CONNECT_TIMEOUT = 0.2
+
+# Commands that must run in the calling process
+_LOCAL_COMMANDS = {"serve"}
+
+
+def socket_path() -> str:
+    """Return the daemon socket path (PHOENIX_DAEMON_SOCKET or the user runtime dir)."""
+    path = os.environ.get(SOCKET_ENV_VAR)
+    if path:
+        return path
+    import warnings
+
+    from platformdirs import user_runtime_dir
+
+    with warnings.catch_warnings():
+        # platformdirs warns when XDG_RUNTIME_DIR is unset and falls back to /tmp
+        warnings.simplefilter("ignore")
+        return os.path.join(user_runtime_dir("phoenix-cli"), "phoenix.sock")
+
+
+def _package_dir() -> str:
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def _send(sock: socket.socket, message: dict) -> None:
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run argv on a running daemon and return its exit code, or None to run in-process."""
+    mode = os.environ.get(DAEMON_ENV_VAR, "")
+    if mode == "0" or not hasattr(socket, "AF_UNIX"):
+        return None
+    if mode != "1" and sys.stdin is not None and sys.stdin.isatty():
+        # Interactive sessions may prompt; those run in-process
+        return None
+    if any(arg in _LOCAL_COMMANDS for arg in argv if not arg.startswith("-")) or "--profile" in argv:
+        return None
+
+    path = socket_path()
+    if not os.path.exists(path):
+        return None
+
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(path)
+    except OSError:
+        return None
+
+    try:
+        sock.settimeout(None)
+        env = dict(os.environ)
+        if "COLUMNS" not in env:
+            # Let the daemon's console wrap output at this terminal's width
+            try:
+                env["COLUMNS"] = str(os.get_terminal_size(sys.stdout.fileno()).columns)
+            except (OSError, ValueError):
+                pass
+        _send(sock, {"argv": argv, "cwd": os.getcwd(), "env": env, "package": _package_dir()})
+        with sock.makefile("r", encoding="utf-8") as replies:
+            for line in replies:
+                message = json.loads(line)
+                if "out" in message:
+                    sys.stdout.write(message["out"])
+                    sys.stdout.flush()
+                elif "exit" in message:
+                    return message["exit"]
+                elif "fallback" in message:
+                    return None
+    except (OSError, ValueError):
+        # The daemon went away mid-request; output may be partial, so fail loudly
+        sys.stderr.write("phoenix: lost connection to the daemon (phoenix serve)\n")
+        return 1
+    finally:
+        sock.close()
+    return 1
+
+
+# ---------------------------------------------------------------------------
+# Server side
+# ---------------------------------------------------------------------------
+
+class _SocketWriter:
+    """File-like object that streams writes to the client as {"out": ...} frames."""
+
+    encoding = "utf-8"
+    errors = "replace"
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+
+    def write(self, text: str) -> int:
+        if text:
+            _send(self._sock, {"out": text})
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+    def fileno(self) -> int:
+        raise OSError("not a real file")
+
+
+def _run_request(request: dict, sock: socket.socket, app) -> dict:
+    """Run one forwarded command in this process and return the final frame."""
+    import contextlib
+    import io
+
+    from .system_utils import clear_git_cache
+
+    env = request.get("env") or {}
+    # Settings read once at import time cannot follow a different client environment
+    for name in ("PHOENIX_GITHUB_API_URL",):
+        if env.get(name) != os.environ.get(name):
+            return {"fallback": f"{name} differs from the daemon's"}
+
+    saved_env = dict(os.environ)
+    saved_cwd = os.getcwd()
+    saved_argv = sys.argv
+    writer = _SocketWriter(sock)
+    # git_work_tree() caches per run; repositories may have been created or
+    # removed outside phoenix since the previous request
+    clear_git_cache()
+    try:
+        os.environ.clear()
+        os.environ.update(env)
+        os.chdir(request["cwd"])
+        sys.argv = ["phoenix", *request["argv"]]
+        with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+            sys.stdin, saved_stdin = io.StringIO(""), sys.stdin
+            try:
+                app(args=request["argv"], prog_name="phoenix")
+                code = 0
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:  # keep the daemon alive whatever a command does
+                writer.write(f"Error: {e}\n")
+                code = 1
+            finally:
+                sys.stdin = saved_stdin
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+        sys.argv = saved_argv
+    return {"exit": code}
+
+
+def serve(path: str, *, skip_tls: bool = False, release_ttl: float = 600.0, idle_timeout: float = 0,
+          prefetch: bool = False, log=None) -> None:
+    """Warm up and serve requests on a Unix socket until stopped or idle for idle_timeout seconds.
+
+    Requests are handled one at a time: commands change the working directory
+    and environment, which are process-wide.
+    """
+    import socketserver
+    import tempfile
+    import time
+
+    from . import _load_app
+    from .api import ReleaseCache
+    from .github import get_http_client
+    from .sources import resolve_sources
+    from .system_utils import build_path_index
+    from .templates import set_release_cache
+
+    log = log or (lambda message: None)
+    app = _load_app()
+    client = get_http_client(skip_tls)
+    build_path_index()
+    cache_dir = tempfile.mkdtemp(prefix="phoenix-serve-")
+    cache = ReleaseCache(cache_dir, ttl=release_ttl)
+    set_release_cache(cache)
+    if prefetch:
+        try:
+            zip_path, meta = cache.get(resolve_sources(), client=client)
+            cache.extracted(zip_path)
+            log(f"prefetched release {meta['release']} via {meta['source']}")
+        except Exception as e:
+            # Not fatal: the first forwarded init downloads it instead
+            log(f"prefetch failed: {e}")
+
+    package = _package_dir()
+    state = {"last": time.monotonic(), "stop": False}
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            try:
+                request = json.loads(self.rfile.readline())
+            except ValueError:
+                return
+            if request.get("command") == "stop":
+                state["stop"] = True
+                _send(self.connection, {"exit": 0})
+                return
+            if request.get("command") == "status":
+                _send(self.connection, {"out": json.dumps({"pid": os.getpid(), "socket": path, "package": package}) + "\n"})
+                _send(self.connection, {"exit": 0})
+                return
+            if request.get("package") != package:
+                _send(self.connection, {"fallback": "different phoenix-cli installation"})
+                return
+            started = time.perf_counter()
+            try:
+                _send(self.connection, _run_request(request, self.connection, app))
+            except OSError:
+                pass  # client disconnected
+            state["last"] = time.monotonic()
+            log(f"{' '.join(request['argv'])} ({(time.perf_counter() - started) * 1000:.0f} ms)")
+
+    # Create the socket (and a missing parent directory) owner-only: other
+    # local users must never be able to connect, not even between bind()
+    # and a later chmod()
+    old_umask = os.umask(0o077)
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if os.path.exists(path):
+            os.unlink(path)
+        server = socketserver.UnixStreamServer(path, Handler)
+    finally:
+        os.umask(old_umask)
+    server.timeout = 1.0
+    try:
+        while not state["stop"]:
+            server.handle_request()
+            if idle_timeout and time.monotonic() - state["last"] > idle_timeout:
+                log(f"idle for {idle_timeout:.0f}s, stopping")
+                break
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+        set_release_cache(None)
+        cache.clear()
+        import shutil
+
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def control(path: str, command: str) -> dict | None:
+    """Send a control command ('status' or 'stop'); return the daemon's reply or None if not running."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(2.0)
+            sock.connect(path)
+            _send(sock, {"command": command})
+            reply = {}
+            with sock.makefile("r", encoding="utf-8") as replies:
+                for line in replies:
+                    message = json.loads(line)
+                    if "out" in message:
+                        reply.update(json.loads(message["out"]))
+                    if "exit" in message:
+                        return reply
+    except (OSError, ValueError):
+        return None
+    return reply
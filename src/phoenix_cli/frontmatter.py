@@ -0,0 +1,27 @@
+"""YAML frontmatter of SKILL.md files and command templates.
+
+Kept free of network and repository imports so the template renderer
+(render.py) and the skill catalog (search.py) can both use it cheaply.
+"""
+
+
+def parse_frontmatter(text: str) -> dict:
+    """Return the YAML frontmatter of a SKILL.md as a dict (empty if missing or invalid)."""
+    if not text.startswith("---"):
+        return {}
+    end = text.find("\n---", 3)
+    if end == -1:
+        return {}
+    block = text[3:end]
+    import yaml
+
+    try:
+        data = yaml.safe_load(block)
+    except yaml.YAMLError:
+        # Unquoted colons in descriptions are common; fall back to key: value lines
+        data = {}
+        for line in block.splitlines():
+            key, sep, value = line.partition(":")
+            if sep and key.strip() and not line.startswith((" ", "\t")):
+                data[key.strip()] = value.strip().strip("'\"")
+    return data if isinstance(data, dict) else {}
@@ -2,20 +2,36 @@
 
 import os
 import ssl
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
 
 import httpx
-import truststore
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from .config import GITHUB_REPO_NAME, GITHUB_REPO_OWNER
+from .config import GITHUB_API_URL, GITHUB_REPO_NAME, GITHUB_REPO_OWNER
 from .ui import console
 
-# Create SSL context and client for GitHub API
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+@lru_cache(maxsize=None)
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the shared truststore SSL context, creating it on first use."""
+    import truststore
+
+    return truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+
+@lru_cache(maxsize=None)
+def get_http_client(skip_tls: bool = False) -> httpx.Client:
+    """Return a shared httpx.Client, creating it (and its SSL context) on first use."""
+    return httpx.Client(verify=False if skip_tls else get_ssl_context())
+
+
+def __getattr__(name: str):
+    # Backwards compatibility: `ssl_context` used to be built at import time
+    if name == "ssl_context":
+        return get_ssl_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _github_token(cli_token: str | None = None) -> str | None:
@@ -88,138 +104,164 @@ def _format_rate_limit_error(status_code: int, headers: httpx.Headers, url: str)
     return "\n".join(lines)
 
 
-def download_template_from_github(
-    ai_assistant: str,
-    download_dir: Path,
+# Transient failures worth retrying: server errors, dropped connections and
+# truncated downloads. Rate-limit responses (403/429) are reported, not retried.
+RETRYABLE_STATUS = {500, 502, 503, 504}
+MAX_RETRIES = 3
+
+
+class _RetryableError(Exception):
+    """A transient failure; carries response headers for Retry-After."""
+
+    def __init__(self, message: str, headers: httpx.Headers | None = None):
+        super().__init__(message)
+        self.headers = headers
+
+
+def _retry_delay(attempt: int, headers: httpx.Headers | None = None) -> float:
+    """Exponential backoff (0.5s, 1s, 2s, ...) capped at 8s, honoring a short Retry-After."""
+    if headers is not None:
+        retry_after = _parse_rate_limit_headers(headers).get("retry_after_seconds")
+        if retry_after is not None and 0 <= retry_after <= 30:
+            return float(retry_after)
+    return min(0.5 * (2 ** attempt), 8.0)
+
+
+def _get_with_retries(client: httpx.Client, url: str, *, headers: dict, timeout: float,
+                      max_retries: int = MAX_RETRIES) -> httpx.Response:
+    """GET a URL, retrying transient failures with backoff."""
+    for attempt in range(max_retries + 1):
+        try:
+            response = client.get(url, timeout=timeout, follow_redirects=True, headers=headers)
+        except httpx.TransportError:
+            if attempt >= max_retries:
+                raise
+            time.sleep(_retry_delay(attempt))
+            continue
+        if response.status_code in RETRYABLE_STATUS and attempt < max_retries:
+            time.sleep(_retry_delay(attempt, response.headers))
+            continue
+        return response
+    return response
+
+
+def _download_asset(
+    client: httpx.Client,
+    url: str,
+    dest: Path,
     *,
-    verbose: bool = True,
-    show_progress: bool = True,
-    client: httpx.Client = None,
-    debug: bool = False,
-    github_token: str = None
-) -> Tuple[Path, dict]:
-    """Download the latest release template from GitHub.
-
-    Args:
-        ai_assistant: The AI assistant type (e.g., 'claude', 'copilot') - used for metadata only
-        download_dir: Directory to download the file to
-        verbose: Whether to print detailed progress
-        show_progress: Whether to show progress bar
-        client: Optional httpx.Client to use
-        debug: Whether to show debug information
-        github_token: Optional GitHub token for authentication
+    expected_size: int,
+    headers: dict,
+    show_progress: bool,
+    debug: bool,
+    max_retries: int = MAX_RETRIES
+) -> int:
+    """Stream a release asset to dest, retrying and resuming transient failures.
+
+    When the server advertises byte ranges, an interrupted or truncated
+    download resumes with a Range request guarded by If-Range (ETag), so only
+    the missing bytes are fetched again.
 
     Returns:
-        Tuple of (zip_path, metadata_dict)
+        Number of bytes written
     """
-    if client is None:
-        client = httpx.Client(verify=ssl_context)
-
-    if verbose:
-        console.print("[cyan]Fetching latest release information...[/cyan]")
-    api_url = f"https://api.github.com/repos/{GITHUB_REPO_OWNER}/{GITHUB_REPO_NAME}/releases/latest"
-
-    try:
-        response = client.get(
-            api_url,
-            timeout=30,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
+    downloaded = 0
+    etag = None
+    progress = None
+    task = None
+    if show_progress and expected_size:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            console=console,
         )
-        status = response.status_code
-        if status != 200:
-            # Format detailed error message with rate-limit info
-            error_msg = _format_rate_limit_error(status, response.headers, api_url)
-            if debug:
-                error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
-            raise RuntimeError(error_msg)
-        try:
-            release_data = response.json()
-        except ValueError as je:
-            raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
-    except Exception as e:
-        console.print(f"[red]Error fetching release information[/red]")
-        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
-        raise RuntimeError(f"Failed to fetch release information: {e}") from e
-
-    assets = release_data.get("assets", [])
-    # Look for the unified skills package (phoenix-skills-vX.X.X.zip)
-    pattern = "phoenix-skills-"
-    matching_assets = [
-        asset for asset in assets
-        if pattern in asset["name"] and asset["name"].endswith(".zip")
-    ]
-
-    asset = matching_assets[0] if matching_assets else None
-
-    if asset is None:
-        asset_names = [a.get('name', '?') for a in assets]
-        console.print(f"[red]No matching release asset found[/red] (expected pattern: [bold]{pattern}[/bold])")
-        console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
-        raise RuntimeError(f"No matching release asset found (expected pattern: {pattern})")
-
-    download_url = asset["browser_download_url"]
-    filename = asset["name"]
-    file_size = asset["size"]
-
-    if verbose:
-        console.print(f"[cyan]Found template:[/cyan] {filename}")
-        console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
-        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
-
-    zip_path = download_dir / filename
-    if verbose:
-        console.print(f"[cyan]Downloading template...[/cyan]")
+        progress.start()
+        task = progress.add_task("Downloading...", total=expected_size)
 
     try:
-        with client.stream(
-            "GET",
-            download_url,
-            timeout=60,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
-        ) as response:
-            if response.status_code != 200:
-                # Handle rate-limiting on download as well
-                error_msg = _format_rate_limit_error(response.status_code, response.headers, download_url)
-                if debug:
-                    error_msg += f"\n\n[dim]Response body (truncated 400):[/dim]\n{response.text[:400]}"
-                raise RuntimeError(error_msg)
-            total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
-                if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                else:
-                    if show_progress:
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[progress.description]{task.description}"),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                            console=console,
-                        ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
-                            downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                progress.update(task, completed=downloaded)
-                    else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
+        attempt = 0
+        while True:
+            request_headers = dict(headers)
+            if downloaded and etag:
+                request_headers["Range"] = f"bytes={downloaded}-"
+                request_headers["If-Range"] = etag
+            try:
+                with client.stream("GET", url, timeout=60, follow_redirects=True, headers=request_headers) as response:
+                    status = response.status_code
+                    if status in RETRYABLE_STATUS:
+                        raise _RetryableError(f"server returned {status}", response.headers)
+                    if status not in (200, 206):
+                        # Handle rate-limiting on download as well
+                        error_msg = _format_rate_limit_error(status, response.headers, url)
+                        if debug:
+                            response.read()
+                            error_msg += f"\n\n[dim]Response body (truncated 400):[/dim]\n{response.text[:400]}"
+                        raise RuntimeError(error_msg)
+
+                    if status == 200:
+                        # Full body (first attempt, or the server ignored the Range)
+                        downloaded = 0
+                    can_resume = status == 206 or response.headers.get("Accept-Ranges", "").lower() == "bytes"
+                    etag = response.headers.get("ETag") if can_resume else None
+
+                    with open(dest, "ab" if status == 206 else "wb") as f:
+                        for chunk in response.iter_bytes(chunk_size=65536):
                             f.write(chunk)
-    except Exception as e:
-        console.print(f"[red]Error downloading template[/red]")
-        detail = str(e)
-        if zip_path.exists():
-            zip_path.unlink()
-        console.print(Panel(detail, title="Download Error", border_style="red"))
-        raise RuntimeError(f"Failed to download template: {detail}") from e
-    if verbose:
-        console.print(f"Downloaded: {filename}")
-    metadata = {
-        "filename": filename,
-        "size": file_size,
-        "release": release_data["tag_name"],
-        "asset_url": download_url
-    }
-    return zip_path, metadata
+                            downloaded += len(chunk)
+                            if progress is not None:
+                                progress.update(task, completed=downloaded)
+
+                if expected_size and downloaded < expected_size:
+                    raise _RetryableError(f"download truncated at {downloaded:,} of {expected_size:,} bytes")
+                return downloaded
+            except (httpx.TransportError, _RetryableError) as e:
+                if attempt >= max_retries:
+                    raise RuntimeError(f"{e} (gave up after {attempt + 1} attempts)") from e
+                time.sleep(_retry_delay(attempt, getattr(e, "headers", None)))
+                attempt += 1
+    finally:
+        if progress is not None:
+            progress.stop()
+
+
+# Release assets are named phoenix-skills-vX.X.X.zip
+ASSET_PATTERN = "phoenix-skills-"
+
+
+def find_release_asset(assets: list[dict]) -> dict | None:
+    """Return the unified skills package among a release's assets, if any."""
+    matching = [a for a in assets if ASSET_PATTERN in a.get("name", "") and a["name"].endswith(".zip")]
+    return matching[0] if matching else None
+
+
+def fetch_latest_release(
+    client: httpx.Client,
+    *,
+    owner: str = GITHUB_REPO_OWNER,
+    repo: str = GITHUB_REPO_NAME,
+    api_url: str = GITHUB_API_URL,
+    headers: dict | None = None,
+    timeout: float = 30,
+    debug: bool = False
+) -> dict:
+    """Return the latest release JSON of a repository without printing anything.
+
+    Raises:
+        RuntimeError: On a non-200 response (with rate-limit details) or invalid JSON
+    """
+    url = f"{api_url.rstrip('/')}/repos/{owner}/{repo}/releases/latest"
+    response = _get_with_retries(client, url, timeout=timeout, headers=headers or {})
+    status = response.status_code
+    if status != 200:
+        # Format detailed error message with rate-limit info
+        error_msg = _format_rate_limit_error(status, response.headers, url)
+        if debug:
+            error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
+        raise RuntimeError(error_msg)
+    try:
+        return response.json()
+    except ValueError as je:
+        raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
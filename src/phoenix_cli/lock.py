@@ -0,0 +1,182 @@
+"""Pinned installs (phoenix.lock).
+
+A project's phoenix.lock records the exact template release (tag, asset
+name, size, sha256 and download URL) and the commit of every skill and
+agent repository in nightlife.yaml::
+
+    {
+      "version": 1,
+      "release": {"tag": "v1.2.0", "filename": "phoenix-skills-v1.2.0.zip",
+                  "size": 123456, "sha256": "...", "asset_url": "https://...",
+                  "source": "github"},
+      "repos": {"skills": [{"name": "...", "url": "...", "branch": "main",
+                            "path": "skills", "commit": "<sha>"}],
+                "agents": []}
+    }
+
+With a lock, ``init``, ``upgrade`` and ``skills add`` make no resolution
+calls: the release zip comes from the content-addressed store in the user
+cache dir (sources.LockedSource) and repositories are read at the pinned
+commit from their mirrors (repos.open_mirror). ``phoenix lock --update``
+re-resolves everything concurrently and rewrites the file.
+"""
+
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+from .catalog import KINDS, load_config
+from .repos import RepoError, open_mirror, rev_parse
+from .sources import LockedSource, ReleaseSource, download_release, store_release
+
+LOCK_FILE = "phoenix.lock"
+LOCK_VERSION = 1
+DEFAULT_JOBS = 8
+
+
+class LockError(ValueError):
+    """Raised when phoenix.lock cannot be read or written."""
+
+
+def lock_path(project_path: Path) -> Path:
+    return Path(project_path) / LOCK_FILE
+
+
+def read_lock(path: Path) -> dict | None:
+    """Read a lock file (or <path>/phoenix.lock for a directory); None if there is none.
+
+    Raises:
+        LockError: If the file exists but is invalid or from another version
+    """
+    path = lock_path(path) if Path(path).is_dir() else Path(path)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lock = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        raise LockError(f"Cannot read {path}: {e}") from e
+    if not isinstance(lock, dict) or lock.get("version") != LOCK_VERSION:
+        raise LockError(f"{path}: unsupported lock version (expected {LOCK_VERSION}); run 'phoenix lock --update'")
+    release = lock.get("release")
+    if release is not None and not all(release.get(k) for k in ("tag", "filename", "sha256")):
+        raise LockError(f"{path}: release entry needs tag, filename and sha256")
+    return lock
+
+
+def write_lock(project_path: Path, lock: dict) -> Path:
+    """Write phoenix.lock atomically (sorted keys, so diffs stay small)."""
+    path = lock_path(project_path)
+    tmp_file = path.with_suffix(".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(lock, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_file, path)
+    return path
+
+
+def locked_sources(lock: dict | None, github_token: str | None = None) -> list[ReleaseSource] | None:
+    """The release source pinned by a lock, or None if it pins no release."""
+    if not lock or not lock.get("release"):
+        return None
+    return [LockedSource(lock["release"], github_token=github_token)]
+
+
+def locked_commit(lock: dict | None, kind: str, url: str, branch: str) -> str | None:
+    """Commit pinned for url@branch in the lock, or None."""
+    for entry in (lock or {}).get("repos", {}).get(kind, []):
+        if entry.get("url") == url and entry.get("branch") == branch and entry.get("commit"):
+            return entry["commit"]
+    return None
+
+
+def _lock_release(sources: list[ReleaseSource], client: httpx.Client, debug: bool) -> dict:
+    with tempfile.TemporaryDirectory(prefix="phoenix-lock-") as temp_dir:
+        zip_path, metadata = download_release(sources, Path(temp_dir), client=client, debug=debug)
+        # Stored now, so the first locked install is already a cache hit
+        _, sha256 = store_release(zip_path, metadata.get("sha256"))
+        return {
+            "tag": metadata["release"],
+            "filename": metadata["filename"],
+            "size": zip_path.stat().st_size,
+            "sha256": sha256,
+            "asset_url": metadata.get("asset_url"),
+            "source": metadata["source"],
+        }
+
+
+def _lock_repo(kind: str, repo: dict, previous: str | None) -> dict:
+    entry = {**repo, "commit": previous, "error": None}
+    try:
+        with open_mirror(repo["url"], repo["branch"]) as mirror_state:
+            if mirror_state["stale"]:
+                # Never pin a commit we could not confirm is the branch head
+                raise RepoError(mirror_state["error"])
+            entry["commit"] = rev_parse(mirror_state["path"], "HEAD")
+    except RepoError as e:
+        entry["error"] = str(e)
+    return entry
+
+
+def update_lock(
+    project_path: Path,
+    *,
+    config_path: Path | None,
+    sources: list[ReleaseSource],
+    client: httpx.Client,
+    jobs: int = DEFAULT_JOBS,
+    debug: bool = False
+) -> dict:
+    """Resolve the latest release and every repository head concurrently and rewrite the lock.
+
+    A repository that cannot be refreshed keeps its previous pin and is
+    reported under "errors"; a release that cannot be resolved raises.
+
+    Args:
+        project_path: Project whose phoenix.lock is written
+        config_path: nightlife.yaml to pin repositories from (None: release only)
+        sources: Release sources, in priority order
+        client: httpx.Client for the release download
+        jobs: Maximum number of concurrent resolutions
+        debug: Whether to include response bodies in release errors
+
+    Returns:
+        Dict with "lock" (the written lock), "path" and "errors" (list of
+        {"kind", "name", "url", "branch", "error"})
+
+    Raises:
+        SourceError: If no release source could provide the template
+        CatalogError: If config_path cannot be read
+    """
+    try:
+        previous = read_lock(project_path) or {}
+    except LockError:
+        previous = {}
+    config = load_config(config_path) if config_path else {kind: [] for kind in KINDS}
+
+    tasks = [(kind, repo) for kind in KINDS for repo in config[kind]]
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(tasks) + 1))) as pool:
+        release_future = pool.submit(_lock_release, sources, client, debug)
+        repo_futures = [
+            (kind, pool.submit(_lock_repo, kind, repo,
+                               locked_commit(previous, kind, repo["url"], repo["branch"])))
+            for kind, repo in tasks
+        ]
+        release = release_future.result()
+        entries = [(kind, future.result()) for kind, future in repo_futures]
+
+    lock = {"version": LOCK_VERSION, "release": release, "repos": {kind: [] for kind in KINDS}}
+    errors = []
+    for kind, entry in entries:
+        error = entry.pop("error")
+        if error:
+            errors.append({"kind": kind, "name": entry["name"], "url": entry["url"],
+                           "branch": entry["branch"], "error": error})
+        if entry["commit"]:
+            lock["repos"][kind].append(entry)
+    path = write_lock(project_path, lock)
+    return {"lock": lock, "path": path, "errors": errors}
@@ -0,0 +1,208 @@
+"""Network diagnostics for Phoenix CLI (phoenix doctor --network)."""
+
+import json
+import os
+import socket
+import ssl
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+from .config import GITHUB_API_URL, GITHUB_REPO_NAME, GITHUB_REPO_OWNER
+from .github import _github_auth_headers, find_release_asset, get_http_client, get_ssl_context
+
+PROXY_ENV_VARS = ("HTTPS_PROXY", "https_proxy", "HTTP_PROXY", "http_proxy", "ALL_PROXY", "all_proxy", "NO_PROXY", "no_proxy")
+
+
+def _ms(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+def proxy_settings() -> dict:
+    """Return proxy environment variables that httpx will honor."""
+    return {name: os.environ[name] for name in PROXY_ENV_VARS if os.environ.get(name)}
+
+
+def measure_ssl_context_cost() -> dict:
+    """Time building a verifying SSL context with truststore vs. certifi."""
+    import certifi
+    import truststore
+
+    results = {}
+    start = time.perf_counter()
+    truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    results["truststore_ms"] = _ms(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    ssl.create_default_context(cafile=certifi.where())
+    results["certifi_ms"] = _ms(time.perf_counter() - start)
+    return results
+
+
+def _certifi_context() -> ssl.SSLContext:
+    import certifi
+
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def probe_connection(host: str, port: int = 443, *, timeout: float = 10.0, skip_tls: bool = False) -> dict:
+    """Time DNS resolution, TCP connect and TLS handshake to a host.
+
+    The TLS handshake is measured twice on fresh connections: once verifying
+    with truststore (the OS trust store, as init does) and once with certifi,
+    so their verification cost can be compared. With skip_tls, only an
+    unverified handshake is measured.
+    """
+    result = {"host": host, "port": port, "address": None, "dns_ms": None, "connect_ms": None, "tls": {}, "error": None}
+
+    try:
+        start = time.perf_counter()
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        result["dns_ms"] = _ms(time.perf_counter() - start)
+    except OSError as e:
+        result["error"] = f"DNS resolution failed: {e}"
+        return result
+
+    family, _, _, _, address = infos[0]
+    result["address"] = address[0]
+
+    if skip_tls:
+        unverified = ssl.create_default_context()
+        unverified.check_hostname = False
+        unverified.verify_mode = ssl.CERT_NONE
+        contexts = {"unverified": unverified}
+    else:
+        contexts = {"truststore": get_ssl_context(), "certifi": _certifi_context()}
+
+    for name, context in contexts.items():
+        sock = None
+        try:
+            start = time.perf_counter()
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(address)
+            connect_time = time.perf_counter() - start
+            if result["connect_ms"] is None:
+                result["connect_ms"] = _ms(connect_time)
+
+            start = time.perf_counter()
+            tls_sock = context.wrap_socket(sock, server_hostname=host)
+            sock = tls_sock
+            result["tls"][name] = {"handshake_ms": _ms(time.perf_counter() - start), "version": tls_sock.version(), "error": None}
+        except (OSError, ssl.SSLError) as e:
+            result["tls"][name] = {"handshake_ms": None, "version": None, "error": str(e)}
+        finally:
+            if sock is not None:
+                sock.close()
+
+    return result
+
+
+def probe_http(client: httpx.Client, url: str, *, headers: dict, timeout: float = 30.0,
+               max_bytes: int = 0, max_seconds: float = 10.0, keep_body: bool = False) -> dict:
+    """Time a GET through the shared client: time-to-first-byte and sustained throughput.
+
+    Redirects are followed by the client and the final URL is reported, so
+    the final host (e.g. the asset CDN) is known. The body is read until
+    max_bytes (0 = whole body) or max_seconds, whichever comes first; with
+    keep_body it is returned as "body" so the caller need not request it again.
+    """
+    result = {"url": url, "final_url": None, "status": None, "ttfb_ms": None, "bytes": 0,
+              "seconds": None, "throughput_bps": None, "rate_limit_remaining": None, "error": None}
+    chunks = []
+    try:
+        start = time.perf_counter()
+        with client.stream("GET", url, timeout=timeout, follow_redirects=True, headers=headers) as response:
+            result["ttfb_ms"] = _ms(time.perf_counter() - start)
+            result["status"] = response.status_code
+            result["final_url"] = str(response.url)
+            result["rate_limit_remaining"] = response.headers.get("X-RateLimit-Remaining")
+
+            body_start = time.perf_counter()
+            received = 0
+            for chunk in response.iter_bytes(chunk_size=65536):
+                received += len(chunk)
+                if keep_body:
+                    chunks.append(chunk)
+                elapsed = time.perf_counter() - body_start
+                if (max_bytes and received >= max_bytes) or elapsed >= max_seconds:
+                    break
+            elapsed = time.perf_counter() - body_start
+            result["bytes"] = received
+            result["seconds"] = round(elapsed, 3)
+            if elapsed > 0 and received:
+                result["throughput_bps"] = round(received / elapsed)
+    except httpx.HTTPError as e:
+        result["error"] = str(e) or e.__class__.__name__
+    if keep_body:
+        result["body"] = b"".join(chunks)
+    return result
+
+
+def _api_url() -> str:
+    return f"{GITHUB_API_URL}/repos/{GITHUB_REPO_OWNER}/{GITHUB_REPO_NAME}/releases/latest"
+
+
+def run_local_diagnostics(*, github_token: str | None = None) -> dict:
+    """Report the client configuration init would use, without any network request.
+
+    Covers the API URL, proxy variables, whether a GitHub token is set and
+    the cost of building the SSL context; "targets" is left empty.
+    """
+    return {
+        "api_url": _api_url(),
+        "proxy": proxy_settings(),
+        "authenticated": bool(_github_auth_headers(github_token)),
+        "ssl_context": measure_ssl_context_cost(),
+        "targets": {},
+    }
+
+
+def run_network_diagnostics(*, skip_tls: bool = False, github_token: str | None = None,
+                            max_bytes: int = 0, max_seconds: float = 10.0, timeout: float = 10.0) -> dict:
+    """Diagnose connectivity to the GitHub API and the release asset host.
+
+    Uses the same client configuration (shared httpx client, truststore or
+    --skip-tls, GitHub token) as init. The report extends
+    run_local_diagnostics() with one entry per target.
+    """
+    client = get_http_client(skip_tls)
+    headers = _github_auth_headers(github_token)
+    report = run_local_diagnostics(github_token=github_token)
+    api_url = report["api_url"]
+
+    api_http = probe_http(client, api_url, headers=headers, timeout=timeout, max_seconds=max_seconds,
+                          keep_body=True)
+    api_body = api_http.pop("body")
+    api_parts = urlsplit(api_url)
+    api_target = {"http": api_http}
+    if api_parts.scheme == "https":
+        api_target["connection"] = probe_connection(api_parts.hostname, api_parts.port or 443,
+                                                    timeout=timeout, skip_tls=skip_tls)
+    report["targets"]["api"] = api_target
+
+    # Find the release asset through the same lookup init uses, in the body
+    # probe_http() already read (a second request would spend rate limit)
+    asset_url = None
+    if api_http["status"] == 200:
+        try:
+            asset = find_release_asset(json.loads(api_body).get("assets", []))
+            if asset:
+                asset_url = asset["browser_download_url"]
+        except (ValueError, KeyError, AttributeError):
+            pass
+
+    if asset_url:
+        asset_http = probe_http(client, asset_url, headers=headers, timeout=timeout,
+                                max_bytes=max_bytes, max_seconds=max_seconds)
+        asset_target = {"http": asset_http}
+        final = urlsplit(asset_http["final_url"] or asset_url)
+        if final.scheme == "https":
+            asset_target["connection"] = probe_connection(final.hostname, final.port or 443,
+                                                          timeout=timeout, skip_tls=skip_tls)
+        report["targets"]["asset"] = asset_target
+    else:
+        report["targets"]["asset"] = {"http": None, "error": "release asset not found (API lookup failed)"}
+
+    return report
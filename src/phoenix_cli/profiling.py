@@ -0,0 +1,102 @@
+"""Built-in profiling hooks (cProfile and tracemalloc) for Phoenix CLI."""
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+# Number of rows in the hotspot summary and allocation report
+TOP_N = 15
+
+
+class ProfileSession:
+    """Profile a single command run with cProfile and, optionally, tracemalloc.
+
+    Only the thread that starts the session is profiled by cProfile; worker
+    threads still show up in the tracemalloc report.
+    """
+
+    def __init__(self, output_dir: Path, command: str, memory: bool = False):
+        self.output_dir = Path(output_dir)
+        self.command = command or "phoenix"
+        self.memory = memory
+        self.profiler = cProfile.Profile()
+
+    def start(self) -> None:
+        if self.memory:
+            tracemalloc.start(25)
+        self.profiler.enable()
+
+    def stop(self) -> None:
+        """Stop profiling, write reports and print a short hotspot summary."""
+        self.profiler.disable()
+        snapshot = None
+        peak = None
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"phoenix-{self.command}-{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+        pstats_path = self.output_dir / f"{stem}.pstats"
+        self.profiler.dump_stats(pstats_path)
+
+        # Human-readable version of the profile for machines without a viewer
+        text = io.StringIO()
+        stats = pstats.Stats(self.profiler, stream=text)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(50)
+        (self.output_dir / f"{stem}.txt").write_text(text.getvalue(), encoding="utf-8")
+
+        alloc_path = None
+        if snapshot is not None:
+            alloc_path = self.output_dir / f"{stem}-alloc.txt"
+            self._write_allocations(snapshot, peak, alloc_path)
+
+        self._print_summary(stats, pstats_path, alloc_path, peak)
+
+    def _write_allocations(self, snapshot: tracemalloc.Snapshot, peak: int, path: Path) -> None:
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        lines = [f"Peak traced memory: {peak:,} bytes", "", f"Top {TOP_N} allocation sites (by size):", ""]
+        for index, stat in enumerate(snapshot.statistics("lineno")[:TOP_N], 1):
+            frame = stat.traceback[0]
+            lines.append(f"#{index}: {frame.filename}:{frame.lineno}  {stat.size / 1024:.1f} KiB in {stat.count} blocks")
+        lines.extend(["", f"Top {TOP_N} allocation tracebacks:", ""])
+        for stat in snapshot.statistics("traceback")[:TOP_N]:
+            lines.append(f"{stat.size / 1024:.1f} KiB in {stat.count} blocks")
+            lines.extend(f"    {line}" for line in stat.traceback.format(limit=8))
+            lines.append("")
+        path.write_text("\n".join(lines), encoding="utf-8")
+
+    def _print_summary(self, stats: pstats.Stats, pstats_path: Path, alloc_path: Path | None, peak: int | None) -> None:
+        table = Table(title=f"Hotspots (top {TOP_N} by cumulative time)", show_lines=False)
+        table.add_column("Cumulative", justify="right", style="cyan")
+        table.add_column("Own", justify="right")
+        table.add_column("Calls", justify="right")
+        table.add_column("Function", style="white")
+
+        rows = []
+        for (filename, lineno, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append((cumtime, tottime, ncalls, f"{Path(filename).name}:{lineno}({func})"))
+        rows.sort(key=lambda row: row[0], reverse=True)
+        for cumtime, tottime, ncalls, name in rows[:TOP_N]:
+            table.add_row(f"{cumtime:.3f}s", f"{tottime:.3f}s", f"{ncalls:,}", name)
+
+        # stderr, so --json and piped output of the profiled command stay parseable
+        console = Console(stderr=True)
+        console.print()
+        console.print(table)
+        console.print(f"[cyan]Profile written to:[/cyan] {pstats_path}")
+        console.print(f"[dim]Inspect with: python -m pstats {pstats_path}[/dim]")
+        if alloc_path is not None:
+            console.print(f"[cyan]Allocation report written to:[/cyan] {alloc_path} [dim](peak {peak:,} bytes)[/dim]")
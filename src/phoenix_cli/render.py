@@ -0,0 +1,255 @@
+"""Per-agent command rendering.
+
+A template (release zip or local template directory) may ship source
+command templates next to skills/::
+
+    commands/<name>.md     optional YAML frontmatter (description, ...),
+                           then the prompt; $ARGUMENTS marks the user input
+
+At install time every template is rendered for each selected AI agent into
+its agent_folder, using EXTENSION_MAP and ARGS_FORMAT_MAP from config.py:
+
+- Markdown agents get the frontmatter and body with their args placeholder
+- TOML agents (Gemini, Qwen) get ``description`` and ``prompt`` keys
+- Copilot gets ``<name>.agent.md`` in .github/agents/ plus a
+  ``<name>.prompt.md`` in its prompts_folder that selects that agent
+
+Templates are compiled once per process (keyed by content hash) and
+rendered output is cached by (template hash, agent). Each agent folder
+keeps a manifest (.phoenix-commands.json) of the files it was given, with
+the template hash and the file's size and mtime, so an upgrade rewrites
+only files whose template changed (or that were edited or deleted) and
+removes files whose template is gone.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from .config import AGENT_CONFIG, ARGS_FORMAT_MAP, EXTENSION_MAP
+from .frontmatter import parse_frontmatter
+
+COMMANDS_DIR = "commands"
+MANIFEST_NAME = ".phoenix-commands.json"
+SOURCE_ARGS = "$ARGUMENTS"
+# Bump when an output format changes so installed files are re-rendered
+RENDER_VERSION = 2
+
+_cache_lock = threading.Lock()
+_compiled = {}  # (template sha256, name) -> compiled template
+_rendered = {}  # (template sha256, name, agent) -> [(folder, filename, text), ...]
+
+
+def has_commands(template_root: Path) -> bool:
+    return (Path(template_root) / COMMANDS_DIR).is_dir()
+
+
+def _split_frontmatter(text: str) -> tuple[str, str]:
+    """Return (frontmatter block including its --- lines, body)."""
+    if text.startswith("---"):
+        end = text.find("\n---", 3)
+        if end != -1:
+            close = text.find("\n", end + 4)
+            close = len(text) if close == -1 else close + 1
+            return text[:close], text[close:]
+    return "", text
+
+
+def compile_template(path: Path) -> dict:
+    """Parse a command template once; later calls with the same content reuse it.
+
+    Returns:
+        Dict with name, hash (sha256 of the file), frontmatter (the raw
+        block), description and body
+    """
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    key = (digest, Path(path).stem)
+    with _cache_lock:
+        cached = _compiled.get(key)
+    if cached is not None:
+        return cached
+
+    text = data.decode("utf-8").replace("\r\n", "\n")
+    frontmatter, body = _split_frontmatter(text)
+    description = parse_frontmatter(text).get("description")
+    template = {
+        "name": Path(path).stem,
+        "hash": digest,
+        "frontmatter": frontmatter,
+        "description": " ".join(str(description).split()) if description else "",
+        "body": body.lstrip("\n"),
+    }
+    with _cache_lock:
+        _compiled[key] = template
+    return template
+
+
+def _toml_escape(value: str, *, keep_newlines: bool = False) -> str:
+    """Escape value for a TOML basic string (backslash, quotes and control characters)."""
+    out = []
+    for char in value:
+        if char == "\\" or char == '"':
+            out.append("\\" + char)
+        elif char == "\n":
+            out.append("\n" if keep_newlines else "\\n")
+        elif char == "\t":
+            out.append("\\t")
+        elif char < " " or char == "\x7f":
+            out.append(f"\\u{ord(char):04X}")
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def _toml_string(value: str) -> str:
+    return f'"{_toml_escape(value)}"'
+
+
+def _toml_literal_safe(text: str) -> bool:
+    """Whether text can go in a multi-line literal string (no escapes there)."""
+    return "'''" not in text and not any((c < " " and c not in "\t\n") or c == "\x7f" for c in text)
+
+
+def _toml_command(description: str, prompt: str) -> str:
+    prompt = prompt.rstrip("\n")
+    if _toml_literal_safe(prompt):
+        # A literal string needs no escaping
+        block = f"'''\n{prompt}\n'''"
+    else:
+        block = '"""\n' + _toml_escape(prompt, keep_newlines=True) + '\n"""'
+    lines = []
+    if description:
+        lines.append(f"description = {_toml_string(description)}")
+        lines.append("")
+    lines.append(f"prompt = {block}")
+    return "\n".join(lines) + "\n"
+
+
+def render_command(template: dict, agent: str) -> list[tuple[str, str, str]]:
+    """Render one compiled template for one agent.
+
+    Returns:
+        List of (project-relative folder, file name, text)
+    """
+    key = (template["hash"], template["name"], agent)
+    with _cache_lock:
+        cached = _rendered.get(key)
+    if cached is not None:
+        return cached
+
+    config = AGENT_CONFIG[agent]
+    extension = EXTENSION_MAP.get(agent, ".md")
+    body = template["body"].replace(SOURCE_ARGS, ARGS_FORMAT_MAP.get(agent, SOURCE_ARGS))
+    name = template["name"]
+    if extension == ".toml":
+        text = _toml_command(template["description"], body)
+    else:
+        text = template["frontmatter"] + body
+    outputs = [(config["agent_folder"], f"{name}{extension}", text)]
+    if config.get("prompts_folder"):
+        # Copilot slash commands are prompt files that hand off to the agent
+        outputs.append((config["prompts_folder"], f"{name}.prompt.md", f"---\nagent: {name}\n---\n"))
+
+    with _cache_lock:
+        _rendered[key] = outputs
+    return outputs
+
+
+def _load_manifest(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != RENDER_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+
+def _save_manifest(path: Path, files: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix(".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump({"version": RENDER_VERSION, "files": files}, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, path)
+
+
+def _file_state(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _render_agent(templates: list[dict], project_path: Path, agent: str, force: bool, stats: dict) -> None:
+    manifest_path = project_path / AGENT_CONFIG[agent]["agent_folder"] / MANIFEST_NAME
+    recorded = _load_manifest(manifest_path)
+    files = {path: entry for path, entry in recorded.items() if entry.get("agent") != agent}
+    produced = set()
+
+    for template in templates:
+        for folder, filename, text in render_command(template, agent):
+            relative = (Path(folder) / filename).as_posix()
+            target = project_path / relative
+            produced.add(relative)
+            previous = recorded.get(relative)
+            state = _file_state(target)
+            if (not force and previous and previous.get("template") == template["hash"]
+                    and state == (previous.get("size"), previous.get("mtime_ns"))):
+                files[relative] = previous
+                stats["unchanged"] += 1
+                continue
+            data = text.encode("utf-8")
+            if force or state is None or state[0] != len(data) or target.read_bytes() != data:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data)
+                stats["written"] += 1
+                stats["bytes"] += len(data)
+            else:
+                stats["unchanged"] += 1
+            size, mtime_ns = _file_state(target)
+            files[relative] = {"agent": agent, "template": template["hash"], "size": size, "mtime_ns": mtime_ns}
+
+    for relative, entry in recorded.items():
+        if entry.get("agent") != agent or relative in produced:
+            continue
+        target = project_path / relative
+        state = _file_state(target)
+        if state is not None and state == (entry.get("size"), entry.get("mtime_ns")):
+            # The template is gone and the file is as rendered: remove it
+            target.unlink()
+            stats["removed"] += 1
+        elif state is not None:
+            files[relative] = entry  # edited by the user; keep and keep tracking it
+
+    if files or recorded:
+        _save_manifest(manifest_path, files)
+
+
+def render_commands(template_root: Path, project_path: Path, agents: list[str], *, force: bool = False) -> dict:
+    """Render the template's commands/ for every agent into its agent_folder.
+
+    Each template is compiled once and rendered for all agents in one pass.
+
+    Args:
+        template_root: Template directory holding commands/ (and skills/)
+        project_path: Project to write into
+        agents: AI agent keys to render for
+        force: Rewrite every file even when its template is unchanged
+
+    Returns:
+        Dict with templates, written, unchanged, removed and bytes counts
+    """
+    stats = {"templates": 0, "written": 0, "unchanged": 0, "removed": 0, "bytes": 0}
+    commands_dir = Path(template_root) / COMMANDS_DIR
+    if not commands_dir.is_dir():
+        return stats
+    templates = [compile_template(path) for path in sorted(commands_dir.glob("*.md")) if path.is_file()]
+    stats["templates"] = len(templates)
+    for agent in agents:
+        _render_agent(templates, Path(project_path), agent, force, stats)
+    return stats
@@ -0,0 +1,509 @@
+"""Git access to skill and agent repositories (phoenix skills add).
+
+Repositories are kept as persistent mirrors in the user cache dir: one
+bare, blobless, shallow clone per repository URL and branch. Each use
+refreshes the mirror with an incremental ``git fetch`` (a few KB when
+nothing changed) and materializes only the requested paths into a
+temporary work tree; file contents are fetched lazily, in one batch, and
+stay in the mirror for the next install.
+
+Skill names and globs are resolved from the tree listing, skills whose
+installed files already match the remote blob ids are skipped, and the
+rest are checked out together and copied into every target folder in
+parallel.
+
+Mirrors are locked while in use, so concurrent phoenix processes share
+them safely, and the least recently used ones are pruned once the cache
+exceeds MIRROR_CACHE_MAX_BYTES (PHOENIX_REPO_CACHE_MAX_MB).
+
+Like add-skills.sh, fetches are tried without credentials first and then
+with GH_TOKEN/GITHUB_TOKEN (GitHub) or AZURE_DEVOPS_PAT/ADO_TOKEN (Azure
+DevOps). Tokens are passed as an HTTP header through the environment and
+never written to the mirror's configuration.
+"""
+
+import base64
+import fnmatch
+import hashlib
+import os
+import re
+import shutil
+import stat
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from .catalog import CatalogError, parse_repo_url
+from .templates import copy_tree
+
+DEFAULT_JOBS = 8
+CACHE_MAX_ENV_VAR = "PHOENIX_REPO_CACHE_MAX_MB"
+MIRROR_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+
+class RepoError(RuntimeError):
+    """Raised when a repository cannot be fetched or read."""
+
+
+def _token_for(url: str) -> str | None:
+    try:
+        host = parse_repo_url(url)["host"]
+    except CatalogError:
+        return None
+    if host == "github":
+        names = ("GH_TOKEN", "GITHUB_TOKEN")
+    else:
+        names = ("AZURE_DEVOPS_PAT", "ADO_TOKEN")
+    for name in names:
+        token = (os.getenv(name) or "").strip()
+        if token:
+            return token
+    return None
+
+
+def _auth_env(url: str) -> dict | None:
+    """Environment passing the repository token as an HTTP header, or None without a token."""
+    token = _token_for(url)
+    if not token:
+        return None
+    user = "x-access-token" if parse_repo_url(url)["host"] == "github" else "pat"
+    credentials = base64.b64encode(f"{user}:{token}".encode()).decode("ascii")
+    # GIT_CONFIG_* keeps the header out of argv and out of the mirror's config
+    return {
+        "GIT_CONFIG_COUNT": "1",
+        "GIT_CONFIG_KEY_0": "http.extraHeader",
+        "GIT_CONFIG_VALUE_0": f"Authorization: Basic {credentials}",
+    }
+
+
+def _git(args: list[str], cwd: Path | None = None, *, env: dict | None = None) -> str:
+    """Run git non-interactively and return stdout; raise RepoError with its stderr."""
+    full_env = {**os.environ, "GIT_TERMINAL_PROMPT": "0", **(env or {})}
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, env=full_env)
+    except FileNotFoundError:
+        raise RepoError("git is required but not found. Install git and try again.")
+    if result.returncode != 0:
+        raise RepoError(f"git {args[0]} failed: {(result.stderr or result.stdout).strip()}")
+    return result.stdout
+
+
+def _with_auth_fallback(url: str, branch: str, run) -> None:
+    """Call run(env) without credentials, then with the repository token if that fails."""
+    try:
+        run(None)
+        return
+    except RepoError as public_error:
+        auth_env = _auth_env(url)
+        if auth_env is None:
+            raise RepoError(
+                f"Failed to fetch {url} (branch: {branch}): {public_error}\n"
+                "Hint: If this is a private repo, set GH_TOKEN/GITHUB_TOKEN (GitHub) "
+                "or AZURE_DEVOPS_PAT/ADO_TOKEN (Azure DevOps)"
+            )
+    run(auth_env)
+
+
+# ---------------------------------------------------------------------------
+# Mirror cache
+# ---------------------------------------------------------------------------
+
+def cache_dir() -> Path:
+    """Directory holding the repository mirrors."""
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("phoenix-cli")) / "repos"
+
+
+def _cache_limit() -> int:
+    try:
+        return int(float(os.environ[CACHE_MAX_ENV_VAR]) * 1024 * 1024)
+    except (KeyError, ValueError):
+        return MIRROR_CACHE_MAX_BYTES
+
+
+def mirror_path(url: str, branch: str) -> Path:
+    """Mirror location for url@branch: a readable name plus a hash of both."""
+    digest = hashlib.sha256(f"{url}\n{branch}".encode()).hexdigest()[:16]
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "-", url.rstrip("/").rsplit("/", 1)[-1].removesuffix(".git"))[:40]
+    return cache_dir() / f"{slug}-{digest}.git"
+
+
+@contextmanager
+def _locked(lock_file: Path) -> Iterator[None]:
+    """Hold an exclusive lock on lock_file (blocks until other processes release it)."""
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file, "a+b") as handle:
+        if os.name == "nt":
+            import msvcrt
+
+            handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10s; keep waiting
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _refresh(mirror: Path, url: str, branch: str) -> None:
+    """Create the mirror, or fetch the branch tip into it (trees only, no blobs)."""
+    if (mirror / "HEAD").is_file():
+        refspec = f"+refs/heads/{branch}:refs/heads/{branch}"
+        _with_auth_fallback(url, branch, lambda env: _git(
+            ["fetch", "--quiet", "--filter=blob:none", "--depth", "1", "origin", refspec], mirror, env=env
+        ))
+        return
+
+    def clone(env):
+        shutil.rmtree(mirror, ignore_errors=True)
+        _git(["clone", "--quiet", "--bare", "--filter=blob:none", "--depth", "1", "--branch", branch,
+              url, str(mirror)], env=env)
+
+    try:
+        _with_auth_fallback(url, branch, clone)
+    except RepoError:
+        shutil.rmtree(mirror, ignore_errors=True)
+        raise
+
+
+def _has_commit(mirror: Path, commit: str) -> bool:
+    try:
+        _git(["cat-file", "-e", f"{commit}^{{commit}}"], mirror)
+        return True
+    except RepoError:
+        return False
+
+
+@contextmanager
+def open_mirror(url: str, branch: str, *, refresh: bool = True, commit: str | None = None) -> Iterator[dict]:
+    """Lock, refresh and yield the mirror of url@branch.
+
+    With commit (a pinned SHA), the branch is not refreshed: the commit is
+    used from the mirror, and fetched by id only if the mirror lacks it.
+    Otherwise a failed refresh of an existing mirror is not fatal: the
+    cached state is used and reported as stale (e.g. when offline).
+
+    Yields:
+        Dict with "path" (the bare repository), "revision" (commit or
+        "HEAD"), "stale" (refresh failed) and "error" (the refresh error)
+    """
+    mirror = mirror_path(url, branch)
+    with _locked(mirror.with_suffix(".lock")):
+        state = {"path": mirror, "revision": commit or "HEAD", "stale": False, "error": None}
+        exists = (mirror / "HEAD").is_file()
+        if commit:
+            if not exists:
+                _refresh(mirror, url, branch)
+            if not _has_commit(mirror, commit):
+                _with_auth_fallback(url, branch, lambda env: _git(
+                    ["fetch", "--quiet", "--filter=blob:none", "--depth", "1", "origin", commit], mirror, env=env
+                ))
+        elif refresh or not exists:
+            try:
+                _refresh(mirror, url, branch)
+            except RepoError as e:
+                if not exists:
+                    raise
+                state["stale"] = True
+                state["error"] = str(e)
+        # The lock file's mtime records the last use, for pruning
+        os.utime(mirror.with_suffix(".lock"))
+        yield state
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def list_mirrors() -> list[dict]:
+    """Cached mirrors with path, size in bytes and last use time, most recent first."""
+    root = cache_dir()
+    if not root.is_dir():
+        return []
+    mirrors = []
+    for mirror in root.glob("*.git"):
+        lock_file = mirror.with_suffix(".lock")
+        last_used = lock_file.stat().st_mtime if lock_file.exists() else mirror.stat().st_mtime
+        mirrors.append({"path": mirror, "bytes": _tree_size(mirror), "last_used": last_used})
+    return sorted(mirrors, key=lambda m: m["last_used"], reverse=True)
+
+
+def prune_mirrors(max_bytes: int | None = None, *, keep: set[Path] = frozenset()) -> list[Path]:
+    """Remove least recently used mirrors until the cache fits in max_bytes.
+
+    Mirrors in keep and mirrors locked by another process are left alone.
+
+    Returns:
+        Paths of the removed mirrors
+    """
+    max_bytes = _cache_limit() if max_bytes is None else max_bytes
+    mirrors = list_mirrors()
+    total = sum(m["bytes"] for m in mirrors)
+    removed = []
+    for mirror in reversed(mirrors):
+        if total <= max_bytes:
+            break
+        if mirror["path"] in keep:
+            continue
+        lock_file = mirror["path"].with_suffix(".lock")
+        if not _try_lock_and_remove(mirror["path"], lock_file):
+            continue
+        total -= mirror["bytes"]
+        removed.append(mirror["path"])
+    return removed
+
+
+def _try_lock_and_remove(mirror: Path, lock_file: Path) -> bool:
+    if os.name == "nt":
+        # No cheap non-blocking lock probe with msvcrt; skip busy mirrors by rename
+        try:
+            doomed = mirror.with_suffix(f".removing-{os.getpid()}")
+            mirror.rename(doomed)
+        except OSError:
+            return False
+        shutil.rmtree(doomed, ignore_errors=True)
+        return True
+
+    import fcntl
+
+    try:
+        with open(lock_file, "a+b") as handle:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return False  # in use
+            # The lock file stays: a process blocked on it in _locked() must
+            # keep locking the same inode as the next one to open it
+            shutil.rmtree(mirror, ignore_errors=True)
+            return True
+    except OSError:
+        return False
+
+
+def clear_mirrors() -> int:
+    """Remove every mirror that is not in use; return the number removed."""
+    return len(prune_mirrors(0))
+
+
+def list_dirs(mirror: Path, path: str, revision: str = "HEAD") -> list[str]:
+    """Names of the directories directly under path at revision (reads trees only)."""
+    output = _git(["ls-tree", "-d", "-z", "--name-only", revision, "--", f"{path.strip('/')}/"], mirror)
+    return sorted(entry.rsplit("/", 1)[-1] for entry in output.split("\0") if entry)
+
+
+def remote_blobs(mirror: Path, paths: list[str], revision: str = "HEAD") -> dict[str, dict[str, str]]:
+    """Map each path to {relative file path: blob id} at revision, from one ls-tree call."""
+    blobs = {path: {} for path in paths}
+    if not paths:
+        return blobs
+    output = _git(["ls-tree", "-r", "-z", revision, "--", *paths], mirror)
+    for record in output.split("\0"):
+        if not record:
+            continue
+        meta, name = record.split("\t", 1)
+        _mode, kind, object_id = meta.split()
+        if kind != "blob":
+            continue  # submodules are not copied
+        for path in paths:
+            if name.startswith(path + "/"):
+                blobs[path][name[len(path) + 1:]] = object_id
+                break
+    return blobs
+
+
+def _blob_id(data: bytes) -> str:
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def local_blobs(directory: Path) -> dict[str, str] | None:
+    """Map of {relative file path: git blob id} for an installed folder, or None if missing."""
+    if not directory.is_dir():
+        return None
+    blobs = {}
+    for root, _dirs, files in os.walk(directory):
+        for name in files:
+            file_path = Path(root) / name
+            if file_path.is_symlink():
+                data = os.readlink(file_path).encode()
+            else:
+                data = file_path.read_bytes()
+            blobs[file_path.relative_to(directory).as_posix()] = _blob_id(data)
+    return blobs
+
+
+def checkout_patterns(
+    mirror: Path, url: str, branch: str, patterns: list[str], work_tree: Path, revision: str = "HEAD"
+) -> None:
+    """Materialize the files of revision matching sparse-checkout patterns into work_tree.
+
+    Missing blobs are fetched from the mirror's origin (url@branch) in one
+    batch and kept in the mirror; like the tree fetch, this is tried without
+    credentials first and then with the repository token. The caller must
+    hold the mirror lock (the sparse patterns live in the mirror).
+    """
+    info = mirror / "info"
+    info.mkdir(exist_ok=True)
+    (info / "sparse-checkout").write_text("".join(f"{p}\n" for p in patterns), encoding="utf-8")
+    index_file = work_tree.parent / f"{work_tree.name}.index"
+
+    def read_tree(env):
+        # Start each attempt from scratch, in case a failed one left files behind
+        shutil.rmtree(work_tree, ignore_errors=True)
+        index_file.unlink(missing_ok=True)
+        work_tree.mkdir(parents=True, exist_ok=True)
+        _git(["--git-dir", str(mirror), "--work-tree", str(work_tree), "-c", "core.sparseCheckout=true",
+              "read-tree", "-mu", revision], env={"GIT_INDEX_FILE": str(index_file), **(env or {})})
+
+    _with_auth_fallback(url, branch, read_tree)
+
+
+def checkout_paths(
+    mirror: Path, url: str, branch: str, paths: list[str], work_tree: Path, revision: str = "HEAD"
+) -> None:
+    """Materialize only the given directories of revision into work_tree (see checkout_patterns())."""
+    checkout_patterns(mirror, url, branch, [f"/{p.strip('/')}/" for p in paths], work_tree, revision)
+
+
+def rev_parse(mirror: Path, revision: str) -> str | None:
+    """Object id of a revision such as "HEAD" or "HEAD:skills", or None if it does not exist."""
+    try:
+        return _git(["rev-parse", "--verify", "--quiet", revision], mirror).strip() or None
+    except RepoError:
+        return None
+
+
+def select(available: list[str], patterns: list[str]) -> tuple[list[str], list[str]]:
+    """Resolve names and glob patterns against available names.
+
+    Returns:
+        Tuple of (selected names in available order, patterns matching nothing)
+    """
+    chosen = set()
+    unmatched = []
+    for pattern in patterns:
+        matches = fnmatch.filter(available, pattern)
+        if not matches:
+            unmatched.append(pattern)
+        chosen.update(matches)
+    return [name for name in available if name in chosen], unmatched
+
+
+def _make_scripts_executable(directory: Path) -> None:
+    scripts = directory / "scripts"
+    if not scripts.is_dir():
+        return
+    for file_path in scripts.rglob("*"):
+        if file_path.is_file() and file_path.suffix in (".sh", ".bash"):
+            mode = file_path.stat().st_mode
+            file_path.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+
+def _install_one(source: Path, target: Path) -> tuple[int, int]:
+    """Replace target with a copy of source; return (files, bytes)."""
+    if target.exists():
+        shutil.rmtree(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    files, nbytes = copy_tree(source, target, dirs_exist_ok=False)
+    _make_scripts_executable(target)
+    return files, nbytes
+
+
+def install_skills(
+    repo: dict,
+    patterns: list[str],
+    target_folders: list[Path],
+    *,
+    force: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    commit: str | None = None,
+    refresh: bool = True
+) -> dict:
+    """Install skills (or agents) from one repository into every target folder.
+
+    Args:
+        repo: Repository dict from catalog.load_config() (url, branch, path)
+        patterns: Skill names or glob patterns (e.g. "git-*")
+        target_folders: Folders to install into (e.g. .claude/skills)
+        force: Reinstall even when the installed files already match
+        jobs: Maximum number of folders copied at once
+        commit: Install this pinned commit (e.g. from phoenix.lock) instead
+            of the branch tip; the branch is not refreshed
+        refresh: Fetch the branch first (False: the caller just did)
+
+    Returns:
+        Dict with "commit" (the installed commit), "unmatched" (patterns
+        that matched no skill), "stale" (the mirror could not be refreshed
+        and its cached state was used), "error" (the refresh error) and
+        "results": one dict per (skill, target) with skill, target, status
+        ("installed", "unchanged" or "error"), files, bytes and error
+
+    Raises:
+        RepoError: If the repository cannot be fetched or read
+    """
+    base = repo["path"].strip("/")
+    with open_mirror(repo["url"], repo["branch"], refresh=refresh, commit=commit) as mirror_state:
+        mirror = mirror_state["path"]
+        revision = mirror_state["revision"]
+        installed_commit = rev_parse(mirror, f"{revision}^{{commit}}")
+        skills, unmatched = select(list_dirs(mirror, base, revision), patterns)
+        remote = remote_blobs(mirror, [f"{base}/{skill}" for skill in skills], revision)
+
+        results = []
+        pending = []
+        for skill in skills:
+            expected = remote[f"{base}/{skill}"]
+            for folder in target_folders:
+                target = folder / skill
+                result = {"skill": skill, "target": str(target), "status": "unchanged",
+                          "files": 0, "bytes": 0, "error": None}
+                results.append(result)
+                if force or local_blobs(target) != expected:
+                    pending.append(result)
+
+        if pending:
+            with tempfile.TemporaryDirectory(prefix="phoenix-repo-") as temp_dir:
+                work_tree = Path(temp_dir) / "tree"
+                needed = sorted({result["skill"] for result in pending})
+                checkout_paths(mirror, repo["url"], repo["branch"], [f"{base}/{skill}" for skill in needed],
+                               work_tree, revision)
+
+                def run(result: dict) -> None:
+                    try:
+                        result["files"], result["bytes"] = _install_one(
+                            work_tree / base / result["skill"], Path(result["target"])
+                        )
+                        result["status"] = "installed"
+                    except OSError as e:
+                        result["status"] = "error"
+                        result["error"] = str(e)
+
+                with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(pending)))) as pool:
+                    list(pool.map(run, pending))
+
+    prune_mirrors(keep={mirror})
+    return {"commit": installed_commit, "unmatched": unmatched, "stale": mirror_state["stale"],
+            "error": mirror_state["error"], "results": results}
@@ -0,0 +1,208 @@
+"""Local skill catalog (phoenix skills index / phoenix skills search).
+
+``phoenix skills index`` records every skill of every repository in
+nightlife.yaml: name, description (from the SKILL.md frontmatter),
+repository, path and commit. Repositories are indexed concurrently from
+the mirrors in phoenix_cli.repos; a repository whose skills folder has the
+same tree id as last time is skipped, and for the others all SKILL.md files
+are fetched in one batch.
+
+The catalog is a single JSON file in the user cache dir holding the skill
+records and an inverted index (term -> skill ids), so ``phoenix skills
+search`` answers offline without scanning descriptions.
+"""
+
+import bisect
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .frontmatter import parse_frontmatter
+from .repos import RepoError, checkout_patterns, list_dirs, open_mirror, rev_parse
+
+INDEX_VERSION = 1
+DEFAULT_JOBS = 8
+
+_TERM_RE = re.compile(r"[a-z0-9]+")
+# Terms in a skill name weigh more than terms in its description
+_NAME_WEIGHT = 3
+
+
+def index_file() -> Path:
+    """Location of the catalog index."""
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("phoenix-cli")) / "skills-index.json"
+
+
+def repo_key(repo: dict) -> str:
+    return f"{repo['url']}@{repo['branch']}:{repo['path'].strip('/')}"
+
+
+def _terms(text: str) -> list[str]:
+    return _TERM_RE.findall(text.lower())
+
+
+def load_index(path: Path | None = None) -> dict | None:
+    """Read the catalog index, or None if it does not exist or is from another version."""
+    try:
+        with open(path or index_file(), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if index.get("version") == INDEX_VERSION else None
+
+
+def _save_index(index: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix(".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(tmp_file, path)
+
+
+def _index_repository(repo: dict, previous: dict | None, full: bool) -> dict:
+    """Index one repository; reuse previous when its skills tree is unchanged."""
+    entry = {
+        "name": repo["name"], "url": repo["url"], "branch": repo["branch"], "path": repo["path"],
+        "commit": None, "tree": None, "skills": [], "error": None, "status": "indexed",
+        "indexed_at": time.time(),
+    }
+    base = repo["path"].strip("/")
+    try:
+        with open_mirror(repo["url"], repo["branch"]) as mirror_state:
+            mirror = mirror_state["path"]
+            entry["commit"] = rev_parse(mirror, "HEAD")
+            entry["tree"] = rev_parse(mirror, f"HEAD:{base}")
+            if entry["tree"] is None:
+                raise RepoError(f"{base} not found in {repo['url']} (branch: {repo['branch']})")
+            if mirror_state["stale"]:
+                entry["error"] = mirror_state["error"]
+            if not full and previous and previous.get("tree") == entry["tree"] and not previous.get("error"):
+                return {**previous, "commit": entry["commit"], "status": "unchanged",
+                        "error": entry["error"], "indexed_at": entry["indexed_at"]}
+
+            names = [n for n in list_dirs(mirror, base) if not n.startswith((".", "_"))]
+            with tempfile.TemporaryDirectory(prefix="phoenix-index-") as temp_dir:
+                work_tree = Path(temp_dir) / "tree"
+                # Only the SKILL.md files, fetched in one batch
+                checkout_patterns(mirror, repo["url"], repo["branch"], [f"/{base}/*/SKILL.md"], work_tree)
+                for name in names:
+                    skill_file = work_tree / base / name / "SKILL.md"
+                    try:
+                        meta = parse_frontmatter(skill_file.read_text(encoding="utf-8", errors="replace"))
+                    except OSError:
+                        meta = {}
+                    description = meta.get("description")
+                    entry["skills"].append({
+                        "name": name,
+                        "description": " ".join(str(description).split()) if description else "",
+                        "path": f"{base}/{name}",
+                    })
+    except RepoError as e:
+        entry["status"] = "error"
+        entry["error"] = str(e)
+        if previous:
+            # Keep searching the last good listing of a repository that is unreachable now
+            entry["skills"] = previous.get("skills", [])
+            entry["commit"] = previous.get("commit")
+    return entry
+
+
+def _build_terms(repos: dict) -> dict[str, list[list]]:
+    """Inverted index: term -> [[repo_key, skill index, weight], ...]."""
+    postings: dict[str, dict[tuple, int]] = {}
+    for key, repo in repos.items():
+        for position, skill in enumerate(repo["skills"]):
+            weights = {}
+            for term in _terms(skill["name"]):
+                weights[term] = weights.get(term, 0) + _NAME_WEIGHT
+            for term in _terms(skill["description"]):
+                weights[term] = weights.get(term, 0) + 1
+            for term, weight in weights.items():
+                postings.setdefault(term, {})[(key, position)] = weight
+    return {term: [[k, i, w] for (k, i), w in sorted(entries.items())] for term, entries in sorted(postings.items())}
+
+
+def build_index(repos: list[dict], *, jobs: int = DEFAULT_JOBS, full: bool = False,
+                path: Path | None = None) -> dict:
+    """Index every repository concurrently and write the catalog.
+
+    Args:
+        repos: Skill repositories from catalog.load_config()
+        jobs: Maximum number of repositories indexed at once
+        full: Re-read every SKILL.md even when a repository is unchanged
+        path: Index file (default: index_file())
+
+    Returns:
+        The written index: version, built_at, repos (repo_key -> entry with
+        commit, tree, skills, status and error) and terms
+    """
+    path = path or index_file()
+    previous = (load_index(path) or {}).get("repos", {})
+    if repos:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(repos)))) as pool:
+            entries = list(pool.map(lambda r: _index_repository(r, previous.get(repo_key(r)), full), repos))
+    else:
+        entries = []
+
+    index_repos = {repo_key(repo): entry for repo, entry in zip(repos, entries)}
+    index = {
+        "version": INDEX_VERSION,
+        "built_at": time.time(),
+        "repos": index_repos,
+        "terms": _build_terms(index_repos),
+    }
+    _save_index(index, path)
+    return index
+
+
+def search(index: dict, query: str, *, limit: int | None = 20) -> list[dict]:
+    """Find skills matching every word of query (as a word prefix), best matches first.
+
+    Returns:
+        Skill dicts (name, description, path) with repository name, url,
+        branch, commit and score
+    """
+    words = _terms(query)
+    if not words:
+        return []
+    terms = index["terms"]
+    vocabulary = list(terms)  # sorted when the index was built
+    scores = None
+    for word in words:
+        word_scores = {}
+        # Every term starting with word, found by binary search in the sorted vocabulary
+        start = bisect.bisect_left(vocabulary, word)
+        for term in vocabulary[start:]:
+            if not term.startswith(word):
+                break
+            exact = 2 if term == word else 1
+            for key, position, weight in terms[term]:
+                hit = (key, position)
+                word_scores[hit] = max(word_scores.get(hit, 0), weight * exact)
+        if scores is None:
+            scores = word_scores
+        else:
+            scores = {hit: score + word_scores[hit] for hit, score in scores.items() if hit in word_scores}
+        if not scores:
+            return []
+
+    results = []
+    for (key, position), score in scores.items():
+        repo = index["repos"][key]
+        skill = repo["skills"][position]
+        results.append({
+            **skill,
+            "repository": repo["name"] or repo["url"],
+            "url": repo["url"],
+            "branch": repo["branch"],
+            "commit": repo["commit"],
+            "score": score,
+        })
+    results.sort(key=lambda r: (-r["score"], r["name"], r["repository"]))
+    return results[:limit] if limit else results
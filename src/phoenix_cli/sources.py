@@ -0,0 +1,446 @@
+"""Release sources: where the phoenix-skills release zip comes from.
+
+Sources are tried in order and the first one that resolves a release and
+delivers its asset wins, so a fast LAN mirror can be listed before GitHub
+and GitHub is only contacted when the mirror misses.
+
+Source specs (``phoenix init --source``, repeatable, or comma-separated in
+the PHOENIX_RELEASE_SOURCES environment variable):
+
+- ``github`` or ``github:OWNER/REPO``: GitHub releases (the default)
+- ``mirror:URL`` or any ``http(s)://`` URL: a static HTTP directory with an
+  ``index.json``
+- ``dir:PATH`` or a bare path (one containing a path separator, or an
+  existing directory): a local directory with an ``index.json`` or
+  ``phoenix-skills-*.zip`` files
+
+A project's phoenix.lock pins one exact release instead (see LockedSource
+and lock.py); pinned zips are kept in a content-addressed store in the
+user cache dir.
+
+A mirror index uses the same shape as GitHub's release JSON, so a copy of
+``releases/latest`` plus the zip is a valid mirror. ``url`` (relative to the
+index, default: the asset name) and ``sha256`` are optional::
+
+    {
+      "tag_name": "v1.2.0",
+      "assets": [
+        {"name": "phoenix-skills-v1.2.0.zip", "size": 1048576,
+         "url": "v1.2.0/phoenix-skills-v1.2.0.zip", "sha256": "..."}
+      ]
+    }
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+from urllib.parse import urljoin
+
+import httpx
+
+from .config import GITHUB_API_URL, GITHUB_REPO_NAME, GITHUB_REPO_OWNER
+from .github import (
+    ASSET_PATTERN,
+    _download_asset,
+    _get_with_retries,
+    _github_auth_headers,
+    fetch_latest_release,
+    find_release_asset,
+)
+
+SOURCES_ENV_VAR = "PHOENIX_RELEASE_SOURCES"
+INDEX_NAME = "index.json"
+
+
+class SourceError(RuntimeError):
+    """Raised when a source spec is invalid or no source could deliver a release."""
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _verify_sha256(path: Path, expected: str | None) -> None:
+    if expected and _file_sha256(path) != expected.lower():
+        raise RuntimeError(f"Checksum mismatch for {path.name} (expected sha256 {expected})")
+
+
+def _asset_from_index(index: dict, where: str) -> Tuple[dict, dict]:
+    """Return (release_data, asset) from a mirror index, validating its shape."""
+    if not isinstance(index, dict) or "tag_name" not in index:
+        raise RuntimeError(f"Invalid release index at {where}: missing 'tag_name'")
+    asset = find_release_asset(index.get("assets", []))
+    if asset is None:
+        raise RuntimeError(f"No matching release asset in {where} (expected pattern: {ASSET_PATTERN})")
+    return index, asset
+
+
+class ReleaseSource(ABC):
+    """Base class for release sources.
+
+    resolve() finds the latest release and returns its metadata (filename,
+    size, release, asset_url and optionally sha256); fetch() then delivers
+    that asset into a directory. Both raise on failure so the caller can
+    fail over to the next source. A subclass missing either cannot be
+    instantiated.
+    """
+
+    name = "source"
+    remote = True  # needs an HTTP client
+
+    @abstractmethod
+    def resolve(self, client: httpx.Client, *, debug: bool = False) -> dict:
+        """Return the metadata of the release this source offers."""
+
+    @abstractmethod
+    def fetch(self, client: httpx.Client, metadata: dict, dest_dir: Path, *,
+              show_progress: bool = False, debug: bool = False) -> Path:
+        """Deliver the asset described by metadata into dest_dir and return its path."""
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class GitHubSource(ReleaseSource):
+    """Latest release of a GitHub repository."""
+
+    def __init__(self, owner: str = GITHUB_REPO_OWNER, repo: str = GITHUB_REPO_NAME, *,
+                 api_url: str = GITHUB_API_URL, github_token: str | None = None):
+        self.owner = owner
+        self.repo = repo
+        self.api_url = api_url
+        self.github_token = github_token
+        default = (owner, repo) == (GITHUB_REPO_OWNER, GITHUB_REPO_NAME)
+        self.name = "github" if default else f"github:{owner}/{repo}"
+
+    def resolve(self, client: httpx.Client, *, debug: bool = False) -> dict:
+        release_data = fetch_latest_release(
+            client,
+            owner=self.owner,
+            repo=self.repo,
+            api_url=self.api_url,
+            headers=_github_auth_headers(self.github_token),
+            debug=debug,
+        )
+        asset = find_release_asset(release_data.get("assets", []))
+        if asset is None:
+            names = ", ".join(a.get("name", "?") for a in release_data.get("assets", [])) or "no assets"
+            raise RuntimeError(f"No matching release asset found (expected pattern: {ASSET_PATTERN}; found: {names})")
+        return {
+            "filename": asset["name"],
+            "size": asset["size"],
+            "release": release_data["tag_name"],
+            "asset_url": asset["browser_download_url"],
+        }
+
+    def fetch(self, client: httpx.Client, metadata: dict, dest_dir: Path, *,
+              show_progress: bool = False, debug: bool = False) -> Path:
+        zip_path = dest_dir / metadata["filename"]
+        _download_asset(
+            client,
+            metadata["asset_url"],
+            zip_path,
+            expected_size=metadata["size"],
+            headers=_github_auth_headers(self.github_token),
+            show_progress=show_progress,
+            debug=debug,
+        )
+        return zip_path
+
+
+class MirrorSource(ReleaseSource):
+    """A static HTTP directory serving index.json and the release zip."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.name = f"mirror:{base_url.rstrip('/')}"
+
+    def resolve(self, client: httpx.Client, *, debug: bool = False) -> dict:
+        index_url = urljoin(self.base_url, INDEX_NAME)
+        response = _get_with_retries(client, index_url, headers={}, timeout=30)
+        if response.status_code != 200:
+            detail = f"\n{response.text[:400]}" if debug else ""
+            raise RuntimeError(f"Mirror returned status {response.status_code} for {index_url}{detail}")
+        try:
+            index = response.json()
+        except ValueError as e:
+            raise RuntimeError(f"Failed to parse mirror index {index_url}: {e}")
+        release_data, asset = _asset_from_index(index, index_url)
+        return {
+            "filename": asset["name"],
+            "size": asset.get("size", 0),
+            "release": release_data["tag_name"],
+            "asset_url": urljoin(index_url, asset.get("url") or asset["name"]),
+            "sha256": asset.get("sha256"),
+        }
+
+    def fetch(self, client: httpx.Client, metadata: dict, dest_dir: Path, *,
+              show_progress: bool = False, debug: bool = False) -> Path:
+        zip_path = dest_dir / metadata["filename"]
+        _download_asset(
+            client,
+            metadata["asset_url"],
+            zip_path,
+            expected_size=metadata["size"],
+            headers={},
+            show_progress=show_progress,
+            debug=debug,
+        )
+        _verify_sha256(zip_path, metadata.get("sha256"))
+        return zip_path
+
+
+def _version_key(filename: str) -> tuple:
+    return tuple(int(part) for part in re.findall(r"\d+", filename))
+
+
+class LocalDirSource(ReleaseSource):
+    """A local (or network-mounted) directory holding release zips."""
+
+    remote = False
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path).expanduser()
+        self.name = f"dir:{self.path}"
+
+    def resolve(self, client: httpx.Client, *, debug: bool = False) -> dict:
+        if not self.path.is_dir():
+            raise RuntimeError(f"Release directory not found: {self.path}")
+
+        index_path = self.path / INDEX_NAME
+        if index_path.is_file():
+            try:
+                index = json.loads(index_path.read_text(encoding="utf-8"))
+            except ValueError as e:
+                raise RuntimeError(f"Failed to parse {index_path}: {e}")
+            release_data, asset = _asset_from_index(index, str(index_path))
+            asset_path = self.path / (asset.get("url") or asset["name"])
+            tag = release_data["tag_name"]
+            sha256 = asset.get("sha256")
+        else:
+            candidates = sorted(self.path.glob(f"{ASSET_PATTERN}*.zip"), key=lambda p: _version_key(p.name))
+            if not candidates:
+                raise RuntimeError(f"No {ASSET_PATTERN}*.zip or {INDEX_NAME} in {self.path}")
+            asset_path = candidates[-1]
+            tag = asset_path.stem[len(ASSET_PATTERN):]
+            sha256 = None
+
+        if not asset_path.is_file():
+            raise RuntimeError(f"Release asset not found: {asset_path}")
+        return {
+            "filename": asset_path.name,
+            "size": asset_path.stat().st_size,
+            "release": tag,
+            "asset_url": asset_path.resolve().as_uri(),
+            "path": str(asset_path),
+            "sha256": sha256,
+        }
+
+    def fetch(self, client: httpx.Client, metadata: dict, dest_dir: Path, *,
+              show_progress: bool = False, debug: bool = False) -> Path:
+        source = Path(metadata["path"])
+        zip_path = dest_dir / metadata["filename"]
+        if source.resolve() != zip_path.resolve():
+            zip_path.unlink(missing_ok=True)
+            try:
+                # A hard link costs nothing when the directory is on the same filesystem
+                os.link(source, zip_path)
+            except OSError:
+                shutil.copyfile(source, zip_path)
+        _verify_sha256(zip_path, metadata.get("sha256"))
+        return zip_path
+
+
+def release_store_dir() -> Path:
+    """Content-addressed store of release zips pinned by lock files (<sha256>.zip)."""
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("phoenix-cli")) / "releases"
+
+
+def stored_release(sha256: str) -> Path | None:
+    """Path of the stored zip with this sha256, or None."""
+    path = release_store_dir() / f"{sha256.lower()}.zip"
+    return path if path.is_file() else None
+
+
+def store_release(zip_path: Path, sha256: str | None = None) -> Tuple[Path, str]:
+    """Add a zip to the release store (hard link, or copy); return (stored_path, sha256)."""
+    sha256 = (sha256 or _file_sha256(zip_path)).lower()
+    existing = stored_release(sha256)
+    if existing:
+        return existing, sha256
+    store = release_store_dir()
+    store.mkdir(parents=True, exist_ok=True)
+    target = store / f"{sha256}.zip"
+    temp = store / f".{sha256}.{os.getpid()}.tmp"
+    try:
+        os.link(zip_path, temp)
+    except OSError:
+        shutil.copyfile(zip_path, temp)
+    os.replace(temp, target)
+    return target, sha256
+
+
+class LockedSource(ReleaseSource):
+    """The exact release pinned in a phoenix.lock.
+
+    resolve() makes no request: the metadata comes from the lock. fetch()
+    serves the zip from the release store and only downloads the recorded
+    asset URL (verifying its sha256) when this machine has not stored it yet.
+    """
+
+    def __init__(self, release: dict, *, github_token: str | None = None):
+        self.release = release
+        self.github_token = github_token
+        self.name = f"lock:{release['tag']}@{release['sha256'][:12]}"
+        self.remote = stored_release(release["sha256"]) is None
+
+    def resolve(self, client: httpx.Client, *, debug: bool = False) -> dict:
+        return {
+            "filename": self.release["filename"],
+            "size": self.release.get("size", 0),
+            "release": self.release["tag"],
+            "asset_url": self.release.get("asset_url"),
+            "sha256": self.release["sha256"],
+        }
+
+    def fetch(self, client: httpx.Client, metadata: dict, dest_dir: Path, *,
+              show_progress: bool = False, debug: bool = False) -> Path:
+        zip_path = dest_dir / metadata["filename"]
+        stored = stored_release(metadata["sha256"])
+        if stored is None:
+            asset_url = metadata.get("asset_url")
+            if not asset_url:
+                raise RuntimeError(f"{metadata['filename']} is not in the release store and the lock has no download URL")
+            if asset_url.startswith("file:"):
+                # Pinned from a dir: source
+                from urllib.parse import urlparse
+                from urllib.request import url2pathname
+
+                shutil.copyfile(url2pathname(urlparse(asset_url).path), zip_path)
+            else:
+                is_github = "github.com" in asset_url or "githubusercontent.com" in asset_url
+                _download_asset(
+                    client,
+                    asset_url,
+                    zip_path,
+                    expected_size=metadata["size"],
+                    headers=_github_auth_headers(self.github_token) if is_github else {},
+                    show_progress=show_progress,
+                    debug=debug,
+                )
+            _verify_sha256(zip_path, metadata["sha256"])
+            store_release(zip_path, metadata["sha256"])
+            return zip_path
+        if stored.resolve() != zip_path.resolve():
+            zip_path.unlink(missing_ok=True)
+            try:
+                os.link(stored, zip_path)
+            except OSError:
+                shutil.copyfile(stored, zip_path)
+        return zip_path
+
+
+def parse_source(spec: str, github_token: str | None = None) -> ReleaseSource:
+    """Build a ReleaseSource from a spec such as 'github', 'mirror:URL' or 'dir:PATH'."""
+    spec = spec.strip()
+    if not spec:
+        raise SourceError("Empty release source")
+    if spec == "github":
+        return GitHubSource(github_token=github_token)
+    if spec.startswith("github:"):
+        owner, _, repo = spec[len("github:"):].partition("/")
+        if not owner or not repo:
+            raise SourceError(f"Invalid GitHub source '{spec}' (expected github:OWNER/REPO)")
+        return GitHubSource(owner, repo, github_token=github_token)
+    if spec.startswith("mirror:"):
+        return MirrorSource(spec[len("mirror:"):])
+    if spec.startswith(("http://", "https://")):
+        return MirrorSource(spec)
+    if spec.startswith("dir:"):
+        return LocalDirSource(spec[len("dir:"):])
+    if any(sep in spec for sep in ("/", os.sep)) or Path(spec).expanduser().exists():
+        return LocalDirSource(spec)
+    raise SourceError(
+        f"Unknown release source '{spec}' (expected github, github:OWNER/REPO, mirror:URL, "
+        "an http(s):// URL, dir:PATH or a directory path)"
+    )
+
+
+def resolve_sources(specs: list[str] | None = None, github_token: str | None = None) -> list[ReleaseSource]:
+    """Return the ordered source list from specs, PHOENIX_RELEASE_SOURCES, or GitHub alone."""
+    if not specs:
+        specs = [s for s in os.environ.get(SOURCES_ENV_VAR, "").split(",") if s.strip()]
+    if not specs:
+        return [GitHubSource(github_token=github_token)]
+    return [parse_source(spec, github_token) for spec in specs]
+
+
+def download_release(
+    sources: list[ReleaseSource],
+    download_dir: Path,
+    *,
+    client: httpx.Client,
+    show_progress: bool = False,
+    debug: bool = False,
+    on_release: Optional[Callable[[dict], None]] = None
+) -> Tuple[Path, dict]:
+    """Download the latest release asset from the first source that delivers it.
+
+    A source that fails to resolve or to deliver its asset is skipped and the
+    next one is tried. The returned metadata names the winning source and
+    lists the failures before it under "failed_sources".
+
+    Args:
+        sources: Sources in priority order
+        download_dir: Directory to place the zip in
+        client: httpx.Client used by HTTP sources
+        show_progress: Whether to show a download progress bar
+        debug: Whether to include response bodies in errors
+        on_release: Optional callback invoked with the metadata once a source
+            resolves a release, just before its asset is fetched
+
+    Returns:
+        Tuple of (zip_path, metadata_dict)
+
+    Raises:
+        SourceError: If every source failed
+    """
+    failures = []
+    for source in sources:
+        metadata = None
+        zip_path = None
+        try:
+            metadata = source.resolve(client, debug=debug)
+            metadata["source"] = source.name
+            metadata["failed_sources"] = list(failures)
+            zip_path = download_dir / metadata["filename"]
+            if on_release:
+                on_release(metadata)
+            zip_path = source.fetch(client, metadata, download_dir, show_progress=show_progress, debug=debug)
+            return zip_path, metadata
+        except (RuntimeError, OSError, httpx.HTTPError, KeyError, TypeError, AttributeError, ValueError) as e:
+            error = str(e)
+            if not isinstance(e, (RuntimeError, OSError, httpx.HTTPError)):
+                # A malformed index or release JSON (e.g. an asset without "name")
+                error = f"malformed release data ({e.__class__.__name__}: {e})"
+            failures.append({"source": source.name, "error": error})
+            # Drop partial downloads, but never a file that lives in the source directory
+            source_file = metadata.get("path") if metadata else None
+            if zip_path is not None and zip_path.is_file() and not (
+                source_file and Path(source_file).resolve() == zip_path.resolve()
+            ):
+                zip_path.unlink()
+
+    details = "\n".join(f"  • {f['source']}: {f['error']}" for f in failures)
+    raise SourceError(f"No release source could provide the template:\n{details}")
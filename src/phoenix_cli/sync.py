@@ -0,0 +1,170 @@
+"""Install every repository in nightlife.yaml (phoenix sync, init --sync).
+
+Each skill and agent repository is fetched into its mirror (see repos.py)
+on a bounded worker pool, and then every skill or agent in it is installed
+into each selected AI agent's folders with the same copy path as
+``phoenix skills add`` (unchanged folders are skipped). At most per_host
+repositories are fetched and installed against the same host at once; the
+install downloads the file contents. Repositories pinned in the project's
+phoenix.lock are installed at their pinned commit.
+
+Progress is reported on a StepTracker as one step per repository under a
+"sync" parent, so it can join an existing tree (init --sync).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlparse
+
+from .catalog import KINDS
+from .config import AGENT_CONFIG, AGENTS_FOLDER_MAP
+from .lock import locked_commit
+from .repos import RepoError, install_skills, open_mirror
+
+DEFAULT_JOBS = 8
+DEFAULT_PER_HOST = 4
+# Folders copied at once per repository; repositories already run in parallel
+COPY_JOBS = 2
+
+# Every top-level folder except hidden ones (. or _), like list-skills
+_ALL = "[!._]*"
+
+
+def repo_host(url: str) -> str:
+    """Host a repository URL is fetched from ("local" for file:// and paths)."""
+    if "://" in url:
+        return urlparse(url).hostname or "local"
+    if "@" in url and ":" in url:
+        # scp-like syntax: git@host:owner/repo.git
+        return url.split("@", 1)[1].split(":", 1)[0]
+    return "local"
+
+
+def target_folders(project_path: Path, kind: str, agents: list[str]) -> list[Path]:
+    """Folders that a skills or agents repository installs into for the given AI agents."""
+    if kind == "skills":
+        folders = [AGENT_CONFIG[agent]["skills_folder"] for agent in agents]
+    else:
+        folders = [AGENTS_FOLDER_MAP[agent] for agent in agents if agent in AGENTS_FOLDER_MAP]
+    return list(dict.fromkeys(Path(project_path) / folder for folder in folders))
+
+
+def step_key(kind: str, repo: dict) -> str:
+    return f"sync-{kind}-{repo['name'] or repo['url']}@{repo['branch']}"
+
+
+def add_steps(tracker, config: dict) -> None:
+    """Add the sync steps for config to tracker (before the run, so the tree shows them pending)."""
+    tracker.add("sync", "Sync nightlife.yaml repositories")
+    for kind in KINDS:
+        for repo in config[kind]:
+            tracker.add(step_key(kind, repo), f"{kind[:-1]} repo {repo['name'] or repo['url']}", parent="sync")
+
+
+def sync_repositories(
+    project_path: Path,
+    config: dict,
+    agents: list[str],
+    *,
+    jobs: int = DEFAULT_JOBS,
+    per_host: int = DEFAULT_PER_HOST,
+    force: bool = False,
+    lock: dict | None = None,
+    tracker=None
+) -> list[dict]:
+    """Fetch every repository concurrently and install all of its skills or agents.
+
+    Args:
+        project_path: Project to install into
+        config: Repositories from catalog.load_config()
+        agents: AI agent keys whose folders are installed into
+        jobs: Maximum number of repositories processed at once
+        per_host: Maximum number of repositories fetched and installed
+            at once per host
+        force: Reinstall folders even when their files already match
+        lock: phoenix.lock contents; pinned repositories use their commit
+        tracker: Optional StepTracker; the steps of add_steps() are added
+            if missing
+
+    Returns:
+        One dict per repository (config order) with kind, name, url,
+        branch, commit, installed, unchanged, failed (list of
+        {"name", "target", "error"}), bytes, stale, skipped (reason) and
+        error
+    """
+    tasks = [(kind, repo) for kind in KINDS for repo in config[kind]]
+    if tracker is not None:
+        add_steps(tracker, config)
+        tracker.start("sync", f"{len(tasks)} repositor{'ies' if len(tasks) != 1 else 'y'}")
+    host_slots = {}
+    for _, repo in tasks:
+        host_slots.setdefault(repo_host(repo["url"]), threading.BoundedSemaphore(max(1, per_host)))
+
+    def run(kind: str, repo: dict) -> dict:
+        key = step_key(kind, repo)
+        commit = locked_commit(lock, kind, repo["url"], repo["branch"])
+        result = {
+            "kind": kind, "name": repo["name"], "url": repo["url"], "branch": repo["branch"],
+            "commit": commit, "installed": 0, "unchanged": 0, "failed": [], "bytes": 0,
+            "stale": False, "skipped": None, "error": None,
+        }
+        folders = target_folders(project_path, kind, agents)
+        if not folders:
+            result["skipped"] = f"no {kind} folder for the selected agents"
+            if tracker is not None:
+                tracker.skip(key, result["skipped"])
+            return result
+        try:
+            if tracker is not None:
+                tracker.start(key, f"fetching {repo['branch']}" if commit is None else f"pinned {commit[:12]}")
+            # The blobless mirror downloads file contents while installing, so
+            # the host slot covers both; taking it before the mirror lock, in
+            # both calls, keeps repeated repositories from deadlocking
+            with host_slots[repo_host(repo["url"])]:
+                with open_mirror(repo["url"], repo["branch"], commit=commit) as mirror_state:
+                    result["stale"] = mirror_state["stale"]
+                if tracker is not None:
+                    tracker.start(key, "installing")
+                outcome = install_skills(repo, [_ALL], folders, force=force, jobs=COPY_JOBS, commit=commit,
+                                         refresh=False)
+        except RepoError as e:
+            result["error"] = str(e)
+            if tracker is not None:
+                tracker.error(key, result["error"])
+            return result
+
+        result["commit"] = outcome["commit"]
+        for item in outcome["results"]:
+            if item["status"] == "installed":
+                result["installed"] += 1
+                result["bytes"] += item["bytes"]
+            elif item["status"] == "unchanged":
+                result["unchanged"] += 1
+            else:
+                result["failed"].append({"name": item["skill"], "target": item["target"], "error": item["error"]})
+        if tracker is not None:
+            detail = f"{result['installed']} installed, {result['unchanged']} unchanged"
+            if result["stale"]:
+                detail += ", cached (refresh failed)"
+            if result["failed"]:
+                tracker.error(key, f"{detail}, {len(result['failed'])} failed")
+            else:
+                tracker.complete(key, detail, nbytes=result["bytes"])
+        return result
+
+    if tasks:
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(tasks)))) as pool:
+            results = list(pool.map(lambda task: run(*task), tasks))
+    else:
+        results = []
+
+    if tracker is not None:
+        failed = sum(1 for r in results if r["error"] or r["failed"])
+        installed = sum(r["installed"] for r in results)
+        detail = f"{installed} installed across {len(results)} repositor{'ies' if len(results) != 1 else 'y'}"
+        if failed:
+            tracker.error("sync", f"{detail}, {failed} with errors")
+        else:
+            tracker.complete("sync", detail)
+    return results
@@ -1,7 +1,10 @@
 """System utilities and command execution for Phoenix CLI."""
 
-import shutil
+import json
+import os
+import re
 import subprocess
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Tuple
 
@@ -31,16 +34,87 @@ def run_command(cmd: list[str], check_return: bool = True, capture: bool = False
         return None
 
 
-def check_tool(tool: str, tracker: "StepTracker" = None) -> bool:
-    """Check if a tool is installed. Optionally update tracker.
+# Cache for build_path_index(): (PATH string, directory mtimes) -> index
+_path_index_cache: dict = {}
 
-    Args:
-        tool: Name of the tool to check
-        tracker: Optional StepTracker to update with results
 
-    Returns:
-        True if tool is found, False otherwise
+def _path_index_key(path_env: str) -> tuple:
+    """Cache key for a PATH string: the string itself plus each directory's mtime."""
+    mtimes = []
+    for directory in path_env.split(os.pathsep):
+        try:
+            mtimes.append(os.stat(directory).st_mtime_ns if directory else None)
+        except OSError:
+            mtimes.append(None)
+    return path_env, tuple(mtimes)
+
+
+def build_path_index(path_env: str | None = None) -> dict[str, list[str]]:
+    """Index every entry on PATH by scanning each directory once.
+
+    Returns a dict mapping a command name to candidate paths in PATH order.
+    Candidates are not checked for the executable bit here; find_executable()
+    does that only for the names actually looked up. On Windows, only entries
+    ending in a PATHEXT extension are executable; they are indexed lowercased
+    under their full name and their stem (``git.exe`` -> ``git``), and within
+    one directory the candidates follow PATHEXT order, like shutil.which.
+
+    The result is cached and reused until PATH or a directory's mtime changes.
     """
+    if path_env is None:
+        path_env = os.environ.get("PATH", os.defpath)
+
+    key = _path_index_key(path_env)
+    cached = _path_index_cache.get(path_env)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    is_windows = sys.platform == "win32"
+    pathext = [e.lower() for e in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if e]
+
+    index: dict[str, list[str]] = {}
+    seen_dirs = set()
+    for directory in path_env.split(os.pathsep):
+        if not directory or directory in seen_dirs:
+            continue
+        seen_dirs.add(directory)
+        try:
+            with os.scandir(directory) as entries:
+                if not is_windows:
+                    for entry in entries:
+                        index.setdefault(entry.name, []).append(entry.path)
+                    continue
+                # os.access(X_OK) is true for any file on Windows, so an
+                # extensionless sh shim next to gemini.cmd must not match
+                found = []
+                for entry in entries:
+                    name = entry.name.lower()
+                    stem, ext = os.path.splitext(name)
+                    if ext in pathext:
+                        found.append((pathext.index(ext), name, stem, entry.path))
+                for _, name, stem, entry_path in sorted(found):
+                    index.setdefault(name, []).append(entry_path)
+                    index.setdefault(stem, []).append(entry_path)
+        except OSError:
+            # Missing or unreadable PATH entries are ignored, like shutil.which
+            continue
+
+    _path_index_cache.clear()
+    _path_index_cache[path_env] = (key, index)
+    return index
+
+
+def find_executable(tool: str, path_env: str | None = None) -> Optional[str]:
+    """Resolve a tool name to an executable path using the PATH index."""
+    name = tool.lower() if sys.platform == "win32" else tool
+    for candidate in build_path_index(path_env).get(name, []):
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    return None
+
+
+def resolve_tool(tool: str) -> Optional[str]:
+    """Return the executable path for a tool, or None if it is not installed."""
     # Special handling for Claude CLI after `claude migrate-installer`
     # See: https://github.com/dauquangthanh/vinh-phoenix/issues/123
     # The migrate-installer command REMOVES the original executable from PATH
@@ -48,11 +122,22 @@ def check_tool(tool: str, tracker: "StepTracker" = None) -> bool:
     # This path should be prioritized over other claude executables in PATH
     if tool == "claude":
         if CLAUDE_LOCAL_PATH.exists() and CLAUDE_LOCAL_PATH.is_file():
-            if tracker:
-                tracker.complete(tool, "available")
-            return True
+            return str(CLAUDE_LOCAL_PATH)
+
+    return find_executable(tool)
+
 
-    found = shutil.which(tool) is not None
+def check_tool(tool: str, tracker: "StepTracker" = None) -> bool:
+    """Check if a tool is installed. Optionally update tracker.
+
+    Args:
+        tool: Name of the tool to check
+        tracker: Optional StepTracker to update with results
+
+    Returns:
+        True if tool is found, False otherwise
+    """
+    found = resolve_tool(tool) is not None
 
     if tracker:
         if found:
@@ -63,43 +148,322 @@ def check_tool(tool: str, tracker: "StepTracker" = None) -> bool:
     return found
 
 
-def is_git_repo(path: Path = None) -> bool:
-    """Check if the specified path is inside a git repository."""
+_VERSION_RE = re.compile(r"\d+\.\d+(?:\.\d+)?(?:[-+.][0-9A-Za-z.]+)?")
+
+
+def _version_cache_file() -> Path:
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("phoenix-cli")) / "tool-versions.json"
+
+
+def _load_version_cache() -> dict:
+    try:
+        with open(_version_cache_file(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_version_cache(cache: dict) -> None:
+    cache_file = _version_cache_file()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _binary_stamp(path: str) -> Optional[list]:
+    """Return [mtime_ns, size] identifying a specific build of a binary."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _run_version_probe(path: str, timeout: float) -> dict:
+    """Run `<path> --version` and parse the version from its first output line."""
+    try:
+        result = subprocess.run(
+            [path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            stdin=subprocess.DEVNULL,
+        )
+    except subprocess.TimeoutExpired:
+        return {"version": None, "error": f"timed out after {timeout:g}s"}
+    except OSError as e:
+        return {"version": None, "error": str(e)}
+
+    output = (result.stdout or "").strip() or (result.stderr or "").strip()
+    first_line = output.splitlines()[0].strip() if output else ""
+    if result.returncode != 0 and not first_line:
+        return {"version": None, "error": f"exit code {result.returncode}"}
+
+    match = _VERSION_RE.search(first_line)
+    return {"version": match.group(0) if match else (first_line or None), "error": None}
+
+
+def probe_tool_versions(
+    tools: list[str],
+    *,
+    timeout: float = 5.0,
+    max_workers: int = 8,
+    use_cache: bool = True,
+) -> dict[str, dict]:
+    """Resolve tools and probe their versions concurrently.
+
+    Each tool is resolved through resolve_tool() (including CLAUDE_LOCAL_PATH),
+    then `--version` probes run in a thread pool with a per-tool timeout.
+    Successful results are cached on disk keyed by binary path, mtime and size,
+    so unchanged binaries are not executed again.
+
+    Returns:
+        Dict of tool -> {"found", "path", "version", "error", "cached"}
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = _load_version_cache() if use_cache else {}
+    results: dict[str, dict] = {}
+    to_probe: dict[str, str] = {}
+
+    for tool in tools:
+        path = resolve_tool(tool)
+        if path is None:
+            results[tool] = {"found": False, "path": None, "version": None, "error": "not found", "cached": False}
+            continue
+        entry = cache.get(path)
+        if entry and entry.get("stamp") == _binary_stamp(path):
+            results[tool] = {"found": True, "path": path, "version": entry["version"], "error": None, "cached": True}
+        else:
+            to_probe[tool] = path
+
+    if to_probe:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_probe)))) as pool:
+            futures = {tool: pool.submit(_run_version_probe, path, timeout) for tool, path in to_probe.items()}
+            for tool, future in futures.items():
+                path = to_probe[tool]
+                probe = future.result()
+                results[tool] = {"found": True, "path": path, "cached": False, **probe}
+                if use_cache and probe["version"] and not probe["error"]:
+                    cache[path] = {"stamp": _binary_stamp(path), "version": probe["version"]}
+        if use_cache:
+            _save_version_cache(cache)
+
+    return {tool: results[tool] for tool in tools}
+
+
+GIT_STRICT_ENV_VAR = "PHOENIX_GIT_STRICT"
+
+# Cache for git_work_tree(): directory -> work tree root (None: not in a work tree).
+# It lives for one command; phoenix serve clears it before each request
+_git_root_cache: dict[str, Optional[str]] = {}
+
+
+def clear_git_cache() -> None:
+    """Forget every git_work_tree() result (e.g. after running git init)."""
+    _git_root_cache.clear()
+
+
+def _git_dir_at(dot_git: str) -> Optional[str]:
+    """The git directory a .git entry points to, or None if it is not a valid one.
+
+    A .git directory is a regular repository; a .git file ("gitdir: <path>",
+    relative to the file's directory) is a linked worktree or a submodule.
+    """
+    try:
+        if os.path.isdir(dot_git):
+            git_dir = dot_git
+        elif os.path.isfile(dot_git):
+            with open(dot_git, "r", encoding="utf-8") as f:
+                line = f.readline().strip()
+            if not line.startswith("gitdir:"):
+                return None
+            git_dir = os.path.join(os.path.dirname(dot_git), line[len("gitdir:"):].strip())
+        else:
+            return None
+    except OSError:
+        return None
+    return git_dir if os.path.isfile(os.path.join(git_dir, "HEAD")) else None
+
+
+def git_work_tree(path: Path = None) -> Optional[Path]:
+    """Top of the git work tree containing path, found without running git.
+
+    Walks up from path looking for a .git directory or gitdir file (see
+    _git_dir_at()). Every directory visited is cached, so discovering many
+    projects under one workspace costs a few stat calls each. Paths inside
+    a .git directory are not in a work tree, matching git.
+
+    Returns:
+        The work tree root, or None if path is not inside one
+    """
+    requested = os.path.abspath(path or os.getcwd())
+    if requested in _git_root_cache:
+        root = _git_root_cache[requested]
+        return Path(root) if root else None
+
+    current = os.path.realpath(requested)
+    visited = [requested]
+    root = None
+    if ".git" not in current.split(os.sep):
+        while True:
+            if current in _git_root_cache:
+                root = _git_root_cache[current]
+                break
+            visited.append(current)
+            if _git_dir_at(os.path.join(current, ".git")) is not None:
+                root = current
+                break
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
+    for directory in visited:
+        _git_root_cache[directory] = root
+    return Path(root) if root else None
+
+
+def is_git_repo(path: Path = None, *, strict: bool = False) -> bool:
+    """Check if the specified path is inside a git repository.
+
+    The check is a cached filesystem lookup (git_work_tree()). With strict,
+    PHOENIX_GIT_STRICT=1, or GIT_DIR/GIT_WORK_TREE set (which only git can
+    interpret), it asks ``git rev-parse --is-inside-work-tree`` instead.
+    """
     if path is None:
         path = Path.cwd()
 
     if not path.is_dir():
         return False
 
+    strict = (strict or os.environ.get(GIT_STRICT_ENV_VAR, "").lower() in ("1", "true", "yes")
+              or "GIT_DIR" in os.environ or "GIT_WORK_TREE" in os.environ)
+    if not strict:
+        return git_work_tree(path) is not None
+
     try:
         # Use git command to check if inside a work tree
-        subprocess.run(
+        result = subprocess.run(
             ["git", "rev-parse", "--is-inside-work-tree"],
             check=True,
             capture_output=True,
+            text=True,
             cwd=path,
         )
-        return True
+        # Inside a .git directory git succeeds but prints "false"
+        return result.stdout.strip() == "true"
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
-def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Optional[str]]:
+def phoenix_paths(project_path: Path, agents: list[str]) -> list[str]:
+    """Project-relative paths Phoenix writes for these agents (only those that exist).
+
+    Covers each agent's skills, commands, prompts and agents folders plus
+    nightlife.yaml and phoenix.lock, i.e. what a scoped commit stages.
+    """
+    from .config import AGENT_CONFIG, AGENTS_FOLDER_MAP
+
+    candidates = []
+    for agent in agents:
+        config = AGENT_CONFIG[agent]
+        candidates += [config["skills_folder"], config["agent_folder"], config.get("prompts_folder"),
+                       AGENTS_FOLDER_MAP.get(agent)]
+    candidates += ["nightlife.yaml", "phoenix.lock"]
+    paths = []
+    for candidate in dict.fromkeys(c.rstrip("/") for c in candidates if c):
+        if (project_path / candidate).exists():
+            paths.append(candidate)
+    return paths
+
+
+def _git_run(args: list[str], cwd: Path, input: str | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *args], check=True, capture_output=True, text=True, cwd=cwd, input=input)
+
+
+def _commit_paths(project_path: Path, paths: list[str], message: str) -> None:
+    """Stage and commit only paths, passed to git in bulk through --pathspec-from-file.
+
+    Nothing outside paths is hashed, and changes the user already staged
+    elsewhere stay staged (a commit with a pathspec only takes those paths).
+    """
+    import tempfile
+
+    # Paths a .gitignore excludes would make `git add` fail
+    ignored = subprocess.run(
+        ["git", "check-ignore", "-z", "--stdin"], capture_output=True, text=True, cwd=project_path,
+        input="\0".join(paths),
+    ).stdout.split("\0")
+    paths = [path for path in paths if path not in ignored]
+    if not paths:
+        return
+
+    fd, spec_file = tempfile.mkstemp(prefix="phoenix-pathspec-")
+    os.close(fd)
+
+    def write_spec(spec_paths: list[str]) -> None:
+        with open(spec_file, "w", encoding="utf-8") as f:
+            f.write("\0".join(spec_paths))
+
+    try:
+        write_spec(paths)
+        pathspec = [f"--pathspec-from-file={spec_file}", "--pathspec-file-nul"]
+        _git_run(["add", *pathspec], project_path)
+
+        # `git add` skips empty folders and folders holding only ignored files,
+        # but `git commit` fails on a pathspec matching nothing in the index.
+        # ls-files has no --pathspec-from-file; phoenix_paths() is a short list
+        indexed = _git_run(["ls-files", "-z", "--cached", "--", *paths], project_path).stdout.split("\0")
+        paths = [path for path in paths
+                 if any(name == path or name.startswith(path + "/") for name in indexed if name)]
+        if not paths:
+            return
+        write_spec(paths)
+        try:
+            _git_run(["commit", "-m", message, *pathspec], project_path)
+        except subprocess.CalledProcessError as e:
+            # "nothing to commit" / "nothing added to commit": Phoenix's files are already committed
+            if "nothing" not in (e.stdout or "") and "no changes added" not in (e.stdout or ""):
+                raise
+    finally:
+        os.unlink(spec_file)
+
+
+def init_git_repo(project_path: Path, quiet: bool = False,
+                  message: str = "Initial commit from Phoenix template", *,
+                  paths: Optional[list[str]] = None, existing: bool = False) -> Tuple[bool, Optional[str]]:
     """Initialize a git repository in the specified path.
 
     Args:
         project_path: Path to initialize git repository in
         quiet: if True suppress console output (tracker handles status)
+        message: Message of the initial commit
+        paths: Stage and commit only these project-relative paths (see
+            phoenix_paths()) instead of running `git add .` on the whole tree
+        existing: Commit paths into the repository that already contains
+            project_path instead of running `git init`
 
     Returns:
         Tuple of (success: bool, error_message: Optional[str])
     """
     try:
         if not quiet:
-            console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True, text=True, cwd=project_path)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True, cwd=project_path)
-        subprocess.run(["git", "commit", "-m", "Initial commit from Phoenix template"], check=True, capture_output=True, text=True, cwd=project_path)
+            console.print("[cyan]Committing to git repository...[/cyan]" if existing else "[cyan]Initializing git repository...[/cyan]")
+        if not existing:
+            subprocess.run(["git", "init"], check=True, capture_output=True, text=True, cwd=project_path)
+            clear_git_cache()
+        if paths is None:
+            subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True, cwd=project_path)
+            subprocess.run(["git", "commit", "-m", message], check=True, capture_output=True, text=True, cwd=project_path)
+        else:
+            _commit_paths(project_path, paths, message)
         if not quiet:
             console.print("[green]✓[/green] Git repository initialized")
         return True, None
@@ -1,21 +1,122 @@
 """Template operations for Phoenix CLI."""
 
 import json
+import os
 import shutil
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Tuple
 
 import httpx
 
 from .config import AGENT_CONFIG
-from .github import download_template_from_github
+from .github import get_http_client
+from .sources import ReleaseSource, download_release, resolve_sources
 from .ui import console
 
 if TYPE_CHECKING:
+    from .api import ReleaseCache
     from .ui import StepTracker
 
+# Set by `phoenix serve` so downloads and extraction are shared across requests
+_release_cache: "ReleaseCache | None" = None
+
+
+def set_release_cache(cache: "ReleaseCache | None") -> None:
+    """Serve release downloads (and extracted trees) from a long-lived cache."""
+    global _release_cache
+    _release_cache = cache
+
+
+def copy_tree(src: Path, dst: Path, *, dirs_exist_ok: bool = True) -> Tuple[int, int]:
+    """Copy a directory tree like shutil.copytree, counting what was copied.
+
+    Returns:
+        Tuple of (files_copied, bytes_copied)
+    """
+    files = 0
+    total_bytes = 0
+
+    def _copy(src_file, dst_file):
+        nonlocal files, total_bytes
+        shutil.copy2(src_file, dst_file)
+        files += 1
+        total_bytes += os.path.getsize(dst_file)
+
+    shutil.copytree(src, dst, dirs_exist_ok=dirs_exist_ok, copy_function=_copy)
+    return files, total_bytes
+
+
+def detect_existing_agents(project_path: Path) -> list[Tuple[str, str, str]]:
+    """Detect installed agent root folders in a project.
+
+    Returns the root/parent folder of each agent (e.g. ".claude" for
+    ".claude/commands/"), deduplicated so agents sharing a root (".github"
+    holds both agents/ and prompts/) are listed once.
+
+    Returns:
+        List of (agent_key, agent_name, root_folder) tuples
+    """
+    existing_agents = []
+    detected_roots = set()
+    for agent_key, agent_config in AGENT_CONFIG.items():
+        # Extract root/parent folder from the full path
+        # E.g., ".claude" from ".claude/commands/"
+        # E.g., ".github" from ".github/agents/"
+        root_folder = Path(agent_config["agent_folder"]).parts[0]
+        root_folder_path = project_path / root_folder
+
+        # Only add if root folder exists and hasn't been added yet
+        # This ensures we backup parent directories (.claude/, .github/), not subfolders
+        if root_folder_path.exists() and root_folder not in detected_roots:
+            detected_roots.add(root_folder)
+            existing_agents.append((agent_key, agent_config["name"], root_folder))
+    return existing_agents
+
+
+def backup_agent_folders(
+    project_path: Path,
+    existing_agents: list[Tuple[str, str, str]],
+    timestamp: str,
+    tracker: "StepTracker | None" = None
+) -> dict:
+    """Back up agent root folders (and the Jules root-level skills folder) before an upgrade.
+
+    Bytes copied are added to the tracker's "backup" step when a tracker is given.
+
+    Returns:
+        Dict mapping the original folder name to its backup path
+    """
+    backup_paths = {}
+
+    # Backup Jules root-level skills folder (special case)
+    jules_skills = project_path / "skills"
+    if jules_skills.exists():
+        backup_jules_skills = project_path / f"skills.backup.{timestamp}"
+        _, nbytes = copy_tree(jules_skills, backup_jules_skills, dirs_exist_ok=False)
+        if tracker:
+            tracker.add_bytes("backup", nbytes)
+        backup_paths["skills"] = backup_jules_skills
+
+    # Backup existing agent folders (parent/root folders, not subfolders)
+    # This backs up entire parent directories like .github/, .claude/, .cursor/
+    # NOT just subfolders like .github/agents/ or .claude/commands/
+    for _, _, agent_folder in existing_agents:
+        source_folder = project_path / agent_folder
+        if source_folder.exists():
+            # agent_folder is already the root (e.g., ".github", ".claude")
+            # Remove trailing slash/backslash for backup name (cross-platform)
+            folder_name = agent_folder.rstrip('/\\')
+            backup_folder = project_path / f"{folder_name}.backup.{timestamp}"
+            # Copy entire parent directory tree
+            _, nbytes = copy_tree(source_folder, backup_folder, dirs_exist_ok=False)
+            if tracker:
+                tracker.add_bytes("backup", nbytes)
+            backup_paths[agent_folder] = backup_folder
+
+    return backup_paths
+
 
 def handle_vscode_settings(sub_item, dest_file, rel_path, verbose=False, tracker=None) -> None:
     """Handle merging or copying of .vscode/settings.json files."""
@@ -86,6 +187,36 @@ def merge_json_files(existing_path: Path, new_content: dict, verbose: bool = Fal
     return merged
 
 
+def _render_agent_commands(
+    template_root: Path,
+    project_path: Path,
+    ai_assistant: str,
+    tracker: "StepTracker | None",
+    parent: str
+) -> dict | None:
+    """Render the template's commands/ for one agent (see render.py); None if it has none."""
+    from .render import has_commands, render_commands
+
+    if not has_commands(template_root):
+        return None
+    key = f"{parent}-commands"
+    if tracker:
+        tracker.add(key, f"Render commands to {AGENT_CONFIG[ai_assistant]['agent_folder']}", parent=parent)
+        tracker.start(key)
+    try:
+        stats = render_commands(template_root, project_path, [ai_assistant])
+    except Exception as e:
+        if tracker:
+            tracker.error(key, str(e))
+        raise
+    if tracker:
+        detail = f"{stats['written']} written, {stats['unchanged']} unchanged"
+        if stats["removed"]:
+            detail += f", {stats['removed']} removed"
+        tracker.complete(key, detail, nbytes=stats["bytes"])
+    return stats
+
+
 def copy_local_template(
     project_path: Path,
     source_path: Path,
@@ -121,6 +252,8 @@ def copy_local_template(
     skills_folder = agent_config["skills_folder"]
 
     # Shared .phoenix folder is no longer used - all functionality is now in skills
+    copied_files = 0
+    copied_bytes = 0
 
     # Copy skills to agent-specific skills folder
     if skills_dir.exists():
@@ -133,11 +266,17 @@ def copy_local_template(
         for skill_item in skills_dir.iterdir():
             if skill_item.is_dir():
                 dest_skill = skills_path / skill_item.name
-                shutil.copytree(skill_item, dest_skill, dirs_exist_ok=True)
+                files, nbytes = copy_tree(skill_item, dest_skill)
+                copied_files += files
+                copied_bytes += nbytes
 
         if verbose and not tracker:
             console.print(f"[green]✓[/green] Created {ai_assistant} skills in {skills_folder}")
 
+    commands = _render_agent_commands(source_path, project_path, ai_assistant, tracker, f"copy-{ai_assistant}")
+    if commands and verbose and not tracker:
+        console.print(f"[green]✓[/green] Rendered {commands['templates']} {ai_assistant} commands in {agent_folder}")
+
     # Copy nightlife.yaml to project root (only once, for the first agent)
     if is_first_agent:
         nightlife_yaml = source_path / "nightlife.yaml"
@@ -149,11 +288,129 @@ def copy_local_template(
     # Agent-specific configurations are now handled within skills
 
     if tracker:
-        tracker.complete(f"copy-{ai_assistant}", "templates copied")
+        tracker.complete(f"copy-{ai_assistant}", f"templates copied, {copied_files} files", nbytes=copied_bytes)
 
     return project_path
 
 
+def extract_release(zip_path: Path, dest_dir: Path) -> Path:
+    """Extract a release zip once and return its template root (the folder holding skills/).
+
+    The result has the same layout as a local template directory, so it can
+    be installed into any number of projects with copy_local_template()
+    without decompressing the archive again.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        zip_ref.extractall(dest_dir)
+
+    if (dest_dir / "skills").is_dir():
+        return dest_dir
+    # A single wrapper directory containing skills/
+    items = list(dest_dir.iterdir())
+    if len(items) == 1 and (items[0] / "skills").is_dir():
+        return items[0]
+    raise FileNotFoundError("Skills directory not found in archive")
+
+
+def _fetch_template_zip(
+    ai_assistant: str,
+    download_dir: Path,
+    *,
+    verbose: bool,
+    tracker: "StepTracker | None",
+    client: httpx.Client,
+    debug: bool,
+    github_token: str,
+    sources: list[ReleaseSource] | None = None
+) -> Tuple[Path, dict]:
+    """Download the release zip, reporting fetch and download steps to the tracker.
+
+    Sources are tried in order (see sources.py); by default that is
+    PHOENIX_RELEASE_SOURCES if set, otherwise GitHub alone.
+
+    Returns:
+        Tuple of (zip_path, metadata) as returned by download_release()
+    """
+    fetch_key = f"fetch-{ai_assistant}"
+    download_key = f"download-{ai_assistant}"
+    if sources is None:
+        sources = resolve_sources(github_token=github_token)
+    if client is None and any(s.remote for s in sources):
+        client = get_http_client()
+
+    def on_release(meta: dict):
+        via = f" via {meta['source']}" if meta["source"] != "github" or meta["failed_sources"] else ""
+        if tracker:
+            tracker.complete(fetch_key, f"release {meta['release']} ({meta['size']:,} bytes){via}")
+            tracker.add(download_key, "Download template")
+            tracker.start(download_key, meta['filename'])
+        elif verbose:
+            for failure in meta["failed_sources"]:
+                console.print(f"[yellow]Source {failure['source']} failed, trying next:[/yellow] {failure['error']}")
+            console.print(f"[cyan]Found template:[/cyan] {meta['filename']} ({meta['size']:,} bytes), "
+                          f"release {meta['release']}{via}")
+
+    if tracker:
+        tracker.start(fetch_key, "resolving release from " + ", ".join(s.name for s in sources))
+    elif verbose:
+        console.print("[cyan]Fetching latest release information...[/cyan]")
+    try:
+        zip_path, meta = download_release(
+            sources,
+            download_dir,
+            client=client,
+            show_progress=(tracker is None),
+            debug=debug,
+            on_release=on_release
+        )
+        if tracker:
+            tracker.complete(download_key, meta['filename'], nbytes=zip_path.stat().st_size)
+        elif verbose:
+            console.print(f"Downloaded: {meta['filename']}")
+    except Exception as e:
+        if tracker:
+            failed_key = download_key if tracker.duration(download_key) is not None else fetch_key
+            tracker.error(failed_key, str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error downloading template:[/red] {e}")
+        raise
+    return zip_path, meta
+
+
+def _install_from_release_cache(
+    project_path: Path,
+    ai_assistant: str,
+    is_current_dir: bool,
+    *,
+    tracker: "StepTracker | None",
+    client: httpx.Client,
+    debug: bool,
+    github_token: str,
+    sources: list[ReleaseSource] | None,
+    is_first_agent: bool
+) -> Path:
+    """Install from the warm release cache: no download and no decompression once warm."""
+    fetch_key = f"fetch-{ai_assistant}"
+    if tracker:
+        tracker.start(fetch_key, "warm release cache")
+    try:
+        zip_path, meta = _release_cache.get(sources or resolve_sources(github_token=github_token),
+                                            client=client, debug=debug)
+        template_root = _release_cache.extracted(zip_path)
+    except Exception as e:
+        if tracker:
+            tracker.error(fetch_key, str(e))
+        raise
+    if tracker:
+        tracker.complete(fetch_key, f"release {meta['release']} (warm cache)")
+        tracker.skip(f"download-{ai_assistant}", "served from cache")
+        tracker.add(f"copy-{ai_assistant}", f"Copy {ai_assistant} skills")
+        tracker.start(f"copy-{ai_assistant}")
+    return copy_local_template(project_path, template_root, ai_assistant, is_current_dir,
+                               False, tracker, is_first_agent)
+
+
 def download_and_extract_template(
     project_path: Path,
     ai_assistant: str,
@@ -166,11 +423,22 @@ def download_and_extract_template(
     github_token: str = None,
     local_templates: bool = False,
     template_path: str = None,
-    is_first_agent: bool = True
+    is_first_agent: bool = True,
+    bundle_path: str = None,
+    sources: list[ReleaseSource] | None = None,
+    release_zip: Path | None = None,
+    downloaded: list[Path] | None = None
 ) -> Path:
     """Download the latest release and extract it to create a new project.
     Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
     If local_templates is True, copies from local template_path instead of downloading.
+    If bundle_path is given, the release asset is read from that offline bundle
+    (memory-mapped, see bundle.py) and no network access happens.
+    If release_zip is given, that already downloaded release zip is extracted
+    and the fetch/download steps are left to the caller. Otherwise the zip
+    comes from the first of sources (see sources.py) that delivers it; when
+    downloaded is given, a zip this call placed in the current directory is
+    appended to it for the caller to remove (never a local source's own file).
     
     The unified phoenix-skills zip is downloaded once (on first agent) and skills are copied 
     to the appropriate AI-specific folder for each agent.
@@ -202,33 +470,29 @@ def download_and_extract_template(
         return copy_local_template(project_path, source_path, ai_assistant, is_current_dir, verbose, tracker, is_first_agent)
 
     # Download logic - only download zip file once for the first agent
-    zip_path = None
-    if is_first_agent:
-        # Original GitHub download logic - download the unified skills zip
+    zip_path = release_zip
+    bundle = None
+    if zip_path is None and bundle_path:
+        from .bundle import open_bundle
+
         if tracker:
-            tracker.start(f"fetch-{ai_assistant}", "contacting GitHub API")
+            tracker.start(f"fetch-{ai_assistant}", "opening bundle")
         try:
-            zip_path, meta = download_template_from_github(
-                ai_assistant,
-                current_dir,
-                verbose=verbose and tracker is None,
-                show_progress=(tracker is None),
-                client=client,
-                debug=debug,
-                github_token=github_token
-            )
-            if tracker:
-                tracker.complete(f"fetch-{ai_assistant}", f"release {meta['release']} ({meta['size']:,} bytes)")
-                tracker.add(f"download-{ai_assistant}", "Download template")
-                tracker.complete(f"download-{ai_assistant}", meta['filename'])
+            bundle = open_bundle(bundle_path)
+            if is_first_agent:
+                bundle.verify()
         except Exception as e:
+            if bundle is not None:
+                bundle.close()
             if tracker:
                 tracker.error(f"fetch-{ai_assistant}", str(e))
-            else:
-                if verbose:
-                    console.print(f"[red]Error downloading template:[/red] {e}")
             raise
-    else:
+        # zipfile reads the asset straight out of the memory-mapped bundle
+        zip_path = bundle.asset_file()
+        if tracker:
+            tracker.complete(f"fetch-{ai_assistant}", f"bundle release {bundle.release['tag']}")
+            tracker.skip(f"download-{ai_assistant}", "offline bundle")
+    elif zip_path is None and not is_first_agent:
         # For subsequent agents, reuse the already downloaded zip
         # Look for phoenix-skills-*.zip in current directory
         zip_files = list(current_dir.glob("phoenix-skills-*.zip"))
@@ -238,31 +502,24 @@ def download_and_extract_template(
                 tracker.start(f"fetch-{ai_assistant}")
                 tracker.complete(f"fetch-{ai_assistant}", "using cached zip")
                 tracker.complete(f"download-{ai_assistant}", "reused from first agent")
-        else:
-            # If not found, download it (shouldn't happen in normal flow)
-            if tracker:
-                tracker.start(f"fetch-{ai_assistant}", "contacting GitHub API")
-            try:
-                zip_path, meta = download_template_from_github(
-                    ai_assistant,
-                    current_dir,
-                    verbose=verbose and tracker is None,
-                    show_progress=(tracker is None),
-                    client=client,
-                    debug=debug,
-                    github_token=github_token
-                )
-                if tracker:
-                    tracker.complete(f"fetch-{ai_assistant}", f"release {meta['release']} ({meta['size']:,} bytes)")
-                    tracker.add(f"download-{ai_assistant}", "Download template")
-                    tracker.complete(f"download-{ai_assistant}", meta['filename'])
-            except Exception as e:
-                if tracker:
-                    tracker.error(f"fetch-{ai_assistant}", str(e))
-                else:
-                    if verbose:
-                        console.print(f"[red]Error downloading template:[/red] {e}")
-                raise
+
+    if zip_path is None and _release_cache is not None:
+        return _install_from_release_cache(
+            project_path, ai_assistant, is_current_dir,
+            tracker=tracker, client=client, debug=debug, github_token=github_token,
+            sources=sources, is_first_agent=is_first_agent
+        )
+
+    if zip_path is None:
+        # Download the unified skills zip (first agent, or cached zip not found)
+        zip_path, meta = _fetch_template_zip(
+            ai_assistant, current_dir,
+            verbose=verbose, tracker=tracker, client=client,
+            debug=debug, github_token=github_token, sources=sources
+        )
+        source_file = meta.get("path")
+        if downloaded is not None and not (source_file and Path(source_file).resolve() == zip_path.resolve()):
+            downloaded.append(zip_path)
 
     if tracker:
         tracker.add(f"extract-{ai_assistant}", "Extract and copy skills")
@@ -292,7 +549,14 @@ def download_and_extract_template(
             # Extract to temp directory and then copy skills to agent-specific folder
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir)
+                unzip_key = f"extract-{ai_assistant}-unzip"
+                if tracker:
+                    tracker.add(unzip_key, "Unzip archive", parent=f"extract-{ai_assistant}")
+                    tracker.start(unzip_key)
                 zip_ref.extractall(temp_path)
+                if tracker:
+                    uncompressed = sum(info.file_size for info in zip_ref.infolist())
+                    tracker.complete(unzip_key, f"{len(zip_contents)} entries", nbytes=uncompressed)
 
                 extracted_items = list(temp_path.iterdir())
                 if tracker and is_first_agent:
@@ -322,14 +586,29 @@ def download_and_extract_template(
                 skills_target.mkdir(parents=True, exist_ok=True)
 
                 # Copy all skill subdirectories to the target location
+                copy_key = f"extract-{ai_assistant}-copy"
+                if tracker:
+                    tracker.add(copy_key, f"Copy skills to {skills_folder}", parent=f"extract-{ai_assistant}")
+                    tracker.start(copy_key)
+                copied_files = 0
                 for skill_item in skills_source.iterdir():
                     if skill_item.is_dir():
                         dest_skill = skills_target / skill_item.name
-                        shutil.copytree(skill_item, dest_skill, dirs_exist_ok=True)
+                        files, nbytes = copy_tree(skill_item, dest_skill)
+                        copied_files += files
+                        if tracker:
+                            tracker.add_bytes(copy_key, nbytes)
+                if tracker:
+                    tracker.complete(copy_key, f"{copied_files} files")
 
                 if verbose and not tracker:
                     console.print(f"[cyan]Skills copied to {skills_folder}[/cyan]")
 
+                commands = _render_agent_commands(skills_source.parent, project_path, ai_assistant,
+                                                  tracker, f"extract-{ai_assistant}")
+                if commands and verbose and not tracker:
+                    console.print(f"[cyan]Commands rendered to {agent_config['agent_folder']}[/cyan]")
+
                 # Copy nightlife.yaml to project root (only once, for the first agent)
                 if is_first_agent:
                     # Look for nightlife.yaml at the same level as skills/
@@ -356,5 +635,8 @@ def download_and_extract_template(
     else:
         if tracker:
             tracker.complete(f"extract-{ai_assistant}")
+    finally:
+        if bundle is not None:
+            bundle.close()
 
     return project_path
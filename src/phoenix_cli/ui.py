@@ -1,12 +1,12 @@
 """UI components and interactive elements for Phoenix CLI."""
 
 import sys
+import time
+from pathlib import Path
 
-import readchar
 import typer
 from rich.align import Align
 from rich.console import Console
-from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -18,29 +18,78 @@ from .config import BANNER, TAGLINE
 console = Console()
 
 
+def format_bytes(num: int) -> str:
+    """Format a byte count for display (e.g. 1.2 MB)."""
+    size = float(num)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{int(size)} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration for display (e.g. 850ms, 2.4s)."""
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    return f"{seconds:.1f}s"
+
+
+# Frames per second for live step trees; updates between frames are coalesced
+LIVE_REFRESH_RATE = 10
+
+_PLAIN_STATUS = {"running": "start", "done": "done", "error": "error", "skipped": "skip"}
+
+
+def use_plain_output() -> bool:
+    """Whether to print progress as plain lines instead of a live tree (not a terminal, or TERM=dumb)."""
+    return not console.is_terminal or console.is_dumb_terminal
+
+
 class StepTracker:
     """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
     Supports live auto-refresh via an attached refresh callback.
+
+    Each step records monotonic start/end times and an optional byte count, and
+    may be nested under a parent step. Durations are shown in the rendered tree
+    and the whole run can be exported as Chrome trace-event JSON.
+
+    The tracker is itself a Rich renderable: pass it to Live and the tree is
+    rebuilt at most once per frame, and only when a step changed. Outside a
+    terminal, attach_log() prints one plain line per status change instead.
     """
     def __init__(self, title: str):
         self.title = title
-        self.steps = []  # list of dicts: {key, label, status, detail}
+        self.steps = []  # list of dicts: {key, label, status, detail, parent, start, end, bytes}
+        self._index = {}  # key -> step dict in self.steps
         self.status_order = {"pending": 0, "running": 1, "done": 2, "error": 3, "skipped": 4}
         self._refresh_cb = None  # callable to trigger UI refresh
-
-    def attach_refresh(self, cb):
+        self._refresh_interval = 0.0
+        self._last_refresh = 0.0
+        self._dirty = False  # a change has not reached the refresh callback yet
+        self._log_cb = None  # callable receiving plain progress lines
+        self._version = 0  # bumped on every change; keys the cached tree
+        self._rendered = None  # (version, Tree)
+        self._origin = time.perf_counter()  # reference point for trace timestamps
+
+    def attach_refresh(self, cb, min_interval: float = 1 / LIVE_REFRESH_RATE):
+        """Call cb after changes, at most once per min_interval seconds (see flush())."""
         self._refresh_cb = cb
+        self._refresh_interval = min_interval
+
+    def attach_log(self, cb):
+        """Call cb with a plain one-line description of every status change."""
+        self._log_cb = cb
 
-    def add(self, key: str, label: str):
-        if key not in [s["key"] for s in self.steps]:
-            self.steps.append({"key": key, "label": label, "status": "pending", "detail": ""})
-            self._maybe_refresh()
+    def add(self, key: str, label: str, parent: str | None = None):
+        if key not in self._index:
+            self._append(self._new_step(key, label, "pending", "", parent))
+            self._changed()
 
     def start(self, key: str, detail: str = ""):
         self._update(key, status="running", detail=detail)
 
-    def complete(self, key: str, detail: str = ""):
-        self._update(key, status="done", detail=detail)
+    def complete(self, key: str, detail: str = "", nbytes: int | None = None):
+        self._update(key, status="done", detail=detail, nbytes=nbytes)
 
     def error(self, key: str, detail: str = ""):
         self._update(key, status="error", detail=detail)
@@ -48,64 +97,210 @@ class StepTracker:
     def skip(self, key: str, detail: str = ""):
         self._update(key, status="skipped", detail=detail)
 
-    def _update(self, key: str, status: str, detail: str):
-        for s in self.steps:
-            if s["key"] == key:
-                s["status"] = status
-                if detail:
-                    s["detail"] = detail
-                self._maybe_refresh()
-                return
-
-        self.steps.append({"key": key, "label": key, "status": status, "detail": detail})
+    def add_bytes(self, key: str, nbytes: int):
+        """Add to the byte count of a step (e.g. per-file copy totals)."""
+        step = self._index.get(key)
+        if step is not None:
+            step["bytes"] = (step["bytes"] or 0) + nbytes
+            # Byte counts only show once the step ends, so no refresh is needed
+            self._version += 1
+
+    def _new_step(self, key: str, label: str, status: str, detail: str, parent: str | None) -> dict:
+        return {
+            "key": key,
+            "label": label,
+            "status": status,
+            "detail": detail,
+            "parent": parent,
+            "start": None,
+            "end": None,
+            "bytes": None,
+        }
+
+    def _append(self, step: dict):
+        self.steps.append(step)
+        self._index[step["key"]] = step
+
+    def _stamp(self, step: dict, status: str):
+        now = time.perf_counter()
+        if status == "running":
+            if step["start"] is None:
+                step["start"] = now
+            step["end"] = None
+        elif status != "pending":
+            if step["start"] is None:
+                step["start"] = now
+            step["end"] = now
+
+    def _update(self, key: str, status: str, detail: str, nbytes: int | None = None):
+        step = self._index.get(key)
+        if step is None:
+            step = self._new_step(key, key, status, detail, None)
+            self._append(step)
+        step["status"] = status
+        if detail:
+            step["detail"] = detail
+        if nbytes is not None:
+            step["bytes"] = nbytes
+        self._stamp(step, status)
+        if self._log_cb:
+            self._log(step)
+        self._changed()
+
+    def _changed(self):
+        self._version += 1
+        self._dirty = True
         self._maybe_refresh()
 
     def _maybe_refresh(self):
-        if self._refresh_cb:
-            try:
-                self._refresh_cb()
-            except Exception:
-                pass
+        if not self._refresh_cb:
+            return
+        now = time.perf_counter()
+        if now - self._last_refresh < self._refresh_interval:
+            return  # coalesced into the next refresh or flush()
+        self.flush()
+
+    def flush(self):
+        """Deliver a pending change to the refresh callback immediately."""
+        if not (self._refresh_cb and self._dirty):
+            return
+        self._dirty = False
+        self._last_refresh = time.perf_counter()
+        try:
+            self._refresh_cb()
+        except Exception:
+            pass
+
+    def _log(self, step: dict):
+        depth = 0
+        parent = step["parent"]
+        while parent in self._index and depth < 8:
+            depth += 1
+            parent = self._index[parent]["parent"]
+        line = f"{'  ' * depth}{_PLAIN_STATUS.get(step['status'], step['status']):<5} {step['label']}"
+        detail = self._detail_text(step)
+        if detail:
+            line += f" ({detail})"
+        try:
+            self._log_cb(line)
+        except Exception:
+            pass
+
+    def duration(self, key: str) -> float | None:
+        """Return the elapsed seconds of a step (so far, if still running)."""
+        step = self._index.get(key)
+        if step is None or step["start"] is None:
+            return None
+        return (step["end"] if step["end"] is not None else time.perf_counter()) - step["start"]
+
+    def _detail_text(self, step: dict) -> str:
+        detail_text = step["detail"].strip() if step["detail"] else ""
+
+        # Append byte counts and timing for steps that took measurable time (>= 1ms)
+        extras = []
+        if step["bytes"]:
+            extras.append(format_bytes(step["bytes"]))
+        if step["start"] is not None and step["end"] is not None and step["end"] - step["start"] >= 0.001:
+            extras.append(format_duration(step["end"] - step["start"]))
+        if extras:
+            detail_text = ", ".join([detail_text, *extras]) if detail_text else ", ".join(extras)
+        return detail_text
+
+    def _render_line(self, step: dict) -> str:
+        label = step["label"]
+        detail_text = self._detail_text(step)
+
+        status = step["status"]
+        if status == "done":
+            symbol = "[green]●[/green]"
+        elif status == "pending":
+            symbol = "[green dim]○[/green dim]"
+        elif status == "running":
+            symbol = "[cyan]○[/cyan]"
+        elif status == "error":
+            symbol = "[red]●[/red]"
+        elif status == "skipped":
+            symbol = "[yellow]○[/yellow]"
+        else:
+            symbol = " "
+
+        if status == "pending":
+            # Entire line light gray (pending)
+            if detail_text:
+                return f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
+            return f"{symbol} [bright_black]{label}[/bright_black]"
+        # Label white, detail (if any) light gray in parentheses
+        if detail_text:
+            return f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
+        return f"{symbol} [white]{label}[/white]"
 
     def render(self):
+        """Return the step tree; rebuilt only when a step changed since the last call."""
+        cached = self._rendered
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        version = self._version
         tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
-        for step in self.steps:
-            label = step["label"]
-            detail_text = step["detail"].strip() if step["detail"] else ""
-
-            status = step["status"]
-            if status == "done":
-                symbol = "[green]●[/green]"
-            elif status == "pending":
-                symbol = "[green dim]○[/green dim]"
-            elif status == "running":
-                symbol = "[cyan]○[/cyan]"
-            elif status == "error":
-                symbol = "[red]●[/red]"
-            elif status == "skipped":
-                symbol = "[yellow]○[/yellow]"
-            else:
-                symbol = " "
-
-            if status == "pending":
-                # Entire line light gray (pending)
-                if detail_text:
-                    line = f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [bright_black]{label}[/bright_black]"
-            else:
-                # Label white, detail (if any) light gray in parentheses
-                if detail_text:
-                    line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [white]{label}[/white]"
-
-            tree.add(line)
+        nodes = {}
+        for step in list(self.steps):
+            parent = step["parent"]
+            branch = nodes.get(parent, tree) if parent in self._index else tree
+            nodes[step["key"]] = branch.add(self._render_line(step))
+        self._rendered = (version, tree)
         return tree
 
+    def __rich__(self):
+        return self.render()
+
+    def to_chrome_trace(self) -> dict:
+        """Export recorded steps as Chrome trace-event / Perfetto JSON.
+
+        Each timed step becomes a complete ("X") event; substeps nest under
+        their parent by time range. Timestamps are microseconds since the
+        tracker was created.
+        """
+        import os
+
+        pid = os.getpid()
+        events = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": self.title}},
+        ]
+        for step in self.steps:
+            if step["start"] is None:
+                continue
+            end = step["end"] if step["end"] is not None else time.perf_counter()
+            args = {"key": step["key"], "status": step["status"]}
+            if step["detail"]:
+                args["detail"] = step["detail"]
+            if step["parent"]:
+                args["parent"] = step["parent"]
+            if step["bytes"] is not None:
+                args["bytes"] = step["bytes"]
+            events.append({
+                "name": step["label"],
+                "cat": "phoenix",
+                "ph": "X",
+                "ts": round((step["start"] - self._origin) * 1_000_000, 3),
+                "dur": round((end - step["start"]) * 1_000_000, 3),
+                "pid": pid,
+                "tid": 0,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path) -> None:
+        """Write the Chrome trace-event JSON to a file."""
+        import json
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, indent=2)
+            f.write("\n")
+
 
 def get_key():
     """Get a single keypress in a cross-platform way using readchar."""
+    import readchar
+
     key = readchar.readkey()
 
     if key == readchar.key.UP or key == readchar.key.CTRL_P:
@@ -171,6 +366,8 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
 
     def run_selection_loop():
         nonlocal selected_key, selected_index
+        from rich.live import Live
+
         with Live(create_selection_panel(), console=console, transient=True, auto_refresh=False) as live:
             while True:
                 try:
@@ -243,6 +440,8 @@ def multi_select_with_arrows(options: dict, prompt_text: str = "Select options",
 
     def run_selection_loop():
         nonlocal selected_index
+        from rich.live import Live
+
         with Live(create_selection_panel(), console=console, transient=True, auto_refresh=False) as live:
             while True:
                 try:
@@ -313,9 +512,23 @@ app = typer.Typer(
 
 
 @app.callback()
-def callback(ctx: typer.Context):
+def callback(
+    ctx: typer.Context,
+    profile: bool = typer.Option(False, "--profile", help="Run the command under cProfile and print a hotspot summary"),
+    profile_dir: Path = typer.Option(Path("phoenix-profile"), "--profile-dir", help="Directory for --profile reports (.pstats, text and allocation reports)"),
+    profile_memory: bool = typer.Option(False, "--profile-memory", help="With --profile, also trace allocations with tracemalloc"),
+):
     """Show banner when no subcommand is provided."""
     if ctx.invoked_subcommand is None and "--help" not in sys.argv and "-h" not in sys.argv:
         show_banner()
         console.print(Align.center("[dim]Run 'phoenix --help' for usage information[/dim]"))
         console.print()
+        return
+
+    if profile and ctx.invoked_subcommand:
+        from .profiling import ProfileSession
+
+        session = ProfileSession(profile_dir, ctx.invoked_subcommand, memory=profile_memory)
+        session.start()
+        # Runs after the subcommand returns or raises (including typer.Exit)
+        ctx.call_on_close(session.stop)
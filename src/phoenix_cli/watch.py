@@ -0,0 +1,356 @@
+"""Live sync of a local template into a project (phoenix dev --watch).
+
+While a skill is being written, the template's skills/ and commands/ are
+watched and every change is pushed to the selected agents' folders:
+
+- a changed file under skills/ is copied to the same place in each agent's
+  skills_folder; a deleted one is removed there, and a rename is a delete
+  of the old path plus a copy of the new one
+- a change under commands/ re-renders the commands (render.py rewrites
+  only the files whose template changed)
+
+Changes are collected until the tree has been quiet for the debounce
+interval, so the burst of writes, renames and temp files of one editor
+save is applied once. Linux uses inotify through ctypes; elsewhere (or
+when inotify is unavailable) the tree is polled by size and mtime.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import shutil
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from .config import AGENT_CONFIG
+
+WATCHED_DIRS = ("skills", "commands")
+DEFAULT_DEBOUNCE = 0.05
+POLL_INTERVAL = 0.25
+
+# Editor swap, backup and lock files are never pushed
+_TEMP_SUFFIXES = ("~", ".swp", ".swx", ".swo", ".tmp")
+_TEMP_PREFIXES = (".#",)
+_TEMP_NAMES = {"4913", ".DS_Store"}
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_ONLYDIR)
+_EVENT = struct.Struct("iIII")
+
+
+def _is_temp(name: str) -> bool:
+    return name in _TEMP_NAMES or name.endswith(_TEMP_SUFFIXES) or name.startswith(_TEMP_PREFIXES)
+
+
+def skills_targets(project_path: Path, agents: list[str]) -> list[Path]:
+    """Distinct skills folders of the agents (agents may share one)."""
+    return list(dict.fromkeys(Path(project_path) / AGENT_CONFIG[agent]["skills_folder"] for agent in agents))
+
+
+class _InotifySource:
+    """Recursive inotify watch on the template's skills/ and commands/."""
+
+    def __init__(self, template_root: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._add.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._rm = libc.inotify_rm_watch
+        self._rm.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.root = Path(template_root)
+        self.dirs = {}  # watch descriptor -> template-relative directory
+        try:
+            for name in WATCHED_DIRS:
+                if (self.root / name).is_dir():
+                    self._watch_tree(name)
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def _watch_tree(self, relative: str) -> None:
+        for current, subdirs, _ in os.walk(self.root / relative):
+            wd = self._add(self.fd, os.fsencode(current), _WATCH_MASK)
+            if wd < 0:
+                if ctypes.get_errno() == 28:  # ENOSPC: fs.inotify.max_user_watches reached
+                    raise OSError(28, "inotify watch limit reached")
+                continue
+            self.dirs[wd] = Path(current).relative_to(self.root).as_posix()
+            subdirs[:] = [d for d in subdirs if not d.startswith(".")]
+
+    def _unwatch_tree(self, relative: str) -> None:
+        prefix = relative + "/"
+        for wd, path in list(self.dirs.items()):
+            if path == relative or path.startswith(prefix):
+                self._rm(self.fd, wd)
+                del self.dirs[wd]
+
+    def changes(self, timeout: float) -> set[str]:
+        """Template-relative paths touched within timeout seconds (empty if none)."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 256 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                # Events were lost: rescan everything
+                changed.update(WATCHED_DIRS)
+                continue
+            directory = self.dirs.get(wd)
+            if mask & _IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            if directory is None or not name:
+                continue
+            path = f"{directory}/{name}"
+            if mask & _IN_ISDIR:
+                if mask & _IN_MOVED_FROM:
+                    self._unwatch_tree(path)
+                elif mask & (_IN_CREATE | _IN_MOVED_TO):
+                    # Files may land before the watch exists; the whole folder is synced
+                    try:
+                        self._watch_tree(path)
+                    except OSError:
+                        pass  # out of watches: still synced now, later edits inside are missed
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _PollingSource:
+    """Fallback watch: compares size and mtime of every file each interval."""
+
+    def __init__(self, template_root: Path, interval: float = POLL_INTERVAL):
+        self.root = Path(template_root)
+        self.interval = interval
+        self.state = self._scan()
+
+    def _scan(self) -> dict[str, tuple]:
+        state = {}
+        for name in WATCHED_DIRS:
+            for current, subdirs, files in os.walk(self.root / name):
+                subdirs[:] = [d for d in subdirs if not d.startswith(".")]
+                relative = Path(current).relative_to(self.root).as_posix()
+                state[relative] = None
+                for filename in files:
+                    try:
+                        st = os.stat(os.path.join(current, filename))
+                    except OSError:
+                        continue
+                    state[f"{relative}/{filename}"] = (st.st_size, st.st_mtime_ns)
+        return state
+
+    def changes(self, timeout: float) -> set[str]:
+        time.sleep(min(timeout, self.interval))
+        state = self._scan()
+        changed = {path for path, entry in state.items() if self.state.get(path, ...) != entry}
+        changed.update(path for path in self.state if path not in state)
+        self.state = state
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def open_source(template_root: Path, *, poll: bool = False):
+    """An inotify watch of the template, or a polling one when poll is set or inotify is unavailable."""
+    if not poll:
+        try:
+            return _InotifySource(template_root)
+        except (OSError, AttributeError):
+            pass
+    return _PollingSource(template_root)
+
+
+def _copy_file(src: str, dst: str, stats: dict) -> None:
+    try:
+        st = os.stat(dst)
+        source = os.stat(src)
+        if st.st_size == source.st_size and st.st_mtime_ns == source.st_mtime_ns:
+            return
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    # Replaced atomically so an agent never reads a half-written skill
+    tmp_file = f"{dst}.phoenix-tmp"
+    try:
+        shutil.copy2(src, tmp_file)
+        os.replace(tmp_file, dst)
+    except OSError:
+        if os.path.lexists(tmp_file):
+            os.unlink(tmp_file)
+        raise
+    stats["copied"] += 1
+    stats["bytes"] += os.path.getsize(dst)
+
+
+def _remove(path: str, stats: dict) -> None:
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+        stats["removed"] += 1
+    elif os.path.lexists(path):
+        os.unlink(path)
+        stats["removed"] += 1
+
+
+def _mirror_dir(src: str, dst: str, stats: dict) -> None:
+    """Make dst match src: copy new and changed files, remove files src no longer has."""
+    for current, subdirs, files in os.walk(src):
+        relative = os.path.relpath(current, src)
+        target = os.path.normpath(os.path.join(dst, relative))
+        os.makedirs(target, exist_ok=True)
+        for filename in files:
+            if not _is_temp(filename):
+                _copy_file(os.path.join(current, filename), os.path.join(target, filename), stats)
+    for current, subdirs, files in os.walk(dst, topdown=False):
+        relative = os.path.relpath(current, dst)
+        source = os.path.normpath(os.path.join(src, relative))
+        for name in files + subdirs:
+            if not os.path.lexists(os.path.join(source, name)):
+                _remove(os.path.join(current, name), stats)
+
+
+def _coalesce(paths: set[str]) -> list[str]:
+    """Drop temp files and paths already covered by a changed parent directory."""
+    result = []
+    for path in sorted(paths):
+        if any(_is_temp(part) for part in path.split("/")):
+            continue
+        if result and (path == result[-1] or path.startswith(result[-1] + "/")):
+            continue
+        result.append(path)
+    return result
+
+
+def apply_changes(template_root: Path, project_path: Path, agents: list[str], paths: set[str]) -> dict:
+    """Push changed template paths to every agent folder.
+
+    Args:
+        template_root: Local template directory (holding skills/ and commands/)
+        project_path: Project whose agent folders are updated
+        agents: AI agent keys to update
+        paths: Template-relative paths that changed (files or folders, existing or deleted)
+
+    Returns:
+        Dict with paths (the coalesced list), copied, removed, bytes,
+        commands (render.render_commands() stats, or None if no command
+        template changed) and error (None here; set by watch() when the
+        batch failed)
+    """
+    from .render import render_commands
+
+    template_root = Path(template_root)
+    targets = skills_targets(project_path, agents)
+    stats = {"paths": _coalesce(paths), "copied": 0, "removed": 0, "bytes": 0, "commands": None, "error": None}
+    render = False
+    for path in stats["paths"]:
+        top, _, rest = path.partition("/")
+        if top == "commands":
+            render = True
+            continue
+        src = str(template_root / path)
+        if not rest:
+            # The whole skills/ tree (start-up or lost events): mirror each skill, keep other installed skills
+            for entry in os.scandir(src) if os.path.isdir(src) else []:
+                if entry.is_dir() and not entry.name.startswith("."):
+                    for target in targets:
+                        _mirror_dir(entry.path, str(target / entry.name), stats)
+            continue
+        if "/" not in rest and os.path.isfile(src):
+            continue  # like copy_local_template, only skill folders are installed
+        for target in targets:
+            dst = str(target / rest)
+            if os.path.isdir(src):
+                _mirror_dir(src, dst, stats)
+            elif os.path.isfile(src):
+                _copy_file(src, dst, stats)
+            else:
+                _remove(dst, stats)
+    if render:
+        stats["commands"] = render_commands(template_root, Path(project_path), agents)
+    return stats
+
+
+def watch(
+    template_root: Path,
+    project_path: Path,
+    agents: list[str],
+    *,
+    debounce: float = DEFAULT_DEBOUNCE,
+    poll: bool = False,
+    on_sync: Optional[Callable[[dict], None]] = None,
+    stop: Optional[threading.Event] = None
+) -> None:
+    """Push template changes to the project until stop is set (or KeyboardInterrupt).
+
+    Args:
+        template_root: Local template directory to watch
+        project_path: Project whose agent folders are kept in sync
+        agents: AI agent keys to update
+        debounce: Seconds the tree must be quiet before a batch is applied
+        poll: Poll instead of using inotify
+        on_sync: Called with each apply_changes() result and its "seconds"
+            and "mode" ("inotify" or "poll"); a batch that failed has its
+            "error" set and the watch goes on
+        stop: Event that ends the watch
+    """
+    stop = stop or threading.Event()
+    source = open_source(template_root, poll=poll)
+    mode = "inotify" if isinstance(source, _InotifySource) else "poll"
+    pending = set()
+    deadline = 0.0
+    try:
+        while not stop.is_set():
+            wait = max(0.0, deadline - time.monotonic()) if pending else 0.5
+            changed = source.changes(wait)
+            if changed:
+                pending |= changed
+                deadline = time.monotonic() + debounce
+                continue
+            if pending and time.monotonic() >= deadline:
+                started = time.perf_counter()
+                try:
+                    result = apply_changes(template_root, project_path, agents, pending)
+                except (OSError, ValueError) as e:
+                    # A file removed mid-copy, a dangling symlink, a permission error or an
+                    # undecodable command template: report it and keep watching
+                    result = {"paths": _coalesce(pending), "copied": 0, "removed": 0, "bytes": 0,
+                              "commands": None, "error": str(e)}
+                pending = set()
+                result["seconds"] = time.perf_counter() - started
+                result["mode"] = mode
+                if on_sync:
+                    on_sync(result)
+    finally:
+        source.close()